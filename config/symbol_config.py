@@ -4,7 +4,7 @@ Defines trading parameters for supported cryptocurrencies.
 """
 
 import os
-from typing import Dict, Any
+from typing import Dict, Any, Tuple
 
 
 class SymbolConfig:
@@ -14,6 +14,10 @@ class SymbolConfig:
     # Key: symbol (e.g., 'ETH'), Value: precision data from API
     _dynamic_precision: Dict[str, Dict[str, Any]] = {}
 
+    # Maker price offsets per symbol: (tick_size * MAKER_NUM_TICKS, price_precision)
+    # Built on first use by _get_maker_offset
+    _maker_offsets: Dict[str, Tuple[float, int]] = {}
+
     # Symbol specifications from PRD
     # NOTE: Static precision values kept for fallback, but dynamic precision
     # from API takes priority (loaded via PrecisionManager at startup)
@@ -46,6 +50,8 @@ class SymbolConfig:
     PRICE_FRESHNESS_SECONDS = int(os.getenv('PRICE_FRESHNESS_SECONDS', '3600'))  # From .env
                                     # Note: 10s recommended for production, 3600s for testing
     SPREAD_SANITY_PERCENT = 5.0     # Sanity check for spread
+    MAKER_NUM_TICKS = 1             # Ticks inside the spread for maker orders
+    PRICE_CACHE_TTL_MS = int(os.getenv('PRICE_CACHE_TTL_MS', '300'))  # Reuse validated prices this long
 
     # Order modification parameters
     ORDER_POLL_INTERVAL = 1         # Poll order status every 1 second
@@ -54,6 +60,13 @@ class SymbolConfig:
     MODIFICATION_ATTEMPTS = 2       # Number of modification attempts
     ORDER_RETRY_ATTEMPTS = 5        # Number of order placement retries
 
+    # Order lookup cache (status/details polled from DB)
+    ORDER_CACHE_TTL = 0.5           # Seconds to reuse a non-terminal status/details lookup
+    ORDER_CACHE_TERMINAL_TTL = 30.0 # FILLED/REJECTED never change, keep longer
+
+    # Partial-fill completion row writes
+    DB_WRITE_RETRIES = 3            # Attempts per write (exponential backoff)
+
     @classmethod
     def get_symbol_config(cls, symbol: str) -> Dict[str, Any]:
         """
@@ -169,6 +182,24 @@ class SymbolConfig:
         config = cls.get_symbol_config(symbol)
         return round(price, config['price_precision'])
 
+    @classmethod
+    def _get_maker_offset(cls, symbol: str) -> Tuple[float, int]:
+        """
+        Get the cached (price offset, price precision) pair for maker orders.
+
+        Args:
+            symbol: Cryptocurrency symbol
+
+        Returns:
+            Tuple of (tick_size * MAKER_NUM_TICKS, price_precision)
+        """
+        offset = cls._maker_offsets.get(symbol)
+        if offset is None:
+            config = cls.get_symbol_config(symbol)
+            offset = (config['tick_size'] * cls.MAKER_NUM_TICKS, config['price_precision'])
+            cls._maker_offsets[symbol] = offset
+        return offset
+
     @classmethod
     def calculate_maker_price(cls, symbol: str, current_price: float, side: str) -> float:
         """
@@ -185,24 +216,42 @@ class SymbolConfig:
         Returns:
             Maker order price
         """
-        config = cls.get_symbol_config(symbol)
-        tick_size = config['tick_size']
-
-        # Use 1 tick for maker orders
+        # Use 1 tick (MAKER_NUM_TICKS) for maker orders
         # This places the order just inside the spread without crossing it
         # ETH: 1 * $0.01 = $0.01 buffer
         # BTC: 1 * $0.10 = $0.10 buffer
         # If Post-Only rejected, will fetch new price and retry
-        num_ticks = 1
+        offset, price_precision = cls._get_maker_offset(symbol)
 
         if side.lower() == 'buy':
             # Buy below current price (1 tick)
-            maker_price = current_price - (tick_size * num_ticks)
-        else:
-            # Sell above current price (1 tick)
-            maker_price = current_price + (tick_size * num_ticks)
+            return round(current_price - offset, price_precision)
+        # Sell above current price (1 tick)
+        return round(current_price + offset, price_precision)
+
+    @classmethod
+    def calculate_maker_prices(
+        cls,
+        symbol: str,
+        buy_price: float,
+        sell_price: float
+    ) -> Tuple[float, float]:
+        """
+        Calculate buy and sell maker prices in one call.
 
-        return cls.round_price(symbol, maker_price)
+        Args:
+            symbol: Cryptocurrency symbol
+            buy_price: Current price on the buy leg
+            sell_price: Current price on the sell leg
+
+        Returns:
+            Tuple of (buy_maker_price, sell_maker_price)
+        """
+        offset, price_precision = cls._get_maker_offset(symbol)
+        return (
+            round(buy_price - offset, price_precision),
+            round(sell_price + offset, price_precision)
+        )
 
     @classmethod
     def apply_bybit_fee_compensation(cls, symbol: str, quantity: float) -> float:
@@ -8,9 +8,12 @@ Strategy:
 """
 
 import time
+import asyncio
 import logging
+import threading
 import requests
-from typing import Dict, Optional, Tuple
+from psycopg2.extras import RealDictCursor
+from typing import Any, Callable, Dict, List, Optional, Tuple
 from datetime import datetime
 import uuid
 
@@ -20,7 +23,7 @@ from exchange_clients.coindcx.coindcx_futures import CoinDCXFutures
 
 from config.symbol_config import SymbolConfig
 from utils.exceptions import (
-    OrderException, SpreadException, NakedPositionException
+    OrderException, SpreadException, NakedPositionException, DatabaseException
 )
 from utils.db import Database
 from core.price_service import PriceService
@@ -28,10 +31,84 @@ from core.price_service import PriceService
 
 logger = logging.getLogger(__name__)
 
+# Partial-fill banners (formatted lazily by logging)
+_PARTIAL_FILL_START_BANNER = (
+    "========== HANDLING PARTIAL FILL ==========\n"
+    "Order ID: %s\n"
+    "Exchange: %s\n"
+    "Symbol: %s\n"
+    "Side: %s\n"
+    "Original Qty: %s\n"
+    "Chunk: %s/%s"
+)
+_PARTIAL_FILL_DONE_BANNER = (
+    "========== PARTIAL FILL HANDLED ==========\n"
+    "Partial Order: %s (%s %s)\n"
+    "Completion Order: %s (%s %s)\n"
+    "Total: %s %s"
+)
+
+
+# partial_details for upsert_order, per exchange: the partial order's fee goes
+# to the exchange-specific column (Bybit crypto fee is needed for reconciliation)
+_PARTIAL_BUILDERS = {
+    'bybit': lambda order_id, filled_qty, avg_price, fee: {
+        'partial_order_id': order_id,
+        'partial_filled_qty': filled_qty,
+        'partial_avg_price': avg_price,
+        'partial_bybit_fee_crypto': fee,
+        'partial_coindcx_fee_usdt': None
+    },
+    'coindcx': lambda order_id, filled_qty, avg_price, fee: {
+        'partial_order_id': order_id,
+        'partial_filled_qty': filled_qty,
+        'partial_avg_price': avg_price,
+        'partial_bybit_fee_crypto': None,
+        'partial_coindcx_fee_usdt': fee
+    },
+}
 
 class OrderManager:
     """Manages order placement, modification, and monitoring"""
 
+    # Hot-path statements, PREPAREd once per pooled connection (Database.execute_prepared)
+    _PREPARED_SQL = {
+        'om_order_status': """
+            WITH o AS (
+                SELECT status FROM orders
+                WHERE order_id = $1
+                LIMIT 1
+            ),
+            e AS (
+                SELECT event_type
+                FROM order_lifecycle_log
+                WHERE order_id = $1
+                ORDER BY timestamp DESC
+                LIMIT 1
+            )
+            SELECT (SELECT status FROM o) AS orders_status,
+                   (SELECT event_type FROM e) AS event_log_status
+        """,
+        'om_order_details': """
+            SELECT exchange, symbol, side, quantity, price, status,
+                   chunk_group_id, chunk_sequence, chunk_total
+            FROM orders
+            WHERE order_id = $1
+        """,
+        'om_mark_modified': """
+            UPDATE orders
+            SET modified_price = $1,
+                modified_at = CURRENT_TIMESTAMP,
+                is_modified = TRUE
+            WHERE order_id = $2
+        """,
+        'om_mark_cancelled': """
+            UPDATE orders
+            SET status = 'CANCELLED'
+            WHERE order_id = $1
+        """,
+    }
+
     def __init__(
         self,
         bybit_api_key: str,
@@ -71,8 +148,140 @@ class OrderManager:
             secret_key=coindcx_api_secret
         )
 
+        # Background event loop used to overlap blocking exchange RPCs
+        self._io_loop = None
+        self._io_lock = threading.Lock()
+
+        # Short-TTL cache for per-order DB lookups: (kind, order_id) -> (expires_at, value)
+        self._order_cache: Dict[Tuple[str, str], Tuple[float, Any]] = {}
+        self._order_cache_lock = threading.Lock()
+
+        if self.db:
+            self._recover_cancel_claims()
+
         logger.info("Order manager initialized")
 
+    def _db_write_with_retry(self, method_name: str, **kwargs) -> Any:
+        """
+        Call a Database write method, retrying with exponential backoff.
+
+        Args:
+            method_name: Database method to call (e.g. 'complete_partial_with_event')
+            **kwargs: Keyword arguments for the call
+
+        Returns:
+            The method's return value
+
+        Raises:
+            Exception: The last error once DB_WRITE_RETRIES attempts have failed
+        """
+        method = getattr(self.db, method_name)
+        for attempt in range(1, self.config.DB_WRITE_RETRIES + 1):
+            try:
+                return method(**kwargs)
+            except Exception as e:
+                if attempt >= self.config.DB_WRITE_RETRIES:
+                    raise
+                backoff = 0.5 * 2 ** (attempt - 1)
+                logger.warning(
+                    "DB write %s failed (attempt %d/%d), retrying in %.1fs: %s",
+                    method_name, attempt, self.config.DB_WRITE_RETRIES, backoff, e
+                )
+                time.sleep(backoff)
+
+    def _get_io_loop(self) -> asyncio.AbstractEventLoop:
+        """
+        Get the background event loop, starting it on first use.
+
+        The loop runs on a dedicated daemon thread so the synchronous
+        trading flow can submit coroutines with run_coroutine_threadsafe.
+
+        Returns:
+            Running asyncio event loop
+        """
+        with self._io_lock:
+            if self._io_loop is None:
+                loop = asyncio.new_event_loop()
+                threading.Thread(
+                    target=loop.run_forever,
+                    daemon=True,
+                    name="OrderManagerIO"
+                ).start()
+                self._io_loop = loop
+        return self._io_loop
+
+    @staticmethod
+    async def _gather_blocking(calls: Tuple[Callable, ...]) -> List:
+        """Run blocking callables concurrently in the loop's executor."""
+        loop = asyncio.get_running_loop()
+        return await asyncio.gather(
+            *(loop.run_in_executor(None, call) for call in calls),
+            return_exceptions=True
+        )
+
+    @staticmethod
+    async def _sleep_until_slot(start: float, attempt: int, retry_delay: float) -> None:
+        """Sleep until retry slot `attempt` on the grid start + attempt * retry_delay."""
+        await asyncio.sleep(max(0.0, start + attempt * retry_delay - time.monotonic()))
+
+    def _run_concurrently(self, *calls: Callable) -> List:
+        """
+        Run blocking exchange calls concurrently and wait for all of them.
+
+        pybit and the CoinDCX client are synchronous, so each call runs on the
+        background loop's executor and the results are awaited together.
+
+        Args:
+            *calls: Zero-argument callables (e.g. lambdas wrapping RPCs)
+
+        Returns:
+            List of results in call order. Exceptions are returned, not raised,
+            so one failing exchange never hides the other's outcome.
+        """
+        future = asyncio.run_coroutine_threadsafe(
+            self._gather_blocking(calls), self._get_io_loop()
+        )
+        return future.result()
+
+    def _execute_prepared(self, cursor, name: str, params: tuple) -> None:
+        """Execute one of the _PREPARED_SQL statements on a pooled cursor."""
+        self.db.execute_prepared(cursor, name, self._PREPARED_SQL[name], params)
+
+    def _get_cached_order(self, kind: str, order_id: str) -> Any:
+        """Return a cached status/details lookup, or None if missing or expired."""
+        with self._order_cache_lock:
+            entry = self._order_cache.get((kind, order_id))
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                del self._order_cache[(kind, order_id)]
+                return None
+            return value
+
+    def _cache_order(self, kind: str, order_id: str, value: Any, status: Optional[str]) -> None:
+        """
+        Cache a lookup; FILLED/REJECTED are final so they live longer.
+
+        CANCELLED keeps the short TTL - the monitor can still correct it to
+        FILLED when a fill races the cancel.
+        """
+        if value is None:
+            return
+        if status in ('FILLED', 'REJECTED'):
+            ttl = self.config.ORDER_CACHE_TERMINAL_TTL
+        else:
+            ttl = self.config.ORDER_CACHE_TTL
+        with self._order_cache_lock:
+            self._order_cache[(kind, order_id)] = (time.monotonic() + ttl, value)
+
+    def _invalidate_order_cache(self, *order_ids: str) -> None:
+        """Drop cached lookups for orders we just wrote to."""
+        with self._order_cache_lock:
+            for order_id in order_ids:
+                self._order_cache.pop(('status', order_id), None)
+                self._order_cache.pop(('details', order_id), None)
+
     def execute_chunk_with_active_management(
         self,
         symbol: str,
@@ -252,31 +461,33 @@ class OrderManager:
         # Log to database (only after both succeed)
         # Use UPSERT to ensure exactly one row per exchange per chunk
         if self.db:
-            bybit_row_id = self.db.upsert_order(
-                chunk_group_id=chunk_group_id,
-                chunk_sequence=chunk_sequence,
-                chunk_total=chunk_total,
-                exchange='bybit',
-                symbol=symbol,
-                side='buy',
-                quantity=bybit_quantity,
-                price=bybit_maker_price,
-                order_id=bybit_order_id,
-                status='PLACED'
-            )
-
-            coindcx_row_id = self.db.upsert_order(
-                chunk_group_id=chunk_group_id,
-                chunk_sequence=chunk_sequence,
-                chunk_total=chunk_total,
-                exchange='coindcx',
-                symbol=symbol,
-                side='sell',
-                quantity=coindcx_quantity,
-                price=coindcx_maker_price,
-                order_id=coindcx_order_id,
-                status='PLACED'
-            )
+            # Both legs in one round-trip; a DatabaseException propagates
+            bybit_row_id, coindcx_row_id = self.db.upsert_orders_bulk([
+                {
+                    'chunk_group_id': chunk_group_id,
+                    'chunk_sequence': chunk_sequence,
+                    'chunk_total': chunk_total,
+                    'exchange': 'bybit',
+                    'symbol': symbol,
+                    'side': 'buy',
+                    'quantity': bybit_quantity,
+                    'price': bybit_maker_price,
+                    'order_id': bybit_order_id,
+                    'status': 'PLACED'
+                },
+                {
+                    'chunk_group_id': chunk_group_id,
+                    'chunk_sequence': chunk_sequence,
+                    'chunk_total': chunk_total,
+                    'exchange': 'coindcx',
+                    'symbol': symbol,
+                    'side': 'sell',
+                    'quantity': coindcx_quantity,
+                    'price': coindcx_maker_price,
+                    'order_id': coindcx_order_id,
+                    'status': 'PLACED'
+                }
+            ])
 
             # Verify both orders were inserted
             if not bybit_row_id:
@@ -317,15 +528,6 @@ class OrderManager:
 
             self.db.log_spread(symbol, bybit_price, coindcx_price, spread)
 
-            # CRITICAL: Ensure database transaction commits before we start querying
-            # This prevents race condition where _active_management_loop() queries
-            # before INSERT completes
-            try:
-                self.db.conn.commit()
-                logger.debug("Database insertions committed successfully")
-            except Exception as e:
-                logger.warning(f"Database commit warning: {e}")
-
         return (bybit_order_id, coindcx_order_id)
 
     def _place_bybit_order(
@@ -422,7 +624,7 @@ class OrderManager:
 
                     # Step 3: FALLBACK - API query if WebSocket didn't respond
                     if not websocket_detected:
-                        logger.debug(f"WebSocket timeout after 2s, using API fallback...")
+                        logger.debug("WebSocket timeout after 2s, using API fallback...")
 
                         # Wait a bit longer for processing
                         time.sleep(0.5)
@@ -652,10 +854,11 @@ class OrderManager:
                 elapsed = time.time() - start_time
 
                 # Query database for order status
-                bybit_status = self._check_order_status_from_db(bybit_order_id)
-                coindcx_status = self._check_order_status_from_db(coindcx_order_id)
+                bybit_status, coindcx_status = self._check_order_statuses(
+                    bybit_order_id, coindcx_order_id
+                )
 
-                logger.debug(f"Cycle {cycle} ({elapsed:.1f}s): Bybit={bybit_status}, CoinDCX={coindcx_status}")
+                logger.debug("Cycle %d (%.1fs): Bybit=%s, CoinDCX=%s", cycle, elapsed, bybit_status, coindcx_status)
 
                 # CRITICAL: Check if BOTH filled (perfect hedge, no Phase 2 needed)
                 if bybit_status == 'FILLED' and coindcx_status == 'FILLED':
@@ -689,10 +892,11 @@ class OrderManager:
             try:
                 # CRITICAL: Check order status before modifying
                 # This prevents infinite loops trying to modify cancelled/filled orders
-                bybit_status = self._check_order_status_from_db(bybit_order_id)
-                coindcx_status = self._check_order_status_from_db(coindcx_order_id)
+                bybit_status, coindcx_status = self._check_order_statuses(
+                    bybit_order_id, coindcx_order_id
+                )
 
-                logger.debug(f"Pre-modification status: Bybit={bybit_status}, CoinDCX={coindcx_status}")
+                logger.debug("Pre-modification status: Bybit=%s, CoinDCX=%s", bybit_status, coindcx_status)
 
                 # CRITICAL: Check if BOTH filled (perfect hedge, no Phase 2 needed)
                 if bybit_status == 'FILLED' and coindcx_status == 'FILLED':
@@ -742,49 +946,61 @@ class OrderManager:
 
                     raise SpreadException(spread, self.config.MAX_SPREAD_PERCENT)
 
-                # Calculate new prices (1 tick below/above)
+                # Calculate new prices (MAKER_NUM_TICKS below/above, same as placement)
                 bybit_price = price_data['bybit']['price']
                 coindcx_price = price_data['coindcx']['price']
 
-                new_bybit_price = self.config.calculate_maker_price(symbol, bybit_price, 'buy')
-                new_coindcx_price = self.config.calculate_maker_price(symbol, coindcx_price, 'sell')
+                new_bybit_price, new_coindcx_price = self.config.calculate_maker_prices(
+                    symbol, bybit_price, coindcx_price
+                )
 
                 logger.info(f"  New prices: Bybit ${new_bybit_price:.2f}, CoinDCX ${new_coindcx_price:.2f} (spread: {spread:.4f}%)")
 
-                # If Bybit was rejected, place new order instead of modifying
-                if bybit_status == 'REJECTED':
-                    logger.warning(f"⚠️ Bybit order was rejected, placing new limit order")
-                    # Note: We don't have quantity here, will need to get from database
-                    order_details = self._get_order_details_from_db(bybit_order_id)
-                    if order_details:
-                        new_bybit_order = self._place_bybit_order(bybit_symbol, 'Buy', order_details['quantity'], new_bybit_price)
-                        bybit_order_id = new_bybit_order['order_id']
-                        logger.info(f"  ✓ New Bybit order placed: {bybit_order_id}")
-                elif bybit_status == 'OPEN':
-                    # Modify existing order
-                    self._modify_bybit_order(bybit_symbol, bybit_order_id, new_bybit_price)
-
-                # CoinDCX handling depends on status
-                if coindcx_status == 'REJECTED':
-                    logger.warning(f"⚠️ CoinDCX order was rejected, placing new limit order")
-                    order_details = self._get_order_details_from_db(coindcx_order_id)
-                    if order_details:
-                        new_coindcx_order = self._place_coindcx_order(coindcx_symbol, 'sell', order_details['quantity'], new_coindcx_price)
-                        coindcx_order_id = new_coindcx_order['id']
-                        logger.info(f"  ✓ New CoinDCX order placed: {coindcx_order_id}")
-                elif coindcx_status == 'OPEN':
-                    # CoinDCX may return new order ID if cancel+replace was used
-                    # Returns None if order already filled/cancelled (skip modification)
-                    updated_coindcx_id = self._modify_coindcx_order(coindcx_symbol, coindcx_order_id, new_coindcx_price)
-
-                    # Update tracking if order ID changed (cancel+replace fallback)
-                    if updated_coindcx_id is not None and updated_coindcx_id != coindcx_order_id:
-                        logger.info(f"  ℹ️ CoinDCX order replaced: {coindcx_order_id[:8]}... → {updated_coindcx_id[:8]}...")
-                        coindcx_order_id = updated_coindcx_id
-                    elif updated_coindcx_id is None:
-                        # Order already filled/cancelled - exit loop
-                        logger.info(f"  ℹ️ CoinDCX order {coindcx_order_id[:8]}... already filled/cancelled")
-                        return ('CoinDCX', bybit_order_id, coindcx_order_id)
+                def update_bybit() -> str:
+                    # If Bybit was rejected, place new order instead of modifying
+                    if bybit_status == 'REJECTED':
+                        logger.warning(f"⚠️ Bybit order was rejected, placing new limit order")
+                        # Note: We don't have quantity here, will need to get from database
+                        order_details = self._get_order_details_from_db(bybit_order_id)
+                        if order_details:
+                            new_bybit_order = self._place_bybit_order(bybit_symbol, 'Buy', order_details['quantity'], new_bybit_price)
+                            logger.info(f"  ✓ New Bybit order placed: {new_bybit_order['order_id']}")
+                            return new_bybit_order['order_id']
+                    elif bybit_status == 'OPEN':
+                        # Modify existing order
+                        self._modify_bybit_order(bybit_symbol, bybit_order_id, new_bybit_price)
+                    return bybit_order_id
+
+                def update_coindcx() -> Optional[str]:
+                    # CoinDCX handling depends on status
+                    if coindcx_status == 'REJECTED':
+                        logger.warning(f"⚠️ CoinDCX order was rejected, placing new limit order")
+                        order_details = self._get_order_details_from_db(coindcx_order_id)
+                        if order_details:
+                            new_coindcx_order = self._place_coindcx_order(coindcx_symbol, 'sell', order_details['quantity'], new_coindcx_price)
+                            logger.info(f"  ✓ New CoinDCX order placed: {new_coindcx_order['id']}")
+                            return new_coindcx_order['id']
+                    elif coindcx_status == 'OPEN':
+                        # CoinDCX may return new order ID if cancel+replace was used
+                        # Returns None if order already filled/cancelled (skip modification)
+                        return self._modify_coindcx_order(coindcx_symbol, coindcx_order_id, new_coindcx_price)
+                    return coindcx_order_id
+
+                # Both exchange RPCs are independent - run them side by side
+                bybit_result, coindcx_result = self._run_concurrently(update_bybit, update_coindcx)
+
+                # Apply whatever succeeded before surfacing an error - CoinDCX
+                # may have been replaced even though the Bybit leg failed
+                (bybit_order_id, coindcx_order_id,
+                 coindcx_closed, error) = self._apply_modification_results(
+                    bybit_order_id, coindcx_order_id, bybit_result, coindcx_result
+                )
+                if coindcx_closed:
+                    if error is not None:
+                        logger.warning(f"⚠️ Error during modification: {error}")
+                    return ('CoinDCX', bybit_order_id, coindcx_order_id)
+                if error is not None:
+                    raise error
 
                 logger.info(f"  ✓ Orders modified successfully")
 
@@ -794,6 +1010,49 @@ class OrderManager:
                 logger.warning(f"⚠️ Error during modification: {e}")
                 # Continue loop despite modification errors
 
+    @staticmethod
+    def _apply_modification_results(
+        bybit_order_id: str,
+        coindcx_order_id: str,
+        bybit_result: Any,
+        coindcx_result: Any
+    ) -> Tuple[str, str, bool, Optional[Exception]]:
+        """
+        Fold the concurrent Bybit/CoinDCX modification results into the tracked order IDs.
+
+        Every successful result is applied before an error is reported, so a
+        CoinDCX order replaced while the Bybit leg failed is still tracked.
+
+        Args:
+            bybit_order_id: Current Bybit order ID
+            coindcx_order_id: Current CoinDCX order ID
+            bybit_result: Bybit order ID after the update, or the exception raised
+            coindcx_result: CoinDCX order ID after the update, None if the order
+                was already filled/cancelled, or the exception raised
+
+        Returns:
+            Tuple of (bybit_order_id, coindcx_order_id, coindcx_closed, error)
+            - coindcx_closed: CoinDCX order was already filled/cancelled
+            - error: Bybit exception, else CoinDCX exception, else None
+        """
+        coindcx_closed = False
+        if not isinstance(bybit_result, Exception):
+            bybit_order_id = bybit_result
+
+        if not isinstance(coindcx_result, Exception):
+            # Update tracking if order ID changed (cancel+replace fallback)
+            if coindcx_result is None:
+                logger.info(f"  ℹ️ CoinDCX order {coindcx_order_id[:8]}... already filled/cancelled")
+                coindcx_closed = True
+            elif coindcx_result != coindcx_order_id:
+                logger.info(f"  ℹ️ CoinDCX order replaced: {coindcx_order_id[:8]}... → {coindcx_result[:8]}...")
+                coindcx_order_id = coindcx_result
+
+        for result in (bybit_result, coindcx_result):
+            if isinstance(result, Exception):
+                return bybit_order_id, coindcx_order_id, coindcx_closed, result
+        return bybit_order_id, coindcx_order_id, coindcx_closed, None
+
     def _resolve_naked_position(
         self,
         symbol: str,
@@ -829,7 +1088,7 @@ class OrderManager:
         )
         side = 'buy' if unfilled_exchange == 'Bybit' else 'sell'
 
-        start_time = time.time()
+        start_time = time.monotonic()
 
         # Track current order ID (may change if CoinDCX uses cancel+replace)
         current_order_id = unfilled_order_id
@@ -942,7 +1201,7 @@ class OrderManager:
             return
 
         # Market order fallback
-        elapsed = time.time() - start_time
+        elapsed = time.monotonic() - start_time
         logger.warning(f"⚠️ Limit order not filled after {elapsed:.1f}s")
         logger.warning(f"🚨 MARKET ORDER FALLBACK: Cancelling limit and placing market order")
 
@@ -997,13 +1256,13 @@ class OrderManager:
 
                 # Log progress every 5 seconds
                 if i > 0 and i % 5 == 0:
-                    logger.debug(f"Market order still pending after {i+1}s, status: {status}")
+                    logger.debug("Market order still pending after %ds, status: %s", i + 1, status)
 
             # Critical: Market order not filled after 30 seconds
             logger.error(f"Market order {market_order_id} not filled after 30 seconds!")
             raise NakedPositionException(
                 symbol, unfilled_exchange, quantity,
-                int(time.time() - start_time)
+                int(time.monotonic() - start_time)
             )
 
         except NakedPositionException:
@@ -1016,7 +1275,7 @@ class OrderManager:
             logger.error(f"   Please check order status manually for order ID in logs above")
             raise NakedPositionException(
                 symbol, unfilled_exchange, quantity,
-                int(time.time() - start_time)
+                int(time.monotonic() - start_time)
             )
 
     def _place_new_limit_order_for_naked_position(
@@ -1323,6 +1582,85 @@ class OrderManager:
         order_id: str,
         max_retries: int = 5,
         retry_delay: float = 0.3
+    ) -> Optional[str]:
+        """
+        Check order status from PostgreSQL database (sync wrapper).
+
+        Runs _check_order_status_from_db_async on the background event loop,
+        so retry back-off is an asyncio.sleep rather than a blocking sleep.
+
+        Args:
+            order_id: Exchange order ID
+            max_retries: Number of retry attempts (default 5)
+            retry_delay: Delay between retries in seconds (default 0.3s)
+
+        Returns:
+            Status string: 'PLACED', 'FILLED', 'CANCELLED', 'OPEN', 'REJECTED', or None
+
+        Raises:
+            DatabaseException: If database unavailable or order cannot be verified after retries
+        """
+        future = asyncio.run_coroutine_threadsafe(
+            self._cached_order_status(order_id, max_retries, retry_delay),
+            self._get_io_loop()
+        )
+        return future.result()
+
+    def _check_order_statuses(self, *order_ids: str) -> List[Optional[str]]:
+        """
+        Check several orders' statuses concurrently.
+
+        Args:
+            *order_ids: Exchange order IDs
+
+        Returns:
+            List of statuses in the same order as order_ids
+
+        Raises:
+            DatabaseException: If any status check fails
+        """
+        async def gather_statuses():
+            return await asyncio.gather(
+                *(self._cached_order_status(order_id) for order_id in order_ids)
+            )
+
+        future = asyncio.run_coroutine_threadsafe(gather_statuses(), self._get_io_loop())
+        return future.result()
+
+    async def _cached_order_status(
+        self,
+        order_id: str,
+        max_retries: int = 5,
+        retry_delay: float = 0.3
+    ) -> Optional[str]:
+        """Status check that reuses a fresh cached result for the same order."""
+        status = self._get_cached_order('status', order_id)
+        if status is None:
+            status = await self._check_order_status_from_db_async(order_id, max_retries, retry_delay)
+            self._cache_order('status', order_id, status, status)
+        return status
+
+    def _fetch_order_status_row(self, order_id: str) -> Tuple[Optional[str], Optional[str]]:
+        """
+        Fetch orders.status and the latest lifecycle event for an order.
+
+        Args:
+            order_id: Exchange order ID
+
+        Returns:
+            Tuple of (orders_status, event_log_status), either may be None
+        """
+        with self.db.cursor(cursor_factory=RealDictCursor) as cursor:
+            self._execute_prepared(cursor, 'om_order_status', (order_id,))
+            row = cursor.fetchone()
+
+        return row['orders_status'], row['event_log_status']
+
+    async def _check_order_status_from_db_async(
+        self,
+        order_id: str,
+        max_retries: int = 5,
+        retry_delay: float = 0.3
     ) -> Optional[str]:
         """
         Check order status from PostgreSQL database with retry logic and event log verification.
@@ -1342,7 +1680,8 @@ class OrderManager:
         Args:
             order_id: Exchange order ID
             max_retries: Number of retry attempts (default 5)
-            retry_delay: Delay between retries in seconds (default 0.3s)
+            retry_delay: Spacing between attempts in seconds (default 0.3s);
+                total wall time is bounded by max_retries * retry_delay
 
         Returns:
             Status string: 'PLACED', 'FILLED', 'CANCELLED', 'OPEN', 'REJECTED', or None
@@ -1355,41 +1694,25 @@ class OrderManager:
             logger.error(error_msg)
             raise DatabaseException("database_unavailable", error_msg)
 
-        for attempt in range(1, max_retries + 1):
-            try:
-                # Query 1: Check orders table (primary source)
-                orders_status = None
-                with self.db.conn.cursor() as cursor:
-                    cursor.execute("""
-                        SELECT status FROM orders
-                        WHERE order_id = %s
-                    """, (order_id,))
-
-                    row = cursor.fetchone()
-                    if row:
-                        orders_status = row[0]
+        loop = asyncio.get_running_loop()
 
-                # Query 2: Check order_lifecycle_log (verification source)
-                event_log_status = None
-                with self.db.conn.cursor() as cursor:
-                    cursor.execute("""
-                        SELECT event_type
-                        FROM order_lifecycle_log
-                        WHERE order_id = %s
-                        ORDER BY timestamp DESC
-                        LIMIT 1
-                    """, (order_id,))
+        # Attempts are scheduled on a fixed grid (start + attempt * retry_delay)
+        # so slow queries don't stretch total wall time past the deadline
+        start = time.monotonic()
+        deadline = start + max_retries * retry_delay
 
-                    row = cursor.fetchone()
-                    if row:
-                        event_log_status = row[0]
+        for attempt in range(1, max_retries + 1):
+            try:
+                # Single round-trip on a pooled connection (off the event loop)
+                orders_status, event_log_status = await loop.run_in_executor(
+                    None, self._fetch_order_status_row, order_id
+                )
 
                 # Log what we found
-                if attempt == 1:
+                if attempt == 1 and logger.isEnabledFor(logging.DEBUG):
                     logger.debug(
-                        f"Order {order_id[:12]}... - "
-                        f"orders.status: {orders_status}, "
-                        f"event_log: {event_log_status}"
+                        "Order %s... - orders.status: %s, event_log: %s",
+                        order_id[:12], orders_status, event_log_status
                     )
 
                 # Decision logic based on both sources
@@ -1398,16 +1721,17 @@ class OrderManager:
                 if orders_status in ['FILLED', 'CANCELLED', 'REJECTED']:
                     if event_log_status == orders_status or event_log_status == 'FILLED':
                         # Both agree or event log confirms fill
-                        logger.debug(f"Order {order_id[:12]}... status confirmed: {orders_status}")
+                        if logger.isEnabledFor(logging.DEBUG):
+                            logger.debug("Order %s... status confirmed: %s", order_id[:12], orders_status)
                         return orders_status
                     else:
                         # Mismatch - retry
                         logger.debug(
-                            f"Status mismatch attempt {attempt}/{max_retries}: "
-                            f"orders={orders_status}, event_log={event_log_status}"
+                            "Status mismatch attempt %d/%d: orders=%s, event_log=%s",
+                            attempt, max_retries, orders_status, event_log_status
                         )
-                        if attempt < max_retries:
-                            time.sleep(retry_delay)
+                        if attempt < max_retries and time.monotonic() < deadline:
+                            await self._sleep_until_slot(start, attempt, retry_delay)
                             continue
                         else:
                             # After retries, trust orders table for terminal statuses
@@ -1417,16 +1741,17 @@ class OrderManager:
                             return orders_status
 
                 # Case 2: Found in orders table with OPEN/PLACED status
-                if orders_status in ['OPEN', 'PLACED', 'NEW']:
+                # (CANCELLING = cancel in flight, still live on the exchange)
+                if orders_status in ['OPEN', 'PLACED', 'NEW', 'CANCELLING']:
                     if event_log_status == 'FILLED':
                         # Critical mismatch: event log says FILLED but orders says OPEN
                         # WebSocket is mid-update, retry
-                        logger.info(
-                            f"⚠️ Status mismatch (attempt {attempt}/{max_retries}): "
-                            f"orders={orders_status}, event_log=FILLED - retrying..."
+                        logger.debug(
+                            "⚠️ Status mismatch (attempt %d/%d): orders=%s, event_log=FILLED - retrying...",
+                            attempt, max_retries, orders_status
                         )
-                        if attempt < max_retries:
-                            time.sleep(retry_delay)
+                        if attempt < max_retries and time.monotonic() < deadline:
+                            await self._sleep_until_slot(start, attempt, retry_delay)
                             continue
                         else:
                             # After retries, trust event log (more reliable)
@@ -1452,11 +1777,11 @@ class OrderManager:
                     elif event_log_status in ['PLACED', 'OPEN', 'NEW']:
                         # Order should be in orders table but isn't
                         logger.warning(
-                            f"⚠️ Order {order_id[:12]}... in event_log but not in orders table "
-                            f"(attempt {attempt}/{max_retries})"
+                            "⚠️ Order %s... in event_log but not in orders table (attempt %d/%d)",
+                            order_id[:12], attempt, max_retries
                         )
-                        if attempt < max_retries:
-                            time.sleep(retry_delay)
+                        if attempt < max_retries and time.monotonic() < deadline:
+                            await self._sleep_until_slot(start, attempt, retry_delay)
                             continue
                         else:
                             # After retries, still missing - raise error
@@ -1474,11 +1799,11 @@ class OrderManager:
                     else:
                         # Not in either table
                         logger.warning(
-                            f"Order {order_id[:12]}... not found in either table "
-                            f"(attempt {attempt}/{max_retries})"
+                            "Order %s... not found in either table (attempt %d/%d)",
+                            order_id[:12], attempt, max_retries
                         )
-                        if attempt < max_retries:
-                            time.sleep(retry_delay)
+                        if attempt < max_retries and time.monotonic() < deadline:
+                            await self._sleep_until_slot(start, attempt, retry_delay)
                             continue
                         else:
                             # After retries, truly not found
@@ -1487,18 +1812,20 @@ class OrderManager:
 
                 # Shouldn't reach here, but handle gracefully
                 logger.warning(
-                    f"Unexpected state: orders={orders_status}, event_log={event_log_status}"
+                    "Unexpected state: orders=%s, event_log=%s", orders_status, event_log_status
                 )
-                if attempt < max_retries:
-                    time.sleep(retry_delay)
+                if attempt < max_retries and time.monotonic() < deadline:
+                    await self._sleep_until_slot(start, attempt, retry_delay)
                     continue
                 else:
                     return orders_status if orders_status else None
 
             except Exception as e:
-                logger.error(f"Database error checking order status (attempt {attempt}/{max_retries}): {e}")
-                if attempt < max_retries:
-                    time.sleep(retry_delay)
+                logger.error(
+                    "Database error checking order status (attempt %d/%d): %s", attempt, max_retries, e
+                )
+                if attempt < max_retries and time.monotonic() < deadline:
+                    await self._sleep_until_slot(start, attempt, retry_delay)
                     continue
                 else:
                     error_msg = f"Failed to check order status after {max_retries} attempts: {e}"
@@ -1528,19 +1855,13 @@ class OrderManager:
             )
 
             if response.get('retCode') == 0:
-                logger.debug(f"Bybit order {order_id} modified to ${new_price:.2f}")
+                logger.debug("Bybit order %s modified to $%.2f", order_id, new_price)
 
                 # Update database
                 if self.db:
-                    with self.db.conn.cursor() as cursor:
-                        cursor.execute("""
-                            UPDATE orders
-                            SET modified_price = %s,
-                                modified_at = CURRENT_TIMESTAMP,
-                                is_modified = TRUE
-                            WHERE order_id = %s
-                        """, (new_price, order_id))
-                        self.db.conn.commit()
+                    with self.db.cursor() as cursor:
+                        self._execute_prepared(cursor, 'om_mark_modified', (new_price, order_id))
+                    self._invalidate_order_cache(order_id)
             else:
                 logger.warning(f"Bybit modification failed: {response}")
 
@@ -1579,19 +1900,13 @@ class OrderManager:
                 price=new_price
             )
 
-            logger.debug(f"CoinDCX order {order_id[:8]}... modified to ${new_price:.2f}")
+            logger.debug("CoinDCX order %.8s... modified to $%.2f", order_id, new_price)
 
             # Update database
             if self.db:
-                with self.db.conn.cursor() as cursor:
-                    cursor.execute("""
-                        UPDATE orders
-                        SET modified_price = %s,
-                            modified_at = CURRENT_TIMESTAMP,
-                            is_modified = TRUE
-                        WHERE order_id = %s
-                    """, (new_price, order_id))
-                    self.db.conn.commit()
+                with self.db.cursor() as cursor:
+                    self._execute_prepared(cursor, 'om_mark_modified', (new_price, order_id))
+                self._invalidate_order_cache(order_id)
 
             return order_id
 
@@ -1632,8 +1947,10 @@ class OrderManager:
             OrderException: If cancel or replace fails
         """
         try:
-            # Step 0: CRITICAL - Check if order still exists and is open
-            current_status = self._check_order_status_from_db(old_order_id)
+            # Step 0+1: CRITICAL - Check order is still open and load its details
+            # (single round-trip for status, latest lifecycle event and details)
+            order_details = self._get_order_row(old_order_id)
+            current_status = order_details['status']
 
             if current_status == 'FILLED':
                 logger.info(f"  ℹ️ Order {old_order_id[:8]}... already FILLED, skipping modification")
@@ -1643,10 +1960,7 @@ class OrderManager:
                 logger.warning(f"  ⚠️ Order {old_order_id[:8]}... already CANCELLED, skipping modification")
                 return None  # Don't create new order
 
-            # Step 1: Get old order details from database
-            order_details = self._get_order_details_from_db(old_order_id)
-
-            if not order_details:
+            if order_details['exchange'] is None:
                 logger.error(f"Cannot find order {old_order_id} in database for replacement")
                 raise OrderException('CoinDCX', 'modification', f"Order {old_order_id} not found in database")
 
@@ -1662,20 +1976,20 @@ class OrderManager:
             # Step 2: Cancel old order
             try:
                 self.coindcx.cancel_order(old_order_id)
-                logger.debug(f"  ✓ Old order {old_order_id[:8]}... cancelled")
+                logger.debug("  ✓ Old order %.8s... cancelled", old_order_id)
             except Exception as cancel_error:
                 logger.warning(f"Failed to cancel order {old_order_id}, it may already be filled: {cancel_error}")
                 # Don't raise - order might already be filled, let monitoring detect it
 
             # Step 2.5: Wait for cancellation to process on CoinDCX servers
-            logger.debug(f"  ⏳ Waiting 2s for cancellation to process...")
+            logger.debug("  ⏳ Waiting 2s for cancellation to process...")
             time.sleep(2)
 
             # Step 3: Place new order at new price with retry logic
             max_retries = 3
             for attempt in range(1, max_retries + 1):
                 try:
-                    logger.debug(f"  Placement attempt {attempt}/{max_retries}")
+                    logger.debug("  Placement attempt %d/%d", attempt, max_retries)
 
                     new_order = self.coindcx.place_order(
                         pair=symbol,
@@ -1703,7 +2017,7 @@ class OrderManager:
                     if http_error.response.status_code == 500:
                         if attempt < max_retries:
                             backoff = 2 ** attempt  # Exponential backoff: 2s, 4s, 8s
-                            logger.warning(f"  HTTP 500 error, retrying in {backoff}s (attempt {attempt}/{max_retries})")
+                            logger.warning("  HTTP 500 error, retrying in %ds (attempt %d/%d)", backoff, attempt, max_retries)
                             time.sleep(backoff)
                             continue
                         else:
@@ -1719,7 +2033,10 @@ class OrderManager:
                 except Exception as place_error:
                     if attempt < max_retries:
                         backoff = 2 ** attempt
-                        logger.warning(f"  Placement error, retrying in {backoff}s (attempt {attempt}/{max_retries}): {place_error}")
+                        logger.warning(
+                            "  Placement error, retrying in %ds (attempt %d/%d): %s",
+                            backoff, attempt, max_retries, place_error
+                        )
                         time.sleep(backoff)
                         continue
                     else:
@@ -1729,17 +2046,17 @@ class OrderManager:
 
             # Step 4: Update database (cancel old, insert new)
             if self.db:
-                with self.db.conn.cursor() as cursor:
-                    # Mark old order as cancelled
-                    cursor.execute("""
-                        UPDATE orders
-                        SET status = 'CANCELLED',
-                            modified_at = CURRENT_TIMESTAMP
-                        WHERE order_id = %s
-                    """, (old_order_id,))
-
-                    # Insert new order with same chunk tracking
+                with self.db.cursor() as cursor:
+                    # Mark old order as cancelled and insert new order with same
+                    # chunk tracking - one statement, one round-trip
                     cursor.execute("""
+                        WITH old AS (
+                            UPDATE orders
+                            SET status = 'CANCELLED',
+                                modified_at = CURRENT_TIMESTAMP
+                            WHERE order_id = %s
+                            RETURNING chunk_group_id
+                        )
                         INSERT INTO orders (
                             chunk_group_id, chunk_sequence, chunk_total,
                             exchange, symbol, side, quantity, price, order_id, status,
@@ -1749,13 +2066,13 @@ class OrderManager:
                             CURRENT_TIMESTAMP, CURRENT_TIMESTAMP
                         )
                     """, (
+                        old_order_id,
                         chunk_group_id, chunk_sequence, chunk_total,
                         coin_symbol, side, quantity, new_price, new_order_id
                     ))
+                self._invalidate_order_cache(old_order_id, new_order_id)
 
-                    self.db.conn.commit()
-
-                logger.debug(f"  ✓ Database updated: old order cancelled, new order tracked")
+                logger.debug("  ✓ Database updated: old order cancelled, new order tracked")
 
             return new_order_id
 
@@ -1763,6 +2080,54 @@ class OrderManager:
             logger.error(f"Cancel+replace failed: {e}")
             raise
 
+    def _get_order_row(self, order_id: str) -> Dict:
+        """
+        Retrieve order status and details in a single query.
+
+        Combines the orders row with the latest order_lifecycle_log event so
+        a fill recorded only in the event log still reports as FILLED.
+
+        Args:
+            order_id: Order ID to look up
+
+        Returns:
+            dict with 'status' plus the same keys as _get_order_details_from_db.
+            Detail fields are None if the order is not in the orders table.
+
+        Raises:
+            DatabaseException: If database unavailable
+        """
+        if not self.db:
+            error_msg = f"Database not available - cannot look up order {order_id[:12]}..."
+            logger.error(error_msg)
+            raise DatabaseException("database_unavailable", error_msg)
+
+        with self.db.cursor(cursor_factory=RealDictCursor) as cursor:
+            cursor.execute("""
+                SELECT o.status AS orders_status, e.event_type AS event_log_status,
+                       o.exchange, o.symbol, o.side, o.quantity, o.price,
+                       o.chunk_group_id, o.chunk_sequence, o.chunk_total
+                FROM (SELECT %s::varchar AS order_id) AS k
+                LEFT JOIN orders o ON o.order_id = k.order_id
+                LEFT JOIN LATERAL (
+                    SELECT event_type
+                    FROM order_lifecycle_log
+                    WHERE order_id = k.order_id
+                    ORDER BY timestamp DESC
+                    LIMIT 1
+                ) e ON TRUE
+                LIMIT 1
+            """, (order_id,))
+
+            row = cursor.fetchone()
+
+        details = dict(row)
+        orders_status = details.pop('orders_status')
+        event_log_status = details.pop('event_log_status')
+        details['status'] = 'FILLED' if event_log_status == 'FILLED' else (orders_status or event_log_status)
+
+        return details
+
     def _get_order_details_from_db(self, order_id: str) -> Optional[Dict]:
         """
         Retrieve order details from database.
@@ -1776,36 +2141,145 @@ class OrderManager:
         if not self.db:
             return None
 
+        cached = self._get_cached_order('details', order_id)
+        if cached is not None:
+            return dict(cached)
+
         try:
-            with self.db.conn.cursor() as cursor:
-                cursor.execute("""
-                    SELECT exchange, symbol, side, quantity, price, status,
-                           chunk_group_id, chunk_sequence, chunk_total
-                    FROM orders
-                    WHERE order_id = %s
-                """, (order_id,))
+            with self.db.cursor(cursor_factory=RealDictCursor) as cursor:
+                self._execute_prepared(cursor, 'om_order_details', (order_id,))
 
                 row = cursor.fetchone()
 
                 if not row:
                     return None
 
-                return {
-                    'exchange': row[0],
-                    'symbol': row[1],
-                    'side': row[2],
-                    'quantity': float(row[3]),
-                    'price': float(row[4]),
-                    'status': row[5],
-                    'chunk_group_id': row[6],
-                    'chunk_sequence': row[7],
-                    'chunk_total': row[8]
-                }
+                # NUMERIC columns already arrive as float (DEC2FLOAT in utils.db)
+                details = dict(row)
+                self._cache_order('details', order_id, dict(details), details['status'])
+                return details
 
         except Exception as e:
             logger.error(f"Failed to get order details from DB: {e}")
             return None
 
+    def _claim_order_for_cancel(
+        self,
+        order_id: str,
+        retry_missing: bool = True
+    ) -> Tuple[Optional[str], bool]:
+        """
+        Atomically mark an open order as CANCELLING.
+
+        The status guard lives in the UPDATE itself, so there is no window
+        between reading the status and acting on it. Orders whose lifecycle
+        log already shows FILLED are never claimed. If the orders row is not
+        there yet, falls back to the retrying _check_order_status_from_db
+        and claims again once the row shows up.
+
+        Args:
+            order_id: Order ID to claim
+            retry_missing: Wait for a missing orders row (default True)
+
+        Returns:
+            Tuple of (status_before_claim, claimed). status is 'FILLED' if the
+            event log already recorded a fill.
+
+        Raises:
+            DatabaseException: If database unavailable, or the order is in the
+                event log but missing from orders after retries
+        """
+        if not self.db:
+            error_msg = f"Database not available - cannot cancel order {order_id[:12]}..."
+            logger.error(error_msg)
+            raise DatabaseException("database_unavailable", error_msg)
+
+        with self.db.cursor() as cursor:
+            cursor.execute("""
+                WITH filled AS (
+                    SELECT EXISTS (
+                        SELECT 1 FROM order_lifecycle_log
+                        WHERE order_id = %s AND event_type = 'FILLED'
+                    ) AS is_filled
+                ),
+                cur AS (
+                    SELECT status FROM orders
+                    WHERE order_id = %s
+                    LIMIT 1
+                ),
+                claimed AS (
+                    UPDATE orders
+                    SET status = 'CANCELLING'
+                    WHERE order_id = %s
+                      AND status IN ('OPEN', 'PLACED', 'NEW')
+                      AND NOT (SELECT is_filled FROM filled)
+                    RETURNING order_id
+                )
+                SELECT (SELECT status FROM cur),
+                       (SELECT is_filled FROM filled),
+                       EXISTS (SELECT 1 FROM claimed)
+            """, (order_id, order_id, order_id))
+
+            status, is_filled, claimed = cursor.fetchone()
+
+        self._invalidate_order_cache(order_id)
+        if is_filled:
+            return 'FILLED', False
+
+        if status is None and retry_missing:
+            # Row not written yet (bookkeeping lag) - the retrying status check
+            # waits for it, or raises if the event log shows the order but the
+            # orders row never lands. Never skip the exchange cancel on a miss.
+            status = self._check_order_status_from_db(order_id)
+            if status in ('OPEN', 'PLACED', 'NEW'):
+                return self._claim_order_for_cancel(order_id, retry_missing=False)
+
+        return status, claimed
+
+    def _recover_cancel_claims(self) -> None:
+        """
+        Hand back CANCELLING claims left by a crash between claim and finalize.
+
+        The claim is only held for the duration of one cancel call, so any
+        row still CANCELLING at startup is stale. Reverting it to PLACED puts
+        it back in front of the OrderMonitor, which resolves the real
+        exchange state (CANCELLED/FILLED) on its next poll.
+        """
+        try:
+            with self.db.cursor() as cursor:
+                cursor.execute("""
+                    UPDATE orders
+                    SET status = 'PLACED'
+                    WHERE status = 'CANCELLING'
+                    RETURNING order_id
+                """)
+                recovered = [row[0] for row in cursor.fetchall()]
+            if recovered:
+                logger.warning(
+                    "Recovered %d stale CANCELLING order(s) as PLACED: %s",
+                    len(recovered), ", ".join(order_id[:12] for order_id in recovered)
+                )
+        except Exception as e:
+            logger.warning(f"Failed to recover stale cancel claims: {e}")
+
+    def _release_cancel_claim(self, order_id: str, previous_status: str) -> None:
+        """
+        Undo a CANCELLING claim after a failed exchange cancel.
+
+        Only reverts rows still marked CANCELLING, so a status written by the
+        WebSocket monitor in the meantime (e.g. FILLED) is kept.
+        """
+        try:
+            with self.db.cursor() as cursor:
+                cursor.execute("""
+                    UPDATE orders
+                    SET status = %s
+                    WHERE order_id = %s AND status = 'CANCELLING'
+                """, (previous_status, order_id))
+            self._invalidate_order_cache(order_id)
+        except Exception as e:
+            logger.warning(f"Failed to release cancel claim for {order_id[:12]}...: {e}")
+
     def _cancel_bybit_order(self, symbol: str, order_id: str) -> bool:
         """
         Cancel Bybit order and update database.
@@ -1813,8 +2287,9 @@ class OrderManager:
         Returns:
             bool: True if cancelled successfully, False if already filled/rejected/cancelled
         """
-        # CRITICAL: Check status before attempting cancel to prevent duplicate orders
-        status = self._check_order_status_from_db(order_id)
+        # CRITICAL: Atomically claim the order (OPEN/PLACED/NEW -> CANCELLING) before
+        # calling the exchange, so a WebSocket fill can't slip in between check and cancel
+        status, claimed = self._claim_order_for_cancel(order_id)
 
         if status == 'FILLED':
             logger.info(f"✅ Bybit order {order_id[:12]}... already FILLED - skipping cancel")
@@ -1828,7 +2303,7 @@ class OrderManager:
             logger.info(f"⚠️ Bybit order {order_id[:12]}... already CANCELLED - skipping cancel")
             return False
 
-        if status not in ['OPEN', 'PLACED', 'NEW']:
+        if not claimed:
             logger.warning(f"⚠️ Bybit order {order_id[:12]}... has status {status} - skipping cancel")
             return False
 
@@ -1844,31 +2319,34 @@ class OrderManager:
             logger.info(f"✅ Bybit order {order_id[:12]}... cancelled successfully")
 
             if self.db:
-                with self.db.conn.cursor() as cursor:
-                    cursor.execute("""
-                        UPDATE orders
-                        SET status = 'CANCELLED'
-                        WHERE order_id = %s
-                    """, (order_id,))
-                    self.db.conn.commit()
+                with self.db.cursor() as cursor:
+                    self._execute_prepared(cursor, 'om_mark_cancelled', (order_id,))
+                self._invalidate_order_cache(order_id)
 
             return True
 
         except Exception as e:
             logger.error(f"❌ Failed to cancel Bybit order {order_id[:12]}...: {e}")
+            # Hand the row back so WebSocket/status checks see the real state
+            self._release_cancel_claim(order_id, status)
             # If API says "order not found", it might be filled
             if "not found" in str(e).lower() or "does not exist" in str(e).lower():
                 # Wait for WebSocket to update database (order might have just filled)
-                logger.info(f"  Order not found - waiting 1s for database to update...")
-                time.sleep(1.0)
+                # OrderMonitor NOTIFYs on every status update - wake as soon as it lands
+                logger.info(f"  Order not found - waiting for database update...")
+                notified_status = self.db.wait_for_order_status(order_id, timeout=5.0)
 
-                # Re-check status with more aggressive retry
                 logger.info(f"  Checking if order was actually filled...")
-                new_status = self._check_order_status_from_db(
-                    order_id,
-                    max_retries=10,
-                    retry_delay=0.5
-                )
+                if notified_status:
+                    new_status = self._check_order_status_from_db(order_id)
+                else:
+                    # No notification - the LISTEN wait already covered WebSocket
+                    # propagation, so one short confirming re-query is enough
+                    new_status = self._check_order_status_from_db(
+                        order_id,
+                        max_retries=2,
+                        retry_delay=0.75
+                    )
 
                 if new_status == 'FILLED':
                     logger.info(f"  ✅ Order {order_id[:12]}... was actually FILLED")
@@ -1894,8 +2372,9 @@ class OrderManager:
         Returns:
             bool: True if cancelled successfully, False if already filled/rejected/cancelled
         """
-        # CRITICAL: Check status before attempting cancel to prevent duplicate orders
-        status = self._check_order_status_from_db(order_id)
+        # CRITICAL: Atomically claim the order (OPEN/PLACED/NEW -> CANCELLING) before
+        # calling the exchange, so a WebSocket fill can't slip in between check and cancel
+        status, claimed = self._claim_order_for_cancel(order_id)
 
         if status == 'FILLED':
             logger.info(f"✅ CoinDCX order {order_id[:12]}... already FILLED - skipping cancel")
@@ -1909,7 +2388,7 @@ class OrderManager:
             logger.info(f"⚠️ CoinDCX order {order_id[:12]}... already CANCELLED - skipping cancel")
             return False
 
-        if status not in ['OPEN', 'PLACED', 'NEW']:
+        if not claimed:
             logger.warning(f"⚠️ CoinDCX order {order_id[:12]}... has status {status} - skipping cancel")
             return False
 
@@ -1919,18 +2398,16 @@ class OrderManager:
             logger.info(f"✅ CoinDCX order {order_id[:12]}... cancelled successfully")
 
             if self.db:
-                with self.db.conn.cursor() as cursor:
-                    cursor.execute("""
-                        UPDATE orders
-                        SET status = 'CANCELLED'
-                        WHERE order_id = %s
-                    """, (order_id,))
-                    self.db.conn.commit()
+                with self.db.cursor() as cursor:
+                    self._execute_prepared(cursor, 'om_mark_cancelled', (order_id,))
+                self._invalidate_order_cache(order_id)
 
             return True
 
         except Exception as e:
             logger.error(f"❌ Failed to cancel CoinDCX order {order_id[:12]}...: {e}")
+            # Hand the row back so WebSocket/status checks see the real state
+            self._release_cancel_claim(order_id, status)
             # If API says "order not found", it might be filled
             if "not found" in str(e).lower() or "does not exist" in str(e).lower():
                 # Re-check status
@@ -1981,17 +2458,30 @@ class OrderManager:
             Exception: If handling fails
         """
         logger.info(
-            f"========== HANDLING PARTIAL FILL ==========\n"
-            f"Order ID: {order_id}\n"
-            f"Exchange: {exchange}\n"
-            f"Symbol: {symbol}\n"
-            f"Side: {side}\n"
-            f"Original Qty: {original_quantity}\n"
-            f"Chunk: {chunk_sequence}/{chunk_total}"
+            _PARTIAL_FILL_START_BANNER,
+            order_id, exchange, symbol, side, original_quantity, chunk_sequence, chunk_total
+        )
+        ex = exchange.lower()
+
+        # Step 1 + 2: Read partial fill details from event log and cancel the
+        # partially filled order - independent, so run them side by side
+        def cancel_partial_order() -> bool:
+            if ex == 'bybit':
+                return self._cancel_bybit_order(symbol, order_id)
+            return self._cancel_coindcx_order(order_id)  # coindcx
+
+        logger.info("Cancelling partially filled order %s...", order_id)
+        partial_fill_data, cancel_result = self._run_concurrently(
+            lambda: self._get_partial_fill_details(order_id, exchange),
+            cancel_partial_order
         )
 
-        # Step 1: Get partial fill details from event log
-        partial_fill_data = self._get_partial_fill_details(order_id, exchange)
+        if isinstance(cancel_result, Exception):
+            logger.error("Failed to cancel partial order: %s", cancel_result)
+            # Continue anyway - we need to complete the hedge
+
+        if isinstance(partial_fill_data, Exception):
+            raise partial_fill_data
 
         if not partial_fill_data:
             raise Exception(f"Could not find partial fill details for {order_id}")
@@ -2001,29 +2491,16 @@ class OrderManager:
         partial_fee = partial_fill_data['cumExecFee']
 
         logger.info(
-            f"Partial fill details:\n"
-            f"  Filled Qty: {partial_filled_qty}\n"
-            f"  Avg Price: ${partial_avg_price:.2f}\n"
-            f"  Fee: {partial_fee}"
+            "Partial fill details:\n  Filled Qty: %s\n  Avg Price: $%.2f\n  Fee: %s",
+            partial_filled_qty, partial_avg_price, partial_fee
         )
 
-        # Step 2: Cancel the partially filled order
-        logger.info(f"Cancelling partially filled order {order_id}...")
-        try:
-            if exchange.lower() == 'bybit':
-                self._cancel_bybit_order(symbol, order_id)
-            else:  # coindcx
-                self._cancel_coindcx_order(order_id)
-        except Exception as e:
-            logger.error(f"Failed to cancel partial order: {e}")
-            # Continue anyway - we need to complete the hedge
-
         # Step 3: Calculate remaining quantity
         remaining_qty = original_quantity - partial_filled_qty
 
         logger.info(
-            f"Remaining quantity to fill: {remaining_qty} {coin}\n"
-            f"  (Original: {original_quantity} - Filled: {partial_filled_qty})"
+            "Remaining quantity to fill: %s %s\n  (Original: %s - Filled: %s)",
+            remaining_qty, coin, original_quantity, partial_filled_qty
         )
 
         if remaining_qty <= 0:
@@ -2031,10 +2508,10 @@ class OrderManager:
             return order_id  # Return original order ID
 
         # Step 4: Place market order for remainder
-        logger.info(f"Placing MARKET order for remaining {remaining_qty} {coin}...")
+        logger.info("Placing MARKET order for remaining %s %s...", remaining_qty, coin)
 
         try:
-            if exchange.lower() == 'bybit':
+            if ex == 'bybit':
                 # Bybit market order
                 market_order = self.bybit.place_spot_order(
                     symbol=symbol,
@@ -2060,95 +2537,76 @@ class OrderManager:
                 market_status = market_order['status']
 
             logger.info(
-                f"✅ Market order placed successfully\n"
-                f"  Order ID: {market_order_id}\n"
-                f"  Status: {market_status}\n"
-                f"  Quantity: {remaining_qty} {coin}"
+                "✅ Market order placed successfully\n  Order ID: %s\n  Status: %s\n  Quantity: %s %s",
+                market_order_id, market_status, remaining_qty, coin
             )
 
         except Exception as e:
-            logger.error(f"CRITICAL: Failed to place market order: {e}")
+            logger.error("CRITICAL: Failed to place market order: %s", e)
             raise
 
-        # Step 4.5: Wait for market order to fill and get execution details
+        # Step 4.5: Wait for market order to fill
         logger.info("Waiting for market order to fill...")
         import time
         time.sleep(2)  # Market orders fill instantly, brief wait for data propagation
 
-        # Get fill details from event log
-        completion_fill_data = self._get_partial_fill_details(market_order_id, exchange)
-
-        if completion_fill_data:
-            completion_qty = completion_fill_data['cumExecQty']
-            completion_fee = completion_fill_data['cumExecFee']
-            completion_avg_price = completion_fill_data['avgPrice']
-            logger.info(
-                f"Market order fill details:\n"
-                f"  Filled Qty: {completion_qty}\n"
-                f"  Avg Price: ${completion_avg_price:.2f}\n"
-                f"  Fee: {completion_fee}"
-            )
-        else:
-            # Fallback: use requested quantity as estimate
-            logger.warning("Could not get fill details from event log, using estimates")
-            completion_qty = remaining_qty
-            completion_fee = 0  # Will be updated by order monitor later
-            completion_avg_price = partial_avg_price
-
         # Step 5: Update orders table with partial fill tracking
         logger.info("Updating database with partial fill details...")
 
         # Build partial_details dict based on exchange
-        if exchange.lower() == 'bybit':
-            partial_details = {
-                'partial_order_id': order_id,
-                'partial_filled_qty': partial_filled_qty,
-                'partial_avg_price': partial_avg_price,
-                'partial_bybit_fee_crypto': partial_fee,  # CRITICAL for reconciliation
-                'partial_coindcx_fee_usdt': None
-            }
-        else:  # coindcx
-            partial_details = {
-                'partial_order_id': order_id,
-                'partial_filled_qty': partial_filled_qty,
-                'partial_avg_price': partial_avg_price,
-                'partial_bybit_fee_crypto': None,
-                'partial_coindcx_fee_usdt': partial_fee  # Nice-to-have for P&L
-            }
+        partial_details = _PARTIAL_BUILDERS[ex](order_id, partial_filled_qty, partial_avg_price, partial_fee)
 
         # UPSERT order with partial fill tracking
         # This will replace the partial order row with completion order row
-        # but preserve partial order details in partial_* columns
-        try:
-            if self.db:
-                self.db.upsert_order(
-                    chunk_group_id=chunk_group_id,
-                    chunk_sequence=chunk_sequence,
-                    exchange=exchange,
-                    symbol=symbol,
-                    side=side,
-                    quantity=remaining_qty,
-                    price=completion_avg_price,  # Use completion avg price
+        # but preserve partial order details in partial_* columns. Fill data
+        # is read from the event log in the same statement; the requested
+        # quantity / partial avg price are fallbacks if no event arrived yet.
+        # Written synchronously: fee reconciliation reads partial_filled_qty
+        # from this row, so it must not be deferred or dropped.
+        if self.db:
+            completion_args = {
+                'chunk_group_id': chunk_group_id,
+                'chunk_sequence': chunk_sequence,
+                'symbol': symbol,
+                'side': side,
+                'quantity': remaining_qty,
+                'price': partial_avg_price,
+                'status': 'FILLED',  # Market orders fill immediately
+                'order_type': 'market',
+                'chunk_total': chunk_total,
+                'is_partial_completion': True,
+                'partial_details': partial_details,
+                'cumexecqty': remaining_qty,
+                'cumexecfee': 0  # Will be updated by order monitor later
+            }
+            try:
+                completion = self._db_write_with_retry(
+                    'complete_partial_with_event',
                     order_id=market_order_id,
-                    status='FILLED',  # Market orders fill immediately
-                    order_type='market',
-                    chunk_total=chunk_total,
-                    is_partial_completion=True,
-                    partial_details=partial_details,
-                    cumexecqty=completion_qty,  # ✅ Include fill data
-                    cumexecfee=completion_fee,  # ✅ Include fee data
-                    # net_received will be auto-calculated
+                    exchange=exchange,
+                    completion_args=completion_args
                 )
+
+                if completion['event_found']:
+                    logger.info(
+                        "Market order fill details:\n  Filled Qty: %s\n  Avg Price: $%.2f\n  Fee: %s",
+                        completion['cumexecqty'], completion['price'], completion['cumexecfee']
+                    )
+                else:
+                    logger.warning("Could not get fill details from event log, using estimates")
                 logger.info("✅ Database updated with partial fill tracking and fill data")
-        except Exception as e:
-            logger.error(f"Failed to update database with partial fill: {e}")
-            # Don't raise - market order placed successfully
+            except Exception as e:
+                logger.error(
+                    "CRITICAL: Failed to record partial fill completion %s after %d attempts: %s (%s)",
+                    market_order_id, self.config.DB_WRITE_RETRIES, e, completion_args
+                )
+                # Don't raise - market order placed successfully
 
         logger.info(
-            f"========== PARTIAL FILL HANDLED ==========\n"
-            f"Partial Order: {order_id} ({partial_filled_qty} {coin})\n"
-            f"Completion Order: {market_order_id} ({remaining_qty} {coin})\n"
-            f"Total: {original_quantity} {coin}"
+            _PARTIAL_FILL_DONE_BANNER,
+            order_id, partial_filled_qty, coin,
+            market_order_id, remaining_qty, coin,
+            original_quantity, coin
         )
 
         return market_order_id
@@ -2174,31 +2632,19 @@ class OrderManager:
 
         table_name = f"{exchange.lower()}_order_events"
 
-        query = f"""
-            SELECT
-                "cumExecQty",
-                "avgPrice",
-                "cumExecFee",
-                event_time
-            FROM {table_name}
-            WHERE order_id = %s
-            ORDER BY event_time DESC
-            LIMIT 1
-        """
-
         try:
-            result = self.db.execute_query(query, (order_id,), fetch=True)
+            # Same latest-event query complete_partial_with_event reads from
+            row = self.db.get_latest_fill_event(order_id, exchange)
 
-            if not result or len(result) == 0:
+            if not row:
                 logger.error(f"No event log entry found for {order_id} in {table_name}")
                 return None
 
-            row = result[0]
-
+            # NUMERIC columns already arrive as float (DEC2FLOAT in utils.db)
             return {
-                'cumExecQty': float(row['cumExecQty'] or 0),
-                'avgPrice': float(row['avgPrice'] or 0),
-                'cumExecFee': float(row['cumExecFee'] or 0)
+                'cumExecQty': row['cum_qty'] or 0.0,
+                'avgPrice': row['avg_price'] or 0.0,
+                'cumExecFee': row['cum_fee'] or 0.0
             }
 
         except Exception as e:
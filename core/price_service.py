@@ -3,11 +3,15 @@ Price Service - Wrapper around LTP_fetch with validation
 Fetches and validates cryptocurrency prices from both exchanges.
 """
 
+import asyncio
 import logging
-from typing import Dict, Tuple
+import threading
+import time
+from typing import Dict, Literal, Tuple
 
 # Import from bundled price_feed module (self-contained)
-from price_feed.LTP_fetch import get_crypto_ltp
+from price_feed.LTP_fetch import get_crypto_ltp_async
+from price_feed.crypto_data_retriever import CryptoDataRetriever
 
 from config.symbol_config import SymbolConfig
 from utils.exceptions import PriceDataException
@@ -20,17 +24,70 @@ logger = logging.getLogger(__name__)
 class PriceService:
     """Service for fetching and validating cryptocurrency prices"""
 
+    __slots__ = (
+        'config', 'validators', '_loop', '_loop_lock', '_retriever',
+        '_price_cache', '_cache_ttl', '_freshness', '_max_spread',
+        '_spread_sanity'
+    )
+
     def __init__(self):
         """Initialize price service."""
         self.config = SymbolConfig()
         self.validators = Validators()
 
-    def get_validated_prices(self, symbol: str) -> Dict:
+        # Config values read on every price check, bound once
+        self._cache_ttl = self.config.PRICE_CACHE_TTL_MS / 1000
+        self._freshness = self.config.PRICE_FRESHNESS_SECONDS
+        self._max_spread = self.config.MAX_SPREAD_PERCENT
+        self._spread_sanity = self.config.SPREAD_SANITY_PERCENT
+
+        # Private loop for the async price fetch behind the sync API;
+        # the retriever (and its async Redis pool) is kept across calls
+        self._loop = asyncio.new_event_loop()
+        self._loop_lock = threading.Lock()
+        self._retriever = None
+
+        # symbol -> (monotonic fetch time, validated price data)
+        self._price_cache: Dict[str, Tuple[float, Dict]] = {}
+
+    def _fetch_raw_prices(self, symbol: str) -> Dict:
+        """
+        Fetch raw LTP data, reading both exchanges concurrently.
+
+        Args:
+            symbol: Cryptocurrency symbol (BTC/ETH)
+
+        Returns:
+            get_crypto_ltp-style dictionary
+
+        Raises:
+            PriceDataException: If the price feed is unreachable
+        """
+        with self._loop_lock:
+            if self._retriever is None:
+                try:
+                    self._retriever = CryptoDataRetriever()
+                except Exception as e:
+                    raise PriceDataException("Both", f"Failed to fetch price data: {e}")
+
+            return self._loop.run_until_complete(
+                get_crypto_ltp_async(symbol, self._retriever)
+            )
+
+    def get_validated_prices(
+        self,
+        symbol: str,
+        trust_level: Literal['full', 'fresh_only'] = 'full'
+    ) -> Dict:
         """
         Fetch and validate prices from both exchanges.
 
         Args:
             symbol: Cryptocurrency symbol (BTC/ETH)
+            trust_level: How much validation to run:
+                'full' - price data, freshness and spread checks (default)
+                'fresh_only' - price data and freshness, no spread check
+                    (for callers that already checked the spread upstream)
 
         Returns:
             Dictionary with validated price data:
@@ -51,11 +108,19 @@ class PriceService:
             ValidationException: If spread is invalid
         """
         symbol = symbol.upper()
-        logger.info(f"Fetching prices for {symbol}")
+        validators = self.validators
+        freshness = self._freshness
+
+        # Back-to-back callers (check_spread -> get_maker_prices) share one fetch
+        cached = self._price_cache.get(symbol)
+        if cached and time.monotonic() - cached[0] < self._cache_ttl:
+            return cached[1]
+
+        logger.info("Fetching prices for %s", symbol)
 
         try:
-            # Get raw price data from LTP_fetch
-            raw_data = get_crypto_ltp(symbol)
+            # Get raw price data from LTP_fetch (both exchanges concurrently)
+            raw_data = self._fetch_raw_prices(symbol)
 
             if not raw_data.get('success'):
                 raise PriceDataException(
@@ -68,13 +133,13 @@ class PriceService:
             if not bybit_data:
                 raise PriceDataException("Bybit", "No Bybit price data available")
 
-            self.validators.validate_price_data(bybit_data, "Bybit")
+            validators.validate_price_data(bybit_data, "Bybit")
 
             # Validate Bybit price freshness
             if bybit_data.get('timestamp'):
-                self.validators.validate_price_freshness(
+                validators.validate_price_freshness(
                     bybit_data['timestamp'],
-                    self.config.PRICE_FRESHNESS_SECONDS,
+                    freshness,
                     "Bybit"
                 )
 
@@ -83,56 +148,45 @@ class PriceService:
             if not coindcx_data:
                 raise PriceDataException("CoinDCX", "No CoinDCX price data available")
 
-            self.validators.validate_price_data(coindcx_data, "CoinDCX")
+            validators.validate_price_data(coindcx_data, "CoinDCX")
 
             # Validate CoinDCX price freshness
             if coindcx_data.get('timestamp'):
-                self.validators.validate_price_freshness(
+                validators.validate_price_freshness(
                     coindcx_data['timestamp'],
-                    self.config.PRICE_FRESHNESS_SECONDS,
+                    freshness,
                     "CoinDCX"
                 )
 
-            # Convert prices to float
-            bybit_price = float(bybit_data['ltp'])
-            coindcx_price = float(coindcx_data['ltp'])
+            # Prices already parsed to float by LTP_fetch (TypedLTP)
+            bybit_typed = raw_data['bybit_typed']
+            coindcx_typed = raw_data['coindcx_typed']
+            bybit_price = bybit_typed.ltp
+            coindcx_price = coindcx_typed.ltp
 
             # Calculate spread
-            spread = self.validators.calculate_spread(bybit_price, coindcx_price)
+            spread = validators.calculate_spread(bybit_price, coindcx_price)
 
             # Validate spread sanity
-            is_valid, warning = self.validators.validate_spread(
-                spread,
-                self.config.MAX_SPREAD_PERCENT,
-                self.config.SPREAD_SANITY_PERCENT
-            )
+            warning = None
+            if trust_level == 'full':
+                is_valid, warning = validators.validate_spread(
+                    spread,
+                    self._max_spread,
+                    self._spread_sanity
+                )
 
-            if not is_valid:
-                logger.warning(f"Spread validation warning: {warning}")
-                # Don't raise exception here - let the bot decide
+                if not is_valid:
+                    logger.warning("Spread validation warning: %s", warning)
+                    # Don't raise exception here - let the bot decide
 
-            # Extract funding rate data
+            # Extract funding rate data (malformed values parse to None)
             funding_rate = {
-                'current': None,
-                'estimated': None,
-                'timestamp': None
+                'current': coindcx_typed.current_fr,
+                'estimated': coindcx_typed.estimated_fr,
+                'timestamp': coindcx_typed.funding_ts
             }
 
-            if coindcx_data.get('current_funding_rate'):
-                try:
-                    funding_rate['current'] = float(coindcx_data['current_funding_rate'])
-                except (ValueError, TypeError):
-                    logger.warning("Invalid current funding rate format")
-
-            if coindcx_data.get('estimated_funding_rate'):
-                try:
-                    funding_rate['estimated'] = float(coindcx_data['estimated_funding_rate'])
-                except (ValueError, TypeError):
-                    logger.warning("Invalid estimated funding rate format")
-
-            if coindcx_data.get('funding_timestamp'):
-                funding_rate['timestamp'] = coindcx_data['funding_timestamp']
-
             # Build validated response
             validated_data = {
                 'symbol': symbol,
@@ -150,16 +204,20 @@ class PriceService:
             }
 
             logger.info(
-                f"Prices validated: {symbol} - "
-                f"Bybit: ${bybit_price:.2f}, "
-                f"CoinDCX: ${coindcx_price:.2f}, "
-                f"Spread: {spread:.4f}%"
+                "Prices validated: %s - Bybit: $%.2f, CoinDCX: $%.2f, Spread: %.4f%%",
+                symbol, bybit_price, coindcx_price, spread
             )
 
+            # Only fully validated data may be served to later callers
+            if trust_level == 'full':
+                self._price_cache[symbol] = (time.monotonic(), validated_data)
+
             return validated_data
 
         except Exception as e:
-            logger.error(f"Error fetching prices for {symbol}: {e}")
+            if isinstance(e, PriceDataException):
+                self._price_cache.pop(symbol, None)
+            logger.error("Error fetching prices for %s: %s", symbol, e)
             raise
 
     def get_maker_prices(self, symbol: str) -> Tuple[float, float]:
@@ -172,20 +230,21 @@ class PriceService:
         Returns:
             Tuple of (bybit_maker_price, coindcx_maker_price)
         """
-        price_data = self.get_validated_prices(symbol)
+        # Spread is sanity-checked by the caller (check_spread) before placement
+        price_data = self.get_validated_prices(symbol, trust_level='fresh_only')
 
         bybit_price = price_data['bybit']['price']
         coindcx_price = price_data['coindcx']['price']
 
         # Calculate maker prices (buy below, sell above current price)
         # For hedge: buy on Bybit (spot), sell on CoinDCX (futures)
-        bybit_maker = self.config.calculate_maker_price(symbol, bybit_price, 'buy')
-        coindcx_maker = self.config.calculate_maker_price(symbol, coindcx_price, 'sell')
+        bybit_maker, coindcx_maker = self.config.calculate_maker_prices(
+            symbol, bybit_price, coindcx_price
+        )
 
         logger.info(
-            f"Maker prices: {symbol} - "
-            f"Bybit: ${bybit_maker:.2f} (buy), "
-            f"CoinDCX: ${coindcx_maker:.2f} (sell)"
+            "Maker prices: %s - Bybit: $%.2f (buy), CoinDCX: $%.2f (sell)",
+            symbol, bybit_maker, coindcx_maker
         )
 
         return bybit_maker, coindcx_maker
@@ -202,7 +261,7 @@ class PriceService:
             Tuple of (is_acceptable, spread_value, message)
         """
         if max_spread is None:
-            max_spread = self.config.MAX_SPREAD_PERCENT
+            max_spread = self._max_spread
 
         price_data = self.get_validated_prices(symbol)
         spread = price_data['spread']
@@ -210,7 +269,7 @@ class PriceService:
         is_valid, warning = self.validators.validate_spread(
             spread,
             max_spread,
-            self.config.SPREAD_SANITY_PERCENT
+            self._spread_sanity
         )
 
         if is_valid:
@@ -9,6 +9,7 @@ No database dependencies, no derivatives/futures functionality.
 import logging
 from typing import Dict, Any, Optional, Callable
 from pybit.unified_trading import HTTP, WebSocket
+from requests.adapters import HTTPAdapter
 
 
 class BybitSpotClient:
@@ -42,6 +43,13 @@ class BybitSpotClient:
             api_key=api_key,
             api_secret=api_secret
         )
+
+        # pybit keeps a requests.Session internally - widen its connection pool
+        # so concurrent REST calls reuse keep-alive connections. pybit does its
+        # own retrying, so the adapter does not retry.
+        http_client = getattr(self.session, 'client', None)
+        if http_client is not None and hasattr(http_client, 'mount'):
+            http_client.mount('https://', HTTPAdapter(pool_connections=10, pool_maxsize=10))
         
         # Initialize WebSocket for real-time updates
         self.ws = WebSocket(
@@ -209,13 +217,15 @@ class BybitSpotClient:
     
     def get_order_history(self, 
                          symbol: Optional[str] = None,
-                         limit: int = 50) -> Dict[str, Any]:
+                         limit: int = 50,
+                         order_id: Optional[str] = None) -> Dict[str, Any]:
         """
         Get spot order history.
         
         Args:
             symbol: Symbol to filter orders (optional)
             limit: Number of orders to retrieve (default 50)
+            order_id: Specific order ID to query (optional)
             
         Returns:
             Historical order information from Bybit
@@ -226,6 +236,8 @@ class BybitSpotClient:
                 'limit': limit
             }
             
+            if order_id:
+                params['orderId'] = order_id
             if symbol:
                 params['symbol'] = symbol
                 
@@ -253,6 +265,56 @@ class BybitSpotClient:
                 'error': str(e)
             }
     
+    def get_executions(self,
+                       symbol: Optional[str] = None,
+                       limit: int = 50,
+                       order_id: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Get spot trade executions.
+        
+        Args:
+            symbol: Symbol to filter executions (optional)
+            limit: Number of executions to retrieve (default 50)
+            order_id: Only executions of this order (optional)
+            
+        Returns:
+            Execution information from Bybit
+        """
+        try:
+            params = {
+                'category': self.category,
+                'limit': limit
+            }
+            
+            if order_id:
+                params['orderId'] = order_id
+            if symbol:
+                params['symbol'] = symbol
+                
+            response = self.session.get_executions(**params)
+            
+            if response.get('retCode') == 0:
+                executions = response['result']['list']
+                return {
+                    'success': True,
+                    'executions': executions,
+                    'response': response
+                }
+            else:
+                self.logger.error(f"Failed to get executions. Response: {response}")
+                return {
+                    'success': False,
+                    'error': response.get('retMsg', 'Unknown error'),
+                    'response': response
+                }
+                
+        except Exception as e:
+            self.logger.error(f"Exception getting executions: {e}")
+            return {
+                'success': False,
+                'error': str(e)
+            }
+    
     def get_spot_balance(self, coin: Optional[str] = None, account_type: Optional[str] = None) -> Dict[str, Any]:
         """
         Get spot wallet balance.
@@ -8,6 +8,8 @@ import hashlib
 import json
 import time
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import asyncio
 import socketio
 import aiohttp
@@ -19,6 +21,13 @@ import os
 from dotenv import load_dotenv
 import logging
 
+# Optional fast JSON decoder (numbers decode straight to float/int in C)
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
 # Load environment variables
 load_dotenv()
 
@@ -82,6 +91,29 @@ class Position:
     stop_loss_trigger: float = 0.0
 
 
+def create_http_session(pool_size: int = 10) -> requests.Session:
+    """
+    Create a keep-alive HTTP session for exchange REST calls.
+
+    Reusing one session keeps TCP+TLS connections open between calls, so
+    retries and back-to-back cancel/place requests skip the handshake.
+    Only connection failures are retried here - order endpoints are not
+    idempotent, so HTTP status errors are left to the caller.
+
+    Args:
+        pool_size: Connections kept per host
+
+    Returns:
+        Configured requests.Session
+    """
+    session = requests.Session()
+    retry = Retry(total=2, connect=2, read=0, status=0, backoff_factor=0.1)
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+
 class CoinDCXFutures:
     """Main CoinDCX Futures Trading Class"""
     
@@ -99,8 +131,14 @@ class CoinDCXFutures:
         if not self.api_key or not self.secret_key:
             raise ValueError("API credentials not provided. Please set COINDCX_API_KEY and COINDCX_SECRET_KEY")
         
+        # Keyed HMAC state; each signature copies it instead of re-keying
+        self._hmac_template = hmac.new(self.secret_key.encode('utf-8'), digestmod=hashlib.sha256)
+
         self.base_url = os.getenv('API_BASE_URL', 'https://api.coindcx.com')
         self.websocket_url = os.getenv('WEBSOCKET_URL', 'wss://stream.coindcx.com')
+
+        # Persistent HTTP session (connection keep-alive across REST calls)
+        self.http = create_http_session()
         
         # WebSocket client (will be initialized when needed)
         self.sio = None
@@ -113,10 +151,13 @@ class CoinDCXFutures:
     
     def _generate_signature(self, body: dict) -> str:
         """Generate HMAC SHA256 signature for API requests"""
-        secret_bytes = bytes(self.secret_key, encoding='utf-8')
-        json_body = json.dumps(body, separators=(',', ':'))
-        signature = hmac.new(secret_bytes, json_body.encode(), hashlib.sha256).hexdigest()
-        return signature
+        return self._sign(json.dumps(body, separators=(',', ':')))
+
+    def _sign(self, json_body: str) -> str:
+        """HMAC SHA256 signature of an already-serialized request body"""
+        mac = self._hmac_template.copy()
+        mac.update(json_body.encode())
+        return mac.hexdigest()
     
     def _get_headers(self, signature: str) -> dict:
         """Get headers for API requests"""
@@ -136,21 +177,21 @@ class CoinDCXFutures:
         # Add timestamp to body
         body['timestamp'] = int(round(time.time() * 1000))
         
-        # Generate signature
-        signature = self._generate_signature(body)
+        # Serialize once: the signed bytes are the bytes we send
+        json_body = json.dumps(body, separators=(',', ':'))
+        signature = self._sign(json_body)
         headers = self._get_headers(signature)
         
         try:
             if method == 'GET':
-                response = requests.get(url, headers=headers)
+                response = self.http.get(url, headers=headers)
             elif method == 'POST':
-                json_body = json.dumps(body, separators=(',', ':'))
-                response = requests.post(url, data=json_body, headers=headers)
+                response = self.http.post(url, data=json_body, headers=headers)
             else:
                 raise ValueError(f"Unsupported HTTP method: {method}")
             
             response.raise_for_status()
-            return response.json()
+            return _json_loads(response.content)
         
         except requests.exceptions.RequestException as e:
             logger.error(f"API request failed: {e}")
@@ -168,13 +209,13 @@ class CoinDCXFutures:
     def get_active_instruments(self) -> List[str]:
         """Get list of active futures instruments"""
         url = f"{self.base_url}/exchange/v1/derivatives/futures/data/active_instruments"
-        response = requests.get(url)
+        response = self.http.get(url)
         return response.json()
     
     def get_instrument_details(self, pair: str) -> dict:
         """Get details for a specific instrument"""
         url = f"{self.base_url}/exchange/v1/derivatives/futures/data/instrument?pair={pair}"
-        response = requests.get(url)
+        response = self.http.get(url)
         return response.json()
     
     def get_orderbook(self, pair: str, depth: int = 50) -> dict:
@@ -186,13 +227,13 @@ class CoinDCXFutures:
             depth: Orderbook depth (10, 20, or 50)
         """
         url = f"https://public.coindcx.com/market_data/v3/orderbook/{pair}-futures/{depth}"
-        response = requests.get(url)
+        response = self.http.get(url)
         return response.json()
     
     def get_trades(self, pair: str) -> List[dict]:
         """Get recent trades for an instrument"""
         url = f"{self.base_url}/exchange/v1/derivatives/futures/data/trades?pair={pair}"
-        response = requests.get(url)
+        response = self.http.get(url)
         return response.json()
     
     def get_candlesticks(self, pair: str, resolution: str, from_time: int, to_time: int) -> dict:
@@ -213,7 +254,7 @@ class CoinDCXFutures:
             "resolution": resolution,
             "pcode": "f"
         }
-        response = requests.get(url, params=params)
+        response = self.http.get(url, params=params)
         return response.json()
     
     # ============= Order Management Methods =============
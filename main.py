@@ -7,7 +7,11 @@ Self-contained version with all dependencies bundled.
 
 import os
 import sys
+import atexit
+import queue
 import logging
+from logging.handlers import QueueHandler, QueueListener
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from dotenv import load_dotenv
 
@@ -25,18 +29,50 @@ from utils.db import Database
 
 
 # Configure logging
+# Callers only enqueue records; a background listener thread does the
+# file/console writes. The QueueHandler formats each record, so the
+# listener's handlers keep the default '%(message)s' formatter.
+log_queue = queue.Queue(-1)
+log_listener = QueueListener(
+    log_queue,
+    logging.FileHandler('hedge_bot.log'),
+    logging.StreamHandler(),
+    respect_handler_level=True
+)
+log_listener.start()
+atexit.register(log_listener.stop)
+
 logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('hedge_bot.log'),
-        logging.StreamHandler()
-    ]
+    handlers=[QueueHandler(log_queue)]
 )
 
 logger = logging.getLogger(__name__)
 
 
+def _init_database():
+    """
+    Connect to PostgreSQL and create tables (database is optional).
+
+    Returns:
+        Connected Database instance, or None if not available
+    """
+    try:
+        db = Database()
+        db.connect()  # Try to connect
+        if db.is_connected():
+            db.create_tables()  # Create tables if they don't exist
+            logger.info("Database connection established")
+            print("✓ Database connected")
+            return db
+        logger.info("Database not configured - continuing without it")
+    except Exception as e:
+        logger.info(f"Database not available: {e}")
+        print("ℹ️  Database not configured (optional)")
+    return None
+
+
 def main():
     """Main entry point for the hedge trading bot."""
 
@@ -50,7 +86,11 @@ def main():
     """)
 
     db = None  # Initialize db variable
+    startup_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="startup")
     try:
+        # Kick off DB connect + schema setup while credentials are checked
+        db_future = startup_pool.submit(_init_database)
+
         # Get API credentials from environment
         bybit_api_key = os.getenv('BYBIT_API_KEY')
         bybit_api_secret = os.getenv('BYBIT_API_SECRET')
@@ -66,26 +106,14 @@ def main():
             print("  - COINDCX_API_KEY")
             print("  - COINDCX_API_SECRET")
             print("\nPlease set these in your .env file and try again.")
+            db = db_future.result()  # Let finally close it
             return 1
 
         # Get testnet flag
         use_testnet = os.getenv('BYBIT_TESTNET', 'true').lower() == 'true'
 
-        # Initialize database (optional)
-        db = None
-        try:
-            db = Database()
-            db.connect()  # Try to connect
-            if db.is_connected():
-                db.create_tables()  # Create tables if they don't exist
-                logger.info("Database connection established")
-                print("✓ Database connected")
-            else:
-                logger.info("Database not configured - continuing without it")
-        except Exception as e:
-            logger.info(f"Database not available: {e}")
-            print("ℹ️  Database not configured (optional)")
-            db = None
+        # Initialize database (optional) - started above
+        db = db_future.result()
 
         # Initialize and run bot
         print("\nInitializing bot...")
@@ -119,6 +147,7 @@ def main():
 
     finally:
         # Cleanup
+        startup_pool.shutdown(wait=False)
         if db:
             db.close()
 
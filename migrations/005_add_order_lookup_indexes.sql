@@ -0,0 +1,99 @@
+-- ============================================================================
+-- Migration: 005_add_order_lookup_indexes.sql
+-- Description: Add indexes for the per-order status / modify / cancel lookups
+-- Date: 2025-10-16
+-- Author: Trading Operations Team
+-- ============================================================================
+
+-- Purpose:
+-- OrderManager polls order status every second while orders are open:
+--
+--   SELECT status FROM orders WHERE order_id = %s
+--   SELECT event_type FROM order_lifecycle_log
+--   WHERE order_id = %s ORDER BY timestamp DESC LIMIT 1
+--
+-- and the modify / cancel paths UPDATE orders by order_id. Without a
+-- composite index the lifecycle lookup has to sort every event for the
+-- order, and each retry pays that cost again.
+--
+-- NOTE: CREATE INDEX CONCURRENTLY cannot run inside a transaction block.
+-- Run this file with plain psql (no -1 / --single-transaction):
+--
+--   psql -h $DB_HOST -U $DB_USER -d $DB_NAME -f migrations/005_add_order_lookup_indexes.sql
+--
+-- If a CONCURRENTLY build fails, the index is left INVALID - drop it and
+-- re-run. ON_ERROR_STOP makes psql stop at the first failure.
+--
+-- ROLLBACK: Run 005_rollback_order_lookup_indexes.sql
+
+\set ON_ERROR_STOP on
+
+-- ============================================================================
+-- Lifecycle Log: latest event per order
+-- ============================================================================
+
+-- Covering index: (order_id, timestamp DESC) satisfies ORDER BY ... LIMIT 1
+-- without a sort, INCLUDE (event_type) makes it an index-only scan.
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_lifecycle_order_ts
+ON order_lifecycle_log (order_id, timestamp DESC)
+INCLUDE (event_type);
+
+COMMENT ON INDEX idx_lifecycle_order_ts IS
+'Covering index for the latest lifecycle event of an order.
+Used by OrderManager._check_order_status_from_db.';
+
+-- ============================================================================
+-- Orders: lookup by exchange order ID
+-- ============================================================================
+
+-- postgresql_schema.sql already creates this; Database.create_tables does not
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_orders_order_id
+ON orders (order_id);
+
+COMMENT ON INDEX idx_orders_order_id IS
+'Lookup by exchange order ID.
+Used by status checks, modifications and cancellations in OrderManager.';
+
+-- ============================================================================
+-- Verification
+-- ============================================================================
+
+DO $$
+DECLARE
+    idx_count INTEGER;
+BEGIN
+    -- Only valid indexes count: a failed CONCURRENTLY build leaves an
+    -- INVALID one behind under the same name
+    SELECT COUNT(*) INTO idx_count
+    FROM pg_index i
+    JOIN pg_class c ON c.oid = i.indexrelid
+    WHERE c.relname IN (
+        'idx_lifecycle_order_ts',
+        'idx_orders_order_id'
+    )
+      AND i.indisvalid;
+
+    IF idx_count = 2 THEN
+        RAISE NOTICE '✅ All 2 indexes created successfully';
+    ELSE
+        RAISE WARNING '⚠️  Expected 2 valid indexes, found %', idx_count;
+    END IF;
+END $$;
+
+-- Verify the planner uses them (expect "Index Only Scan using idx_lifecycle_order_ts"
+-- with no Sort node, and "Index Scan using idx_orders_order_id"):
+/*
+EXPLAIN ANALYZE
+SELECT event_type
+FROM order_lifecycle_log
+WHERE order_id = 'your-order-id'
+ORDER BY timestamp DESC
+LIMIT 1;
+
+EXPLAIN ANALYZE
+SELECT status FROM orders WHERE order_id = 'your-order-id';
+*/
+
+-- ============================================================================
+-- Migration Complete
+-- ============================================================================
@@ -0,0 +1,16 @@
+-- ============================================================================
+-- Rollback: 005_rollback_order_lookup_indexes.sql
+-- Description: Remove order lookup indexes added in migration 005
+-- Date: 2025-10-16
+-- Author: Trading Operations Team
+-- ============================================================================
+
+-- NOTE: Run with plain psql (no -1 / --single-transaction), same as 005.
+
+DROP INDEX CONCURRENTLY IF EXISTS idx_lifecycle_order_ts;
+
+-- idx_orders_order_id is kept: postgresql_schema.sql creates it as well
+
+-- ============================================================================
+-- Rollback Complete
+-- ============================================================================
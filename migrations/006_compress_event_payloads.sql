@@ -0,0 +1,65 @@
+-- ============================================================================
+-- Migration: 006_compress_event_payloads.sql
+-- Description: Cheaper raw_payload storage on the WebSocket event tables
+-- Date: 2025-10-17
+-- Author: Trading Operations Team
+-- ============================================================================
+
+-- Purpose:
+-- OrderMonitor writes the complete WebSocket message into raw_payload for
+-- every event (migration 003). Past a few hundred events/s most of the
+-- insert cost is that payload:
+--
+--   - the GIN index on raw_payload adds one entry per JSON key/value to
+--     every insert (and to WAL), yet no code path queries the payload -
+--     it is kept for debugging / replay only
+--   - payloads are compressed with pglz by default; lz4 compresses faster
+--     and is cheaper to decompress when an event is read back
+--
+-- NOTE: COMPRESSION requires PostgreSQL 14+ built with lz4. It applies to
+-- newly written rows only; existing rows keep pglz until rewritten.
+-- DROP INDEX CONCURRENTLY cannot run inside a transaction block. Run this
+-- file with plain psql (no -1 / --single-transaction):
+--
+--   psql -h $DB_HOST -U $DB_USER -d $DB_NAME -f migrations/006_compress_event_payloads.sql
+--
+-- ROLLBACK: Run 006_rollback_compress_event_payloads.sql
+
+-- ============================================================================
+-- Drop unused payload GIN indexes
+-- ============================================================================
+
+DROP INDEX CONCURRENTLY IF EXISTS idx_bybit_events_payload;
+DROP INDEX CONCURRENTLY IF EXISTS idx_coindcx_events_payload;
+
+-- ============================================================================
+-- lz4 TOAST compression for raw_payload
+-- ============================================================================
+
+ALTER TABLE bybit_order_events ALTER COLUMN raw_payload SET COMPRESSION lz4;
+ALTER TABLE coindcx_order_events ALTER COLUMN raw_payload SET COMPRESSION lz4;
+
+-- ============================================================================
+-- Verification
+-- ============================================================================
+
+DO $$
+DECLARE
+    lz4_count INTEGER;
+BEGIN
+    SELECT COUNT(*) INTO lz4_count
+    FROM pg_attribute
+    WHERE attrelid IN ('bybit_order_events'::regclass, 'coindcx_order_events'::regclass)
+      AND attname = 'raw_payload'
+      AND attcompression = 'l';
+
+    IF lz4_count = 2 THEN
+        RAISE NOTICE '✅ raw_payload uses lz4 compression on both event tables';
+    ELSE
+        RAISE WARNING '⚠️  Expected lz4 on 2 raw_payload columns, found %', lz4_count;
+    END IF;
+END $$;
+
+-- ============================================================================
+-- Migration Complete
+-- ============================================================================
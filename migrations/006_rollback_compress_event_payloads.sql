@@ -0,0 +1,22 @@
+-- ============================================================================
+-- Rollback: 006_rollback_compress_event_payloads.sql
+-- Description: Restore default payload compression and GIN indexes
+-- Date: 2025-10-17
+-- Author: Trading Operations Team
+-- ============================================================================
+
+-- NOTE: Run with plain psql (no -1 / --single-transaction), same as 006.
+
+ALTER TABLE bybit_order_events ALTER COLUMN raw_payload SET COMPRESSION default;
+ALTER TABLE coindcx_order_events ALTER COLUMN raw_payload SET COMPRESSION default;
+
+-- Restore the payload indexes from migration 003
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_bybit_events_payload
+    ON bybit_order_events USING gin(raw_payload);
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_coindcx_events_payload
+    ON coindcx_order_events USING gin(raw_payload);
+
+-- ============================================================================
+-- Rollback Complete
+-- ============================================================================
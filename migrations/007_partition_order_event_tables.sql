@@ -0,0 +1,211 @@
+-- ============================================================================
+-- Migration: 007_partition_order_event_tables.sql
+-- Description: Range-partition the WebSocket event tables by month
+-- Date: 2025-10-17
+-- Author: Trading Operations Team
+-- ============================================================================
+
+-- Purpose:
+-- bybit_order_events / coindcx_order_events are append-only and never
+-- pruned. As they grow, every insert pays for deeper btrees on all of
+-- their indexes. Partitioning by month keeps inserts on the current,
+-- small partition, and old months can be detached/archived as a unit.
+--
+-- Partition key is event_received_at (local receive time, set on every
+-- insert). order_created_time is a nullable exchange-side BIGINT, and all
+-- event queries already filter/sort by event_received_at.
+--
+-- Steps (per table):
+--   1. Rename the existing table (and its indexes) to *_legacy
+--   2. Create the partitioned table with the same columns; the primary
+--      key has to include the partition key: (id, event_received_at)
+--   3. Attach the legacy table as the partition for everything up to the
+--      end of the current month
+--   4. Create monthly partitions from next month on with
+--      create_order_event_partitions() - Database.create_tables() calls
+--      it on every bot start, and pg_cron runs it monthly if installed
+--   5. A DEFAULT partition catches rows past the last monthly partition
+--      (bot not restarted and no pg_cron), so inserts never fail; the
+--      next create_order_event_partitions() run moves them out
+--
+-- Columns are copied INCLUDING COMPRESSION, so raw_payload keeps the lz4
+-- compression from migration 006 on the parent and every new partition.
+--
+-- NOTE: Step 3 validates every legacy row (one full scan per table, under
+-- lock). Run this with the bot stopped:
+--
+--   psql -h $DB_HOST -U $DB_USER -d $DB_NAME -1 -f migrations/007_partition_order_event_tables.sql
+--
+-- Requires migration 003 (event tables) and PostgreSQL 14+ (INCLUDING COMPRESSION).
+--
+-- ROLLBACK: Run 007_rollback_partition_order_event_tables.sql
+
+-- ============================================================================
+-- Partition maintenance function
+-- ============================================================================
+
+-- Creates monthly partitions of both event tables from next month up to
+-- months_ahead months out. Idempotent - existing partitions are
+-- skipped. Rows that already landed in the DEFAULT partition for a new
+-- month are moved into it (a DEFAULT partition holding rows in the range
+-- would make a plain CREATE ... PARTITION OF fail).
+CREATE OR REPLACE FUNCTION create_order_event_partitions(months_ahead INTEGER DEFAULT 2)
+RETURNS VOID AS $$
+DECLARE
+    tbl TEXT;
+    part TEXT;
+    month_start DATE;
+    month_end DATE;
+    i INTEGER;
+BEGIN
+    FOREACH tbl IN ARRAY ARRAY['bybit_order_events', 'coindcx_order_events'] LOOP
+        FOR i IN 1..months_ahead LOOP
+            month_start := (date_trunc('month', CURRENT_DATE) + make_interval(months => i))::DATE;
+            month_end := (month_start + INTERVAL '1 month')::DATE;
+            part := tbl || '_' || to_char(month_start, 'YYYY_MM');
+            CONTINUE WHEN to_regclass(part) IS NOT NULL;
+
+            EXECUTE format(
+                'CREATE TABLE %I (LIKE %I INCLUDING DEFAULTS INCLUDING CONSTRAINTS INCLUDING COMPRESSION)',
+                part, tbl
+            );
+            EXECUTE format(
+                'WITH moved AS (DELETE FROM %I WHERE event_received_at >= %L AND event_received_at < %L RETURNING *) '
+                'INSERT INTO %I SELECT * FROM moved',
+                tbl || '_default', month_start, month_end, part
+            );
+            EXECUTE format(
+                'ALTER TABLE %I ATTACH PARTITION %I FOR VALUES FROM (%L) TO (%L)',
+                tbl, part, month_start, month_end
+            );
+        END LOOP;
+    END LOOP;
+END;
+$$ LANGUAGE plpgsql;
+
+-- ============================================================================
+-- Convert both event tables
+-- ============================================================================
+
+DO $$
+DECLARE
+    tbl TEXT;
+    idx RECORD;
+    legacy_end DATE := (date_trunc('month', CURRENT_DATE) + INTERVAL '1 month')::DATE;
+BEGIN
+    FOREACH tbl IN ARRAY ARRAY['bybit_order_events', 'coindcx_order_events'] LOOP
+        -- 1. Move the existing table and its indexes out of the way
+        EXECUTE format('ALTER TABLE %I RENAME TO %I', tbl, tbl || '_legacy');
+        FOR idx IN
+            SELECT indexname FROM pg_indexes WHERE tablename = tbl || '_legacy'
+        LOOP
+            EXECUTE format('ALTER INDEX %I RENAME TO %I', idx.indexname, idx.indexname || '_legacy');
+        END LOOP;
+
+        -- Range partitions can't hold a NULL key (column only had a default)
+        EXECUTE format(
+            'UPDATE %I SET event_received_at = COALESCE(to_timestamp(order_updated_time / 1000.0), ''epoch'') '
+            'WHERE event_received_at IS NULL',
+            tbl || '_legacy'
+        );
+        EXECUTE format('ALTER TABLE %I ALTER COLUMN event_received_at SET NOT NULL', tbl || '_legacy');
+
+        -- 2. Partitioned table with the same columns (id keeps its sequence)
+        EXECUTE format(
+            'CREATE TABLE %I (LIKE %I INCLUDING DEFAULTS INCLUDING CONSTRAINTS INCLUDING COMPRESSION) '
+            'PARTITION BY RANGE (event_received_at)',
+            tbl, tbl || '_legacy'
+        );
+        EXECUTE format('ALTER TABLE %I ALTER COLUMN event_received_at SET NOT NULL', tbl);
+        EXECUTE format('ALTER TABLE %I ADD PRIMARY KEY (id, event_received_at)', tbl);
+        -- The legacy table may be dropped once archived; don't take the sequence with it
+        EXECUTE format('ALTER SEQUENCE %I OWNED BY %I.id', tbl || '_id_seq', tbl);
+
+        -- 3. Existing rows become the first partition
+        EXECUTE format(
+            'ALTER TABLE %I ATTACH PARTITION %I FOR VALUES FROM (MINVALUE) TO (%L)',
+            tbl, tbl || '_legacy', legacy_end
+        );
+
+        -- 5. Catch-all for rows past the last monthly partition
+        EXECUTE format('CREATE TABLE %I PARTITION OF %I DEFAULT', tbl || '_default', tbl);
+    END LOOP;
+END $$;
+
+-- ============================================================================
+-- Indexes (created on every partition, current and future)
+-- ============================================================================
+
+-- One lookup index per table: the covering (order_id, event_received_at)
+-- index serves both the 003 order_id lookups and the partial-fill reads
+CREATE INDEX IF NOT EXISTS idx_bybit_events_order_fill
+    ON bybit_order_events(order_id, event_received_at DESC)
+    INCLUDE (cum_exec_qty, avg_price, cum_exec_fee);
+CREATE INDEX IF NOT EXISTS idx_bybit_events_chunk_group
+    ON bybit_order_events(chunk_group_id, chunk_sequence);
+CREATE INDEX IF NOT EXISTS idx_bybit_events_timestamp
+    ON bybit_order_events(event_received_at DESC);
+CREATE INDEX IF NOT EXISTS idx_bybit_events_type
+    ON bybit_order_events(event_type);
+
+CREATE INDEX IF NOT EXISTS idx_coindcx_events_order_fill
+    ON coindcx_order_events(order_id, event_received_at DESC)
+    INCLUDE (total_quantity, remaining_quantity, avg_price, fee_amount);
+CREATE INDEX IF NOT EXISTS idx_coindcx_events_chunk_group
+    ON coindcx_order_events(chunk_group_id, chunk_sequence);
+CREATE INDEX IF NOT EXISTS idx_coindcx_events_timestamp
+    ON coindcx_order_events(event_received_at DESC);
+CREATE INDEX IF NOT EXISTS idx_coindcx_events_type
+    ON coindcx_order_events(event_type);
+
+-- ============================================================================
+-- Monthly partitions
+-- ============================================================================
+
+SELECT create_order_event_partitions(2);
+
+-- Keep two months ahead automatically when pg_cron is available
+DO $$
+BEGIN
+    IF EXISTS (SELECT 1 FROM pg_extension WHERE extname = 'pg_cron') THEN
+        PERFORM cron.schedule(
+            'order-event-partitions',
+            '0 0 1 * *',
+            'SELECT create_order_event_partitions(2)'
+        );
+        RAISE NOTICE '✅ pg_cron job order-event-partitions scheduled';
+    ELSE
+        RAISE NOTICE 'ℹ️  pg_cron not installed - partitions are created by the bot on startup';
+    END IF;
+END $$;
+
+-- ============================================================================
+-- Verification
+-- ============================================================================
+
+DO $$
+DECLARE
+    part_count INTEGER;
+BEGIN
+    SELECT COUNT(*) INTO part_count
+    FROM pg_inherits
+    WHERE inhparent IN ('bybit_order_events'::regclass, 'coindcx_order_events'::regclass);
+
+    -- Per table: legacy + 2 monthly + default
+    IF part_count >= 8 THEN
+        RAISE NOTICE '✅ Event tables partitioned (% partitions)', part_count;
+    ELSE
+        RAISE WARNING '⚠️  Expected at least 8 partitions, found %', part_count;
+    END IF;
+END $$;
+
+-- Archiving a month (example):
+/*
+ALTER TABLE bybit_order_events DETACH PARTITION bybit_order_events_2025_11;
+-- pg_dump -t bybit_order_events_2025_11 ... then
+DROP TABLE bybit_order_events_2025_11;
+*/
+
+-- ============================================================================
+-- Migration Complete
+-- ============================================================================
@@ -0,0 +1,67 @@
+-- ============================================================================
+-- Rollback: 007_rollback_partition_order_event_tables.sql
+-- Description: Turn the partitioned event tables back into plain tables
+-- Date: 2025-10-17
+-- Author: Trading Operations Team
+-- ============================================================================
+
+-- NOTE: Copies every event row. Run with the bot stopped:
+--
+--   psql -h $DB_HOST -U $DB_USER -d $DB_NAME -1 -f migrations/007_rollback_partition_order_event_tables.sql
+
+DO $$
+BEGIN
+    IF EXISTS (SELECT 1 FROM cron.job WHERE jobname = 'order-event-partitions') THEN
+        PERFORM cron.unschedule('order-event-partitions');
+    END IF;
+EXCEPTION
+    WHEN undefined_table OR invalid_schema_name THEN
+        -- pg_cron not installed
+        NULL;
+END $$;
+
+DO $$
+DECLARE
+    tbl TEXT;
+BEGIN
+    FOREACH tbl IN ARRAY ARRAY['bybit_order_events', 'coindcx_order_events'] LOOP
+        EXECUTE format('ALTER TABLE %I RENAME TO %I', tbl, tbl || '_partitioned');
+        EXECUTE format(
+            'CREATE TABLE %I (LIKE %I INCLUDING DEFAULTS INCLUDING CONSTRAINTS INCLUDING COMPRESSION)',
+            tbl, tbl || '_partitioned'
+        );
+        EXECUTE format('ALTER TABLE %I ALTER COLUMN event_received_at DROP NOT NULL', tbl);
+        EXECUTE format('INSERT INTO %I SELECT * FROM %I', tbl, tbl || '_partitioned');
+        EXECUTE format('ALTER TABLE %I ADD PRIMARY KEY (id)', tbl);
+        EXECUTE format('ALTER SEQUENCE %I OWNED BY %I.id', tbl || '_id_seq', tbl);
+        EXECUTE format('DROP TABLE %I', tbl || '_partitioned');
+    END LOOP;
+END $$;
+
+DROP FUNCTION IF EXISTS create_order_event_partitions(INTEGER);
+
+-- Restore the migration 003 indexes; the covering order_fill index stands
+-- in for 003's idx_*_events_order_id (same key columns)
+CREATE INDEX IF NOT EXISTS idx_bybit_events_order_fill
+    ON bybit_order_events(order_id, event_received_at DESC)
+    INCLUDE (cum_exec_qty, avg_price, cum_exec_fee);
+CREATE INDEX IF NOT EXISTS idx_bybit_events_chunk_group
+    ON bybit_order_events(chunk_group_id, chunk_sequence);
+CREATE INDEX IF NOT EXISTS idx_bybit_events_timestamp
+    ON bybit_order_events(event_received_at DESC);
+CREATE INDEX IF NOT EXISTS idx_bybit_events_type
+    ON bybit_order_events(event_type);
+
+CREATE INDEX IF NOT EXISTS idx_coindcx_events_order_fill
+    ON coindcx_order_events(order_id, event_received_at DESC)
+    INCLUDE (total_quantity, remaining_quantity, avg_price, fee_amount);
+CREATE INDEX IF NOT EXISTS idx_coindcx_events_chunk_group
+    ON coindcx_order_events(chunk_group_id, chunk_sequence);
+CREATE INDEX IF NOT EXISTS idx_coindcx_events_timestamp
+    ON coindcx_order_events(event_received_at DESC);
+CREATE INDEX IF NOT EXISTS idx_coindcx_events_type
+    ON coindcx_order_events(event_type);
+
+-- ============================================================================
+-- Rollback Complete
+-- ============================================================================
@@ -0,0 +1,112 @@
+-- ============================================================================
+-- Migration: 008_cover_event_order_index.sql
+-- Description: Make the event tables' order_id index covering, drop the duplicate
+-- Date: 2025-10-18
+-- Author: Trading Operations Team
+-- ============================================================================
+
+-- Purpose:
+-- Partial-fill lookups read the latest fill snapshot of an order:
+--
+--   SELECT cum_exec_qty, avg_price, cum_exec_fee FROM bybit_order_events
+--   WHERE order_id = $1 ORDER BY event_received_at DESC LIMIT 1
+--
+-- idx_*_events_order_fill covers that as an index-only scan. It has the
+-- same key columns (order_id, event_received_at DESC) as migration 003's
+-- idx_*_events_order_id, so keeping both only doubles index maintenance
+-- on these append-only, write-heavy tables. This migration builds the
+-- covering index and drops the 003 one.
+--
+-- Plain tables (migration 007 not applied) are changed CONCURRENTLY, so
+-- the bot can keep running. CONCURRENTLY cannot run inside a transaction
+-- block - run this file with plain psql (no -1 / --single-transaction):
+--
+--   psql -h $DB_HOST -U $DB_USER -d $DB_NAME -f migrations/008_cover_event_order_index.sql
+--
+-- Partitioned tables (migration 007 applied) can't be indexed
+-- concurrently; there the duplicate parent index is dropped with a
+-- brief lock - run that case with the bot stopped.
+--
+-- If a CONCURRENTLY build fails, the index is left INVALID - drop it and
+-- re-run.
+--
+-- ROLLBACK: Run 008_rollback_cover_event_order_index.sql
+
+SELECT EXISTS (
+    SELECT 1 FROM pg_class
+    WHERE relname = 'bybit_order_events' AND relkind = 'p'
+) AS events_partitioned \gset
+
+\if :events_partitioned
+
+-- ============================================================================
+-- Partitioned tables (migration 007)
+-- ============================================================================
+
+CREATE INDEX IF NOT EXISTS idx_bybit_events_order_fill
+    ON bybit_order_events(order_id, event_received_at DESC)
+    INCLUDE (cum_exec_qty, avg_price, cum_exec_fee);
+DROP INDEX IF EXISTS idx_bybit_events_order_id;
+-- Left on the legacy partition by 007's rename (plain index, not inherited)
+DROP INDEX CONCURRENTLY IF EXISTS idx_bybit_events_order_id_legacy;
+
+CREATE INDEX IF NOT EXISTS idx_coindcx_events_order_fill
+    ON coindcx_order_events(order_id, event_received_at DESC)
+    INCLUDE (total_quantity, remaining_quantity, avg_price, fee_amount);
+DROP INDEX IF EXISTS idx_coindcx_events_order_id;
+DROP INDEX CONCURRENTLY IF EXISTS idx_coindcx_events_order_id_legacy;
+
+\else
+
+-- ============================================================================
+-- Plain tables
+-- ============================================================================
+
+-- Build the covering index first so order_id lookups always have one
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_bybit_events_order_fill
+    ON bybit_order_events(order_id, event_received_at DESC)
+    INCLUDE (cum_exec_qty, avg_price, cum_exec_fee);
+DROP INDEX CONCURRENTLY IF EXISTS idx_bybit_events_order_id;
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_coindcx_events_order_fill
+    ON coindcx_order_events(order_id, event_received_at DESC)
+    INCLUDE (total_quantity, remaining_quantity, avg_price, fee_amount);
+DROP INDEX CONCURRENTLY IF EXISTS idx_coindcx_events_order_id;
+
+\endif
+
+COMMENT ON INDEX idx_bybit_events_order_fill IS
+'Covering index for order_id lookups and the latest fill snapshot of an order.
+Used by OrderManager._get_partial_fill_details and Database.complete_partial_with_event.';
+COMMENT ON INDEX idx_coindcx_events_order_fill IS
+'Covering index for order_id lookups and the latest fill snapshot of an order.
+Used by OrderManager._get_partial_fill_details and Database.complete_partial_with_event.';
+
+-- ============================================================================
+-- Verification
+-- ============================================================================
+
+DO $$
+DECLARE
+    fill_count INTEGER;
+    dup_count INTEGER;
+BEGIN
+    SELECT COUNT(*) INTO fill_count
+    FROM pg_indexes
+    WHERE indexname IN ('idx_bybit_events_order_fill', 'idx_coindcx_events_order_fill');
+
+    SELECT COUNT(*) INTO dup_count
+    FROM pg_indexes
+    WHERE indexname IN ('idx_bybit_events_order_id', 'idx_coindcx_events_order_id');
+
+    IF fill_count = 2 AND dup_count = 0 THEN
+        RAISE NOTICE '✅ Covering order indexes in place, duplicates dropped';
+    ELSE
+        RAISE WARNING '⚠️  Expected 2 covering and 0 duplicate indexes, found % and %',
+            fill_count, dup_count;
+    END IF;
+END $$;
+
+-- ============================================================================
+-- Migration Complete
+-- ============================================================================
@@ -0,0 +1,35 @@
+-- ============================================================================
+-- Rollback: 008_rollback_cover_event_order_index.sql
+-- Description: Restore migration 003's order_id index on the event tables
+-- Date: 2025-10-18
+-- Author: Trading Operations Team
+-- ============================================================================
+
+-- NOTE: Run with plain psql (no -1 / --single-transaction), same as 008.
+-- The covering idx_*_events_order_fill index is kept - the partial-fill
+-- lookups read from it.
+
+SELECT EXISTS (
+    SELECT 1 FROM pg_class
+    WHERE relname = 'bybit_order_events' AND relkind = 'p'
+) AS events_partitioned \gset
+
+\if :events_partitioned
+
+CREATE INDEX IF NOT EXISTS idx_bybit_events_order_id
+    ON bybit_order_events(order_id, event_received_at DESC);
+CREATE INDEX IF NOT EXISTS idx_coindcx_events_order_id
+    ON coindcx_order_events(order_id, event_received_at DESC);
+
+\else
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_bybit_events_order_id
+    ON bybit_order_events(order_id, event_received_at DESC);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_coindcx_events_order_id
+    ON coindcx_order_events(order_id, event_received_at DESC);
+
+\endif
+
+-- ============================================================================
+-- Rollback Complete
+-- ============================================================================
@@ -5,10 +5,22 @@ Monitors order status and updates database in real-time
 """
 
 import os
+import io
+import math
+import queue
+import logging
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 import psycopg2
+from psycopg2 import errors as pg_errors
 from psycopg2.extras import RealDictCursor
+from psycopg2.pool import ThreadedConnectionPool
+from contextlib import contextmanager
+from functools import cached_property
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
 import time
 import json
+from collections import OrderedDict, deque
 from dotenv import load_dotenv
 import threading
 import asyncio
@@ -23,35 +35,271 @@ from exchange_clients.coindcx.coindcx_futures import CoinDCXFutures
 
 # Import WebSocket logger
 from utils.websocket_order_logger import WebSocketOrderLogger
+from utils.db import Database, PreparedConnection
+from config.symbol_config import SymbolConfig
 
 # Import ChunkManager from current package (not needed for bot integration)
 # from enhanced_bot_copy import ChunkManager
 
 load_dotenv()
 
+# Per-event messages (updates, event log failures) go through this logger;
+# interactive progress output stays on print()
+logger = logging.getLogger("order_monitor")
+
+# Optional fast JSON codec for raw WebSocket payloads (CoinDCX order lists
+# in, event log payloads out) - falls back to stdlib
+try:
+    import orjson
+
+    def _dumps_payload(obj) -> str:
+        return orjson.dumps(obj).decode()
+    _json_loads = orjson.loads
+except ImportError:
+    _dumps_payload = json.dumps
+    _json_loads = json.loads
+
+# Bound once for the per-event paths
+_monotonic = time.monotonic
+
+def _opt_float(value):
+    """float(value), or None if the WebSocket field is missing or falsy."""
+    return float(value) if value else None
+
+def _scaled_price_qty(price, quantity):
+    """
+    (price, quantity) as integers in 1e-8 units, the scale of the orders
+    price/quantity columns (DECIMAL(20,8)); NULL stays None.
+
+    Exchange values with more decimals than the columns compare equal to
+    the stored (rounded) value, and the comparison is exact.
+    """
+    return (None if price is None else round(float(price) * 100_000_000),
+            None if quantity is None else round(float(quantity) * 100_000_000))
+
+# Bybit orderStatus of a closed order -> orders.status (REST polling)
+_BYBIT_FINAL_STATUSES = {
+    'Filled': 'FILLED',
+    'Cancelled': 'CANCELLED',
+    'PartiallyFilledCanceled': 'CANCELLED',
+    'Deactivated': 'CANCELLED',
+    'Rejected': 'REJECTED',
+}
+
+def _bybit_symbol(symbol):
+    """Bybit spot symbol for an orders.symbol value ('ETH' or 'ETHUSDT'), None if unknown."""
+    if not symbol:
+        return None
+    symbol = symbol.upper()
+    config = SymbolConfig.SYMBOLS.get(symbol)
+    if config:
+        return config['bybit_symbol']
+    return symbol if symbol.endswith('USDT') else None
+
+def _opt_int(value):
+    """int(value), or None if the WebSocket field is missing or falsy."""
+    return int(value) if value else None
+
+def _copy_line(row) -> str:
+    """Encode one row as a COPY text-format line (tab separated, \\N for NULL)."""
+    return '\t'.join(
+        '\\N' if value is None else
+        str(value).replace('\\', '\\\\').replace('\t', '\\t')
+                  .replace('\n', '\\n').replace('\r', '\\r')
+        for value in row
+    ) + '\n'
+
+# Status-specific detail appended to the Bybit order event summary
+def _bybit_filled_summary(order) -> str:
+    return (f" | Fill @ ${order.get('avgPrice', 0)} | Qty: {order.get('cumExecQty', 0)}"
+            f" | Fee: {order.get('cumExecFee', 0)}")
+
+def _bybit_rejected_summary(order) -> str:
+    return f" | Reason: {order.get('rejectReason', 'Unknown')}"
+
+def _bybit_new_summary(order) -> str:
+    return f" | Price: ${order.get('price', 0)} | Qty: {order.get('qty', 0)}"
+
+_BYBIT_SUMMARY_DETAILS = {
+    'Filled': _bybit_filled_summary,
+    'Rejected': _bybit_rejected_summary,
+    'New': _bybit_new_summary,
+}
+
 class OrderMonitor:
+    # Append-only event log tables: exchange -> (table, columns)
+    EVENT_TABLES = {
+        'bybit': ('bybit_order_events', (
+            'order_id', 'symbol', 'event_type', 'order_status',
+            'side', 'order_type', 'price', 'qty',
+            'cum_exec_qty', 'cum_exec_fee', 'cum_exec_value', 'avg_price',
+            'time_in_force', 'reject_reason',
+            'order_created_time', 'order_updated_time',
+            'raw_payload',
+            'chunk_group_id', 'chunk_sequence', 'chunk_total'
+        )),
+        'coindcx': ('coindcx_order_events', (
+            'order_id', 'pair', 'event_type', 'order_status',
+            'side', 'order_type', 'price', 'total_quantity', 'remaining_quantity',
+            'avg_price', 'fee_amount',
+            'raw_payload',
+            'chunk_group_id', 'chunk_sequence', 'chunk_total'
+        )),
+    }
+    # Small batches go out as multi-row INSERTs, larger ones through COPY
+    EVENT_INSERT_SQL = {
+        exchange: f"INSERT INTO {table} ({', '.join(columns)}) VALUES %s"
+        for exchange, (table, columns) in EVENT_TABLES.items()
+    }
+    EVENT_ROW_TEMPLATE = {
+        exchange: '(' + ', '.join(['%s'] * len(columns)) + ')'
+        for exchange, (table, columns) in EVENT_TABLES.items()
+    }
+    EVENT_COPY_SQL = {
+        exchange: f"COPY {table} ({', '.join(columns)}) FROM STDIN"
+        for exchange, (table, columns) in EVENT_TABLES.items()
+    }
+    EVENT_FLUSH_INTERVAL = 0.05  # Seconds between event log flushes
+    EVENT_FLUSH_BATCH = 500      # Flush early once this many events are buffered
+    EVENT_COPY_MIN_ROWS = 100    # COPY only pays off above this batch size
+    EVENT_BUFFER_MAX = 100_000   # Drop new events beyond this backlog
+    EVENT_RETRY_DELAY = 1.0      # Seconds to wait before re-flushing after a connection error
+    REJECTION_CACHE_MAX = 10_000 # Recent rejections kept for OrderManager lookups
+    REJECTION_TTL = 60  # Seconds a WebSocket rejection stays visible
+    CHUNK_CONTEXT_CACHE_MAX = 50_000  # Orders whose chunk context is kept in memory
+    CHUNK_CONTEXT_MISS_TTL = 5.0  # Seconds an order with no DB row is not looked up again
+    PRICE_QTY_CACHE_MAX = 4096   # Orders whose stored price/quantity is kept in memory
+    ORDER_DETAIL_CACHE_MAX = 1024  # Terminal orders whose exchange details are kept in memory
+    COINDCX_OPEN_STATUSES = frozenset({'initial', 'open'})  # Resting CoinDCX orders
+    # Exchange order states that never change again (Bybit, CoinDCX)
+    TERMINAL_ORDER_STATUSES = frozenset({
+        'Filled', 'Cancelled', 'Rejected', 'PartiallyFilledCanceled',
+        'filled', 'cancelled', 'rejected'
+    })
+    NOTIFY_DEDUP_WINDOW = 2.0    # Seconds an identical ChunkManager notification is suppressed
+    NOTIFY_DEDUP_MAX = 2048      # Recent notifications remembered for deduplication
+    STATUS_CACHE_TTL = 30        # Seconds show_status may reuse its output while no order changed
+    BYBIT_WS_STALE_AFTER = 30    # Seconds without Bybit WebSocket messages before REST polling resumes
+    DB_POOL_MIN = 2              # Order state connections kept open
+    DB_POOL_MAX = 10             # One per concurrent WebSocket/REST thread, with headroom
+
+    _STATUS_UPDATE_SQL = """
+        WITH updated AS (
+            UPDATE orders
+            SET status = $1{set_extra}
+            WHERE order_id = $2
+            RETURNING order_id, status, chunk_group_id, chunk_sequence, exchange, side, quantity
+        ), lifecycle AS (
+            INSERT INTO order_lifecycle_log (
+                chunk_group_id, chunk_sequence, exchange, order_id,
+                event_type, event_details, timestamp
+            )
+            SELECT chunk_group_id, chunk_sequence, exchange, order_id,
+                   status, {details}, NOW()
+            FROM updated
+            WHERE chunk_group_id IS NOT NULL
+        )
+        SELECT pg_notify('order_status', $2::text || ':' || $1::text)
+    """
+
+    # Hot-path statements, PREPAREd once per connection (Database.execute_prepared)
+    _PREPARED_SQL = {
+        'mon_price_qty': """
+            SELECT price, quantity FROM orders WHERE order_id = $1
+        """,
+        'mon_price_qty_many': """
+            SELECT order_id, price, quantity FROM orders WHERE order_id = ANY($1)
+        """,
+        'mon_chunk_context': """
+            SELECT chunk_group_id, chunk_sequence, chunk_total, symbol
+            FROM orders
+            WHERE order_id = $1
+        """,
+        'mon_batch_context': """
+            SELECT order_id, chunk_group_id, chunk_sequence, chunk_total
+            FROM orders
+            WHERE order_id = ANY($1)
+        """,
+        # SET expressions see the row's old values, so the previous
+        # price/quantity land in modified_* without a separate SELECT.
+        # No row is returned if the order is missing or already up to date.
+        'mon_mark_modified': """
+            UPDATE orders
+            SET price = $1, quantity = $2,
+                modified_price = price, modified_quantity = quantity,
+                modified_at = NOW(), is_modified = TRUE
+            WHERE order_id = $3
+              AND (price IS DISTINCT FROM $1 OR quantity IS DISTINCT FROM $2)
+            RETURNING modified_price, modified_quantity
+        """,
+        # Status updates: UPDATE, lifecycle log INSERT (orders that belong to
+        # a chunk) and NOTIFY in one statement / round-trip. $1 = status,
+        # $2 = order_id. The NOTIFY is delivered on commit so OrderManager
+        # can wake on LISTEN (see Database.wait_for_order_status).
+        'mon_status_filled': _STATUS_UPDATE_SQL.format(
+            set_extra=", fill_price = $3::float8, filled_at = NOW()",
+            details="""NULLIF(jsonb_strip_nulls(jsonb_build_object(
+                'fill_price', $3::float8,
+                'side', NULLIF(side, ''),
+                'quantity', NULLIF(quantity, 0)::float8
+            )), '{}'::jsonb)"""
+        ),
+        'mon_status_rejected': _STATUS_UPDATE_SQL.format(
+            set_extra=", reject_reason = $3::text, filled_at = NOW()",
+            details="""NULLIF(jsonb_strip_nulls(jsonb_build_object(
+                'reject_reason', $3::text,
+                'side', NULLIF(side, ''),
+                'quantity', NULLIF(quantity, 0)::float8
+            )), '{}'::jsonb)"""
+        ),
+        'mon_status': _STATUS_UPDATE_SQL.format(
+            set_extra="",
+            details="""NULLIF(jsonb_strip_nulls(jsonb_build_object(
+                'side', NULLIF(side, ''),
+                'quantity', NULLIF(quantity, 0)::float8
+            )), '{}'::jsonb)"""
+        ),
+        'mon_status_fees': _STATUS_UPDATE_SQL.format(
+            set_extra=""",
+                fill_price = $3::float8, filled_at = NOW(),
+                cumExecFee = $4::float8, cumExecQty = $5::float8, net_received = $6::float8""",
+            details="""jsonb_build_object(
+                'fill_price', COALESCE($3::float8, 0),
+                'side', side,
+                'quantity', COALESCE(quantity, 0)::float8,
+                'cum_exec_qty', COALESCE($5::float8, 0),
+                'cum_exec_fee', COALESCE($4::float8, 0),
+                'net_received', COALESCE($6::float8, 0)
+            )"""
+        ),
+    }
+
     def __init__(self, chunk_manager=None):
         # Initialize database with connection timeout
+        self._db_params = dict(
+            host=os.getenv('POSTGRES_HOST', 'localhost'),
+            port=os.getenv('POSTGRES_PORT', 5432),
+            database=os.getenv('POSTGRES_DB', 'hedge_bot'),
+            user=os.getenv('POSTGRES_USER', 'hedge_user'),
+            password=os.getenv('POSTGRES_PASSWORD', 'hedge_password'),
+            connect_timeout=5  # 5 second connection timeout
+        )
         try:
-            self.conn = psycopg2.connect(
-                host=os.getenv('POSTGRES_HOST', 'localhost'),
-                port=os.getenv('POSTGRES_PORT', 5432),
-                database=os.getenv('POSTGRES_DB', 'hedge_bot'),
-                user=os.getenv('POSTGRES_USER', 'hedge_user'),
-                password=os.getenv('POSTGRES_PASSWORD', 'hedge_password'),
-                connect_timeout=5  # 5 second connection timeout
+            # Order state reads/updates borrow from this pool (see _cursor);
+            # event log inserts have their own connection (_event_conn)
+            self.pool = ThreadedConnectionPool(
+                self.DB_POOL_MIN, self.DB_POOL_MAX,
+                connection_factory=PreparedConnection,
+                **self._db_params
             )
-            self.conn.autocommit = False
             print("✅ PostgreSQL database connected for Order Monitor")
-            
-            # Check if modification columns exist (but don't try to create them)
-            # This is faster than trying to alter the table every time
-            try:
-                with self.conn.cursor() as cursor:
-                    cursor.execute("SELECT modified_price FROM orders LIMIT 1")
-                print("✅ Modification columns already exist")
-            except:
-                print("⚠️  Modification columns not found - run schema setup first")
+
+            # Modification columns are trusted to exist (schema setup creates
+            # them); the first query that hits UndefinedColumn clears this
+            # and later paths skip the modified_* columns
+            self._has_modified_cols = True
+            # Same for the fee columns (cumExecFee, ...) written on fills
+            self._has_fee_cols = True
             
         except Exception as e:
             print(f"❌ Database connection failed: {e}")
@@ -70,19 +318,92 @@ class OrderMonitor:
         )
         
         self.running = True
+        # Set by close(); the polling loop waits on it instead of sleeping,
+        # so shutdown doesn't wait out the current interval
+        self._stopping = threading.Event()
+        self.bybit_websocket_active = False
         self.coindcx_websocket_active = False
+        self._coindcx_stop = None  # (loop, asyncio.Event) while the CoinDCX WebSocket thread runs
+        # Monotonic time of the last Bybit order/execution message (watchdog)
+        self._bybit_ws_last_message = 0.0
+        self._bybit_ws_stale = False
+        # Recent Bybit ChunkManager notifications: {(order_id, status, qty): monotonic time}.
+        # Only touched from the single Bybit DB worker, so no lock.
+        self._notify_dedup = OrderedDict()
+        # Bumped whenever this monitor changes an order row; show_status
+        # reuses its last output while it's unchanged (up to STATUS_CACHE_TTL)
+        self._status_version = 0
+        self._status_cache = None  # (version, monotonic time, text)
+        # Bybit orderStatus -> handler (other statuses need no DB update)
+        self._bybit_status_handlers = {
+            'Filled': self._handle_bybit_filled,
+            'Cancelled': self._handle_bybit_cancelled,
+            'Rejected': self._handle_bybit_rejected,
+            'New': self._handle_bybit_new,
+        }
 
-        # In-memory cache for recent order rejections (for fast WebSocket-based detection)
-        self.recent_rejections = {}  # {order_id: {'reason': 'EC_PostOnlyWillTakeLiquidity', 'timestamp': time.time()}}
+        # Raw WebSocket events buffered by the callbacks and written in
+        # batches on a separate connection (see _event_flush_loop)
+        self._event_buffer = deque()
+        self.events_dropped = 0
+        self._event_wakeup = threading.Event()
+        # Set by close() once the executors that log events have drained -
+        # not tied to self.running, which goes False before they finish
+        self._event_flusher_stop = threading.Event()
+        self._event_retry_at = 0.0  # Monotonic time before which flushes wait (DB unreachable)
+        self._event_conn = self._connect_event_conn()
+        self._event_flusher = threading.Thread(
+            target=self._event_flush_loop,
+            name="OrderMonitorEventFlusher",
+            daemon=True
+        )
+        self._event_flusher.start()
 
-        # Initialize WebSocket order logger
-        try:
-            log_dir = Path(__file__).parent / 'logs'
-            self.ws_logger = WebSocketOrderLogger(log_dir=str(log_dir))
-            print("✅ WebSocket Order Logger initialized")
-        except Exception as e:
-            print(f"⚠️  Warning: WebSocket logger initialization failed: {e}")
-            self.ws_logger = None
+        # CoinDCX WebSocket callbacks run on an asyncio loop; their blocking
+        # DB work runs here instead. One worker keeps updates in arrival order.
+        self._ws_db_executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="CoinDCXWebSocketDB"
+        )
+        # Same for Bybit: pybit delivers messages on its WebSocket thread, so
+        # order and execution updates are handed to one worker and the
+        # callback returns immediately (per-order ordering is preserved)
+        self._bybit_db_executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="BybitWebSocketDB"
+        )
+        # REST polling: one worker per exchange (see monitor_loop)
+        self._poll_executor = ThreadPoolExecutor(
+            max_workers=2, thread_name_prefix="OrderPoll"
+        )
+        # ChunkManager callbacks from both exchanges, delivered in order on
+        # their own worker (see _notify_chunk_manager)
+        self._notify_executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="ChunkManagerNotify"
+        )
+
+        # In-memory cache for recent order rejections (for fast WebSocket-based detection)
+        # Insertion-ordered, so expired entries are always at the front
+        self.recent_rejections = OrderedDict()  # {order_id: {'reason': 'EC_PostOnlyWillTakeLiquidity', 'timestamp': time.monotonic()}}
+
+        # Chunk context never changes once an order row exists, so found rows
+        # are cached (LRU) for the WebSocket logger: {order_id: (group, seq, total, symbol)}
+        self._chunk_context_cache = OrderedDict()
+        # Orders not in the database yet, briefly remembered so the order and
+        # execution topics of one burst don't both query: {order_id: monotonic time}
+        self._chunk_context_misses = OrderedDict()
+        self._chunk_context_lock = threading.Lock()
+
+        # Stored (price, quantity) per order, for modification checks on every
+        # WebSocket event (LRU). OrderMonitor is the only writer of these
+        # columns once an order exists, so update_order_modification keeps it current.
+        self._price_qty_cache = OrderedDict()
+        self._price_qty_lock = threading.Lock()
+
+        # Exchange details of orders in a terminal state (LRU):
+        # {(exchange, order_id): details}
+        self._order_detail_cache = OrderedDict()
+        self._order_detail_lock = threading.Lock()
+
+        # WebSocket order logger is created on first event (see ws_logger)
 
         # Use provided chunk manager or create a new one
         if chunk_manager:
@@ -92,6 +413,121 @@ class OrderMonitor:
             self.chunk_manager = None
             print("✅ Order Monitor initialized (ChunkManager not required for bot integration)")
 
+    @cached_property
+    def ws_logger(self):
+        """
+        WebSocket order logger, created on first use.
+
+        Deferred so startup doesn't create the log directory/file until a
+        WebSocket event actually needs logging. None if it can't be created.
+        ORDER_MONITOR_WS_LOG=false starts it disabled (see its enabled flag).
+        """
+        try:
+            log_dir = Path(__file__).parent / 'logs'
+            ws_logger = WebSocketOrderLogger(
+                log_dir=str(log_dir),
+                enabled=os.getenv('ORDER_MONITOR_WS_LOG', 'true').lower() == 'true'
+            )
+            print("✅ WebSocket Order Logger initialized")
+            return ws_logger
+        except Exception as e:
+            print(f"⚠️  Warning: WebSocket logger initialization failed: {e}")
+            return None
+
+    @contextmanager
+    def _cursor(self, name=None):
+        """
+        Borrow a pooled connection and yield a cursor on it.
+
+        Commits when the block exits normally, rolls back on error, and
+        always returns the connection to the pool. A name makes it a
+        server-side cursor.
+        """
+        conn = self.pool.getconn()
+        try:
+            with conn.cursor(name=name) as cursor:
+                yield cursor
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        finally:
+            self.pool.putconn(conn)
+
+    def _execute_prepared(self, cursor, name: str, params: tuple) -> None:
+        """Execute one of the _PREPARED_SQL statements on cursor."""
+        Database.execute_prepared(cursor, name, self._PREPARED_SQL[name], params)
+
+    def _execute_prepared_many(self, cursor, name: str, params_list: list) -> None:
+        """Execute one of the _PREPARED_SQL statements per parameter tuple, batched."""
+        Database.execute_prepared_many(cursor, name, self._PREPARED_SQL[name], params_list)
+
+    def _get_original_prices_qtys(self, order_ids):
+        """
+        Get the stored (price, quantity) for several orders.
+
+        Served from the price/quantity cache where possible; the misses are
+        fetched in one query.
+
+        Returns:
+            dict: {order_id: (price, quantity)} scaled by _scaled_price_qty, for orders found in the database
+        """
+        found = {}
+        cache = self._price_qty_cache
+        with self._price_qty_lock:
+            for order_id in order_ids:
+                row = cache.get(order_id)
+                if row is not None:
+                    cache.move_to_end(order_id)
+                    found[order_id] = row
+
+        missing = [order_id for order_id in order_ids if order_id not in found]
+        if missing:
+            with self._cursor() as cursor:
+                self._execute_prepared(cursor, 'mon_price_qty_many', (missing,))
+                rows = cursor.fetchall()
+            for row in rows:
+                found[row[0]] = self._cache_price_qty(row[0], row[1], row[2])
+        return found
+
+    def _get_original_price_qty(self, order_id):
+        """
+        Get the stored (price, quantity) for an order.
+
+        Returns:
+            tuple: (price, quantity) scaled by _scaled_price_qty, or None if the order is not in the database
+        """
+        cache = self._price_qty_cache
+        with self._price_qty_lock:
+            row = cache.get(order_id)
+            if row is not None:
+                cache.move_to_end(order_id)
+                return row
+
+        with self._cursor() as cursor:
+            self._execute_prepared(cursor, 'mon_price_qty', (order_id,))
+            row = cursor.fetchone()
+        # Misses aren't cached - the bot may insert the order later
+        if row:
+            return self._cache_price_qty(order_id, row[0], row[1])
+        return None
+
+    def _cache_price_qty(self, order_id, price, quantity):
+        """
+        Remember an order's stored (price, quantity) and return it.
+
+        Kept scaled (see _scaled_price_qty), so modification checks are one
+        tuple comparison without converting the NUMERICs each time.
+        """
+        row = _scaled_price_qty(price, quantity)
+        cache = self._price_qty_cache
+        with self._price_qty_lock:
+            cache[order_id] = row
+            cache.move_to_end(order_id)
+            if len(cache) > self.PRICE_QTY_CACHE_MAX:
+                cache.popitem(last=False)
+        return row
+
     # ========================================================================
     # Event Log Helper Methods (Immutable Audit Trail)
     # ========================================================================
@@ -102,71 +538,14 @@ class OrderMonitor:
 
         This method captures EVERY WebSocket message as an INSERT.
         APPEND-ONLY: Never updates or deletes from bybit_order_events.
+        Only queues the raw message; _event_flush_loop builds the row,
+        fills in the chunk context and writes it.
 
         Args:
             order_id: Bybit order ID
             order_data: Complete order data from WebSocket
         """
-        import json
-
-        try:
-            # Get chunk context from orders table (if exists)
-            chunk_context = self._get_chunk_context(order_id)
-
-            # Determine event type from order status
-            event_type = order_data.get('orderStatus', 'UNKNOWN').upper()
-
-            # Extract fields
-            symbol = order_data.get('symbol', '')
-
-            # INSERT into event log (FAST - never blocked)
-            with self.conn.cursor() as cursor:
-                cursor.execute("""
-                    INSERT INTO bybit_order_events (
-                        order_id, symbol, event_type, order_status,
-                        side, order_type, price, qty,
-                        cum_exec_qty, cum_exec_fee, cum_exec_value, avg_price,
-                        time_in_force, reject_reason,
-                        order_created_time, order_updated_time,
-                        raw_payload,
-                        chunk_group_id, chunk_sequence, chunk_total
-                    )
-                    VALUES (
-                        %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s
-                    )
-                """, (
-                    order_id,
-                    symbol,
-                    event_type,
-                    order_data.get('orderStatus'),
-                    order_data.get('side'),
-                    order_data.get('orderType'),
-                    float(order_data.get('price', 0)) if order_data.get('price') else None,
-                    float(order_data.get('qty', 0)) if order_data.get('qty') else None,
-                    float(order_data.get('cumExecQty', 0)) if order_data.get('cumExecQty') else None,
-                    float(order_data.get('cumExecFee', 0)) if order_data.get('cumExecFee') else None,
-                    float(order_data.get('cumExecValue', 0)) if order_data.get('cumExecValue') else None,
-                    float(order_data.get('avgPrice', 0)) if order_data.get('avgPrice') else None,
-                    order_data.get('timeInForce'),
-                    order_data.get('rejectReason'),
-                    int(order_data.get('createdTime', 0)) if order_data.get('createdTime') else None,
-                    int(order_data.get('updatedTime', 0)) if order_data.get('updatedTime') else None,
-                    json.dumps(order_data),  # Complete WebSocket payload
-                    chunk_context.get('chunk_group_id'),
-                    chunk_context.get('chunk_sequence'),
-                    chunk_context.get('chunk_total')
-                ))
-                self.conn.commit()
-
-            print(f"📝 Bybit event logged: {order_id[:8]}... → {event_type}")
-
-        except Exception as e:
-            # Don't fail WebSocket processing if event logging fails
-            print(f"⚠️  Warning: Failed to log Bybit event for {order_id[:8]}...: {e}")
-            try:
-                self.conn.rollback()
-            except:
-                pass
+        self._queue_event('bybit', order_id, order_data)
 
     def _log_coindcx_event_to_db(self, order_id: str, order_data: dict):
         """
@@ -174,154 +553,275 @@ class OrderMonitor:
 
         This method captures EVERY WebSocket message as an INSERT.
         APPEND-ONLY: Never updates or deletes from coindcx_order_events.
+        Only queues the raw message; _event_flush_loop builds the row,
+        fills in the chunk context and writes it.
 
         Args:
             order_id: CoinDCX order ID
             order_data: Complete order data from WebSocket
         """
-        import json
+        self._queue_event('coindcx', order_id, order_data)
+
+    @staticmethod
+    def _bybit_event_row(order_id: str, order_data: dict) -> tuple:
+        """Build a bybit_order_events row (without chunk columns) from a WebSocket message."""
+        return (
+            order_id,
+            order_data.get('symbol', ''),
+            order_data.get('orderStatus', 'UNKNOWN').upper(),  # event_type
+            order_data.get('orderStatus'),
+            order_data.get('side'),
+            order_data.get('orderType'),
+            _opt_float(order_data.get('price')),
+            _opt_float(order_data.get('qty')),
+            _opt_float(order_data.get('cumExecQty')),
+            _opt_float(order_data.get('cumExecFee')),
+            _opt_float(order_data.get('cumExecValue')),
+            _opt_float(order_data.get('avgPrice')),
+            order_data.get('timeInForce'),
+            order_data.get('rejectReason'),
+            _opt_int(order_data.get('createdTime')),
+            _opt_int(order_data.get('updatedTime')),
+            _dumps_payload(order_data)  # Complete WebSocket payload
+        )
 
-        try:
-            # Get chunk context from orders table (if exists)
-            chunk_context = self._get_chunk_context(order_id)
+    @staticmethod
+    def _coindcx_event_row(order_id: str, order_data: dict) -> tuple:
+        """Build a coindcx_order_events row (without chunk columns) from a WebSocket message."""
+        return (
+            order_id,
+            order_data.get('pair', ''),
+            order_data.get('status', 'unknown').lower(),  # event_type
+            order_data.get('status'),
+            order_data.get('side'),
+            order_data.get('order_type'),
+            _opt_float(order_data.get('price')),
+            _opt_float(order_data.get('total_quantity')),
+            _opt_float(order_data.get('remaining_quantity')),
+            _opt_float(order_data.get('avg_price')),
+            _opt_float(order_data.get('fee_amount')),
+            _dumps_payload(order_data)  # Complete WebSocket payload
+        )
+
+    def _queue_event(self, exchange: str, order_id: str, order_data: dict):
+        """
+        Buffer a raw WebSocket event for the next batched flush.
 
-            # Determine event type from status
-            event_type = order_data.get('status', 'unknown').lower()
+        Never blocks: if the buffer is full (DB down or far behind) the
+        event is dropped and counted in events_dropped.
 
-            # Extract fields
-            pair = order_data.get('pair', '')
+        Args:
+            exchange: 'bybit' or 'coindcx' (key into EVENT_TABLES)
+            order_id: Exchange order ID
+            order_data: Complete order data from WebSocket
+        """
+        buffer = self._event_buffer
+        if len(buffer) >= self.EVENT_BUFFER_MAX:
+            self.events_dropped += 1
+            if self.events_dropped % 1000 == 1:
+                logger.warning("Event log buffer full - dropped %d events so far", self.events_dropped)
+            return
 
-            # INSERT into event log (FAST - never blocked)
-            with self.conn.cursor() as cursor:
-                cursor.execute("""
-                    INSERT INTO coindcx_order_events (
-                        order_id, pair, event_type, order_status,
-                        side, order_type, price, total_quantity, remaining_quantity,
-                        avg_price, fee_amount,
-                        raw_payload,
-                        chunk_group_id, chunk_sequence, chunk_total
-                    )
-                    VALUES (
-                        %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s
-                    )
-                """, (
-                    order_id,
-                    pair,
-                    event_type,
-                    order_data.get('status'),
-                    order_data.get('side'),
-                    order_data.get('order_type'),
-                    float(order_data.get('price', 0)) if order_data.get('price') else None,
-                    float(order_data.get('total_quantity', 0)) if order_data.get('total_quantity') else None,
-                    float(order_data.get('remaining_quantity', 0)) if order_data.get('remaining_quantity') else None,
-                    float(order_data.get('avg_price', 0)) if order_data.get('avg_price') else None,
-                    float(order_data.get('fee_amount', 0)) if order_data.get('fee_amount') else None,
-                    json.dumps(order_data),  # Complete WebSocket payload
-                    chunk_context.get('chunk_group_id'),
-                    chunk_context.get('chunk_sequence'),
-                    chunk_context.get('chunk_total')
-                ))
-                self.conn.commit()
+        buffer.append((exchange, order_id, order_data))
+        if len(buffer) >= self.EVENT_FLUSH_BATCH:
+            self._event_wakeup.set()
+
+    def _connect_event_conn(self):
+        """Open the event log connection (flushes don't wait for the WAL fsync)."""
+        conn = psycopg2.connect(connection_factory=PreparedConnection, **self._db_params)
+        # Append-only audit log (replayable from raw_payload): flush commits
+        # don't need to wait for the WAL fsync
+        with conn.cursor() as cursor:
+            cursor.execute("SET synchronous_commit = off")
+        conn.commit()
+        return conn
+
+    def _event_flush_loop(self):
+        """Background thread: flush buffered events every EVENT_FLUSH_INTERVAL."""
+        while not self._event_flusher_stop.is_set():
+            self._event_wakeup.wait(self.EVENT_FLUSH_INTERVAL)
+            self._event_wakeup.clear()
+            self._flush_events()
+        # Final flush for events queued while shutting down
+        self._flush_events(force=True)
+
+    def _flush_events(self, force=False):
+        """
+        Write all buffered event rows in one transaction (one INSERT/COPY per table).
 
-            print(f"📝 CoinDCX event logged: {order_id[:8]}... → {event_type}")
+        On a connection error the events go back to the front of the buffer
+        and the connection is reopened on the next flush (after
+        EVENT_RETRY_DELAY, unless force). Any other error falls back to one
+        transaction per row, so a single bad row doesn't drop the batch.
+        """
+        buffer = self._event_buffer
+        if not buffer or (not force and _monotonic() < self._event_retry_at):
+            return
+
+        items = []
+        while buffer:
+            items.append(buffer.popleft())
 
+        try:
+            if self._event_conn.closed:
+                self._event_conn = self._connect_event_conn()
+            self._write_events(items)
+        except (psycopg2.OperationalError, psycopg2.InterfaceError) as e:
+            self._rollback_event_conn()
+            # Keep arrival order: the failed batch goes ahead of newer events
+            buffer.extendleft(reversed(items))
+            self._event_retry_at = _monotonic() + self.EVENT_RETRY_DELAY
+            logger.warning("Event log connection error, %d events re-queued: %s", len(items), e)
         except Exception as e:
-            # Don't fail WebSocket processing if event logging fails
-            print(f"⚠️  Warning: Failed to log CoinDCX event for {order_id[:8]}...: {e}")
+            self._rollback_event_conn()
+            logger.warning("Failed to flush %d order events, retrying row by row: %s", len(items), e)
+            failed = 0
+            for item in items:
+                try:
+                    self._write_events([item])
+                except Exception as row_error:
+                    self._rollback_event_conn()
+                    failed += 1
+                    logger.warning("Dropped %s event for %s...: %s", item[0], item[1][:8], row_error)
+            self.events_dropped += failed
+
+    def _rollback_event_conn(self):
+        """Roll back the event log connection, ignoring a dead connection."""
+        try:
+            self._event_conn.rollback()
+        except Exception:
+            pass
+
+    def _write_events(self, items):
+        """Build and write (exchange, order_id, order_data) events, committing once."""
+        builders = {'bybit': self._bybit_event_row, 'coindcx': self._coindcx_event_row}
+        batches = {exchange: [] for exchange in self.EVENT_TABLES}
+        for exchange, order_id, order_data in items:
             try:
-                self.conn.rollback()
-            except:
-                pass
+                batches[exchange].append(builders[exchange](order_id, order_data))
+            except Exception as e:
+                # Skip a malformed message rather than the whole batch
+                logger.warning("Failed to log %s event for %s...: %s", exchange, order_id[:8], e)
+
+        with self._event_conn.cursor() as cursor:
+            # Chunk context for every order in the batch in one round-trip
+            order_ids = list({row[0] for rows in batches.values() for row in rows})
+            self._execute_prepared(cursor, 'mon_batch_context', (order_ids,))
+            contexts = {row[0]: row[1:] for row in cursor.fetchall()}
+            no_context = (None, None, None)
+
+            # Small batches become multi-row INSERTs sent together in
+            # one round-trip (rather than one execute per table)
+            inserts = []
+            for exchange, rows in batches.items():
+                rows = [row + contexts.get(row[0], no_context) for row in rows]
+                if len(rows) >= self.EVENT_COPY_MIN_ROWS:
+                    cursor.copy_expert(
+                        self.EVENT_COPY_SQL[exchange],
+                        io.StringIO(''.join(map(_copy_line, rows)))
+                    )
+                elif rows:
+                    template = self.EVENT_ROW_TEMPLATE[exchange]
+                    values = b','.join(cursor.mogrify(template, row) for row in rows)
+                    inserts.append(
+                        self.EVENT_INSERT_SQL[exchange].encode().replace(b'%s', values)
+                    )
+            if inserts:
+                cursor.execute(b';'.join(inserts))
+        self._event_conn.commit()
 
     def ensure_modification_columns(self):
         """Ensure modification tracking columns exist in the orders table"""
         try:
-            with self.conn.cursor() as cursor:
-                # Add modified_price column if it doesn't exist
-                try:
-                    cursor.execute("""
-                        ALTER TABLE orders ADD COLUMN IF NOT EXISTS modified_price NUMERIC(10,2)
-                    """)
-                except:
-                    pass  # Column might already exist
-                
-                # Add modified_quantity column if it doesn't exist
-                try:
-                    cursor.execute("""
-                        ALTER TABLE orders ADD COLUMN IF NOT EXISTS modified_quantity NUMERIC(10,8)
-                    """)
-                except:
-                    pass  # Column might already exist
-                
-                # Add modified_at column if it doesn't exist
-                try:
-                    cursor.execute("""
-                        ALTER TABLE orders ADD COLUMN IF NOT EXISTS modified_at TIMESTAMP WITH TIME ZONE
-                    """)
-                except:
-                    pass  # Column might already exist
-                
-                # Add is_modified column if it doesn't exist
-                try:
-                    cursor.execute("""
-                        ALTER TABLE orders ADD COLUMN IF NOT EXISTS is_modified BOOLEAN DEFAULT FALSE
-                    """)
-                except:
-                    pass  # Column might already exist
-                
-                self.conn.commit()
-                print("✅ Modification tracking columns ensured")
+            with self._cursor() as cursor:
+                # One ALTER: a single round trip and a single ACCESS
+                # EXCLUSIVE lock on orders instead of one per column
+                cursor.execute("""
+                    ALTER TABLE orders
+                        ADD COLUMN IF NOT EXISTS modified_price NUMERIC(10,2),
+                        ADD COLUMN IF NOT EXISTS modified_quantity NUMERIC(10,8),
+                        ADD COLUMN IF NOT EXISTS modified_at TIMESTAMP WITH TIME ZONE,
+                        ADD COLUMN IF NOT EXISTS is_modified BOOLEAN DEFAULT FALSE
+                """)
+            self._has_modified_cols = True
+            print("✅ Modification tracking columns ensured")
         except Exception as e:
-            self.conn.rollback()
             print(f"⚠️  Warning: Could not ensure modification columns: {e}")
     
     def update_order_modification(self, order_id, new_price, new_quantity):
         """Update order with new price/quantity when modification is detected"""
+        if not self._has_modified_cols:
+            return
         try:
-            with self.conn.cursor() as cursor:
-                # First get the original price and quantity to store in modified columns
-                cursor.execute("""
-                    SELECT price, quantity FROM orders WHERE order_id = %s
-                """, (order_id,))
+            with self._cursor() as cursor:
+                # Update main price/quantity columns with new values and store
+                # the original values in modified_price/modified_quantity,
+                # in one conditional UPDATE
+                self._execute_prepared(cursor, 'mon_mark_modified', (
+                    new_price, new_quantity, order_id
+                ))
                 row = cursor.fetchone()
-                
-                if row:
-                    original_price, original_quantity = row
-                    
-                    # Update main price/quantity columns with new values
-                    # Store original values in modified_price/modified_quantity for tracking
-                    cursor.execute("""
-                        UPDATE orders 
-                        SET price = %s, quantity = %s,
-                            modified_price = %s, modified_quantity = %s, 
-                            modified_at = NOW(), is_modified = TRUE
-                        WHERE order_id = %s
-                    """, (new_price, new_quantity, original_price, original_quantity, order_id))
-                    
-                    self.conn.commit()
-                    print(f"✅ Order {order_id[:8]}... updated: ${original_price}→${new_price}, {original_quantity}→{new_quantity}")
-                else:
-                    print(f"⚠️  Order {order_id[:8]}... not found for modification tracking")
-                    
+
+            if row:
+                original_price, original_quantity = row
+                self._cache_price_qty(order_id, new_price, new_quantity)
+                self._status_version += 1
+                logger.info(
+                    "Order %s... updated: $%s→$%s, %s→%s", order_id[:8],
+                    original_price, new_price, original_quantity, new_quantity
+                )
+            else:
+                logger.warning("Order %s... not found or unchanged for modification tracking", order_id[:8])
+
+        except pg_errors.UndefinedColumn:
+            self._modified_cols_missing()
         except Exception as e:
-            self.conn.rollback()
-            print(f"❌ Error updating order modification: {e}")
+            logger.error("Error updating order modification: %s", e)
     
+    def _modified_cols_missing(self):
+        """Remember that the orders table has no modified_* columns."""
+        if self._has_modified_cols:
+            self._has_modified_cols = False
+            logger.warning("Modification columns not found - run schema setup first")
+
     def get_pending_orders(self):
         """Get pending orders from database"""
+        return list(self.iter_pending_orders())
+
+    def iter_pending_orders(self, batch_size=1000):
+        """
+        Stream pending orders from database in batches.
+
+        Uses a server-side cursor, so a large PLACED backlog is never
+        materialized in one fetch. CANCELLING rows (cancel in flight in
+        OrderManager) are still live on the exchange and are polled too.
+
+        Yields:
+            tuple: (exchange, order_id, side, price, quantity,
+                    is_modified, modified_price, modified_quantity, symbol)
+        """
+        if self._has_modified_cols:
+            modified_cols = "is_modified, modified_price, modified_quantity"
+        else:
+            modified_cols = "FALSE, NULL, NULL"
         try:
-            with self.conn.cursor() as cursor:
-                cursor.execute("""
-                    SELECT exchange, order_id, side, price, quantity, is_modified, modified_price, modified_quantity
+            with self._cursor(name="pending_orders_cur") as cursor:
+                cursor.execute(f"""
+                    SELECT exchange, order_id, side, price, quantity, {modified_cols}, symbol
                     FROM orders 
-                    WHERE status = 'PLACED'
+                    WHERE status IN ('PLACED', 'CANCELLING')
                     ORDER BY placed_at DESC
                 """)
-                orders = cursor.fetchall()
-                return orders
+                while True:
+                    batch = cursor.fetchmany(batch_size)
+                    if not batch:
+                        break
+                    yield from batch
+        except pg_errors.UndefinedColumn:
+            self._modified_cols_missing()
+            yield from self.iter_pending_orders(batch_size)
         except Exception as e:
             print(f"❌ Error getting pending orders: {e}")
-            return []
     
     def update_order_status(self, order_id, status, fill_price=None, reject_reason=None):
         """
@@ -334,81 +834,45 @@ class OrderMonitor:
             reject_reason: Rejection reason (for REJECTED status, e.g., 'EC_PostOnlyWillTakeLiquidity')
         """
         try:
-            # First, get chunk context from the order
-            chunk_info = None
-            with self.conn.cursor() as cursor:
-                cursor.execute("""
-                    SELECT chunk_group_id, chunk_sequence, exchange, side, quantity
-                    FROM orders
-                    WHERE order_id = %s
-                """, (order_id,))
-                row = cursor.fetchone()
-                if row:
-                    chunk_info = {
-                        'chunk_group_id': row[0],
-                        'chunk_sequence': row[1],
-                        'exchange': row[2],
-                        'side': row[3],
-                        'quantity': row[4]
-                    }
-
-            # Update order status
-            if fill_price:
-                with self.conn.cursor() as cursor:
-                    cursor.execute("""
-                        UPDATE orders
-                        SET status = %s, fill_price = %s, filled_at = NOW()
-                        WHERE order_id = %s
-                    """, (status, fill_price, order_id))
-            elif reject_reason:
-                with self.conn.cursor() as cursor:
-                    cursor.execute("""
-                        UPDATE orders
-                        SET status = %s, reject_reason = %s, filled_at = NOW()
-                        WHERE order_id = %s
-                    """, (status, reject_reason, order_id))
-            else:
-                with self.conn.cursor() as cursor:
-                    cursor.execute("""
-                        UPDATE orders
-                        SET status = %s
-                        WHERE order_id = %s
-                    """, (status, order_id))
-
-            # Log lifecycle event if we have chunk context
-            if chunk_info and chunk_info['chunk_group_id']:
-                event_details = {}
+            with self._cursor() as cursor:
+                # Status update, lifecycle event (chunk orders only) and
+                # NOTIFY in one statement
                 if fill_price:
-                    event_details['fill_price'] = float(fill_price)
-                if reject_reason:
-                    event_details['reject_reason'] = reject_reason
-                if chunk_info.get('side'):
-                    event_details['side'] = chunk_info['side']
-                if chunk_info.get('quantity'):
-                    event_details['quantity'] = float(chunk_info['quantity'])
-
-                import json
-                with self.conn.cursor() as cursor:
-                    cursor.execute("""
-                        INSERT INTO order_lifecycle_log (
-                            chunk_group_id, chunk_sequence, exchange, order_id,
-                            event_type, event_details, timestamp
-                        )
-                        VALUES (%s, %s, %s, %s, %s, %s, NOW())
-                    """, (
-                        chunk_info['chunk_group_id'],
-                        chunk_info['chunk_sequence'],
-                        chunk_info['exchange'],
-                        order_id,
-                        status,  # FILLED, REJECTED, CANCELLED, etc.
-                        json.dumps(event_details) if event_details else None
-                    ))
+                    self._execute_prepared(cursor, 'mon_status_filled', (status, order_id, float(fill_price)))
+                elif reject_reason:
+                    self._execute_prepared(cursor, 'mon_status_rejected', (status, order_id, reject_reason))
+                else:
+                    self._execute_prepared(cursor, 'mon_status', (status, order_id))
+            self._status_version += 1
+            logger.debug("Order %s... updated to %s", order_id[:8], status)
+        except Exception as e:
+            logger.error("Error updating order status: %s", e)
+
+    def update_order_statuses(self, updates):
+        """
+        Update several orders' status in one transaction.
 
-            self.conn.commit()
-            print(f"✅ Order {order_id[:8]}... updated to {status}")
+        Each update is the same single statement as update_order_status
+        (status, lifecycle event, NOTIFY), sent in batches with one commit
+        for all of them. Used by REST polling, which resolves many orders at once.
+
+        Args:
+            updates: List of (order_id, status, fill_price or None)
+        """
+        if not updates:
+            return
+        filled = [(status, order_id, float(fill_price))
+                  for order_id, status, fill_price in updates if fill_price]
+        plain = [(status, order_id)
+                 for order_id, status, fill_price in updates if not fill_price]
+        try:
+            with self._cursor() as cursor:
+                self._execute_prepared_many(cursor, 'mon_status_filled', filled)
+                self._execute_prepared_many(cursor, 'mon_status', plain)
+            self._status_version += 1
+            logger.debug("%d order statuses updated", len(updates))
         except Exception as e:
-            self.conn.rollback()
-            print(f"❌ Error updating order status: {e}")
+            logger.error("Error updating %d order statuses: %s", len(updates), e)
 
     def update_order_status_with_fees(self, order_id, status, fill_price=None,
                                        cum_exec_qty=None, cum_exec_fee=None, net_received=None):
@@ -425,77 +889,41 @@ class OrderMonitor:
             cum_exec_qty: Cumulative executed quantity (gross) from WebSocket
             cum_exec_fee: Cumulative executed fee from WebSocket
             net_received: Net quantity received (cum_exec_qty - cum_exec_fee)
+
+        Falls back to update_order_status (for good) if the fee columns
+        don't exist yet.
         """
+        if not self._has_fee_cols:
+            self.update_order_status(order_id, status, fill_price)
+            return
         try:
-            # First, get chunk context from the order
-            chunk_info = None
-            with self.conn.cursor() as cursor:
-                cursor.execute("""
-                    SELECT chunk_group_id, chunk_sequence, exchange, side, quantity
-                    FROM orders
-                    WHERE order_id = %s
-                """, (order_id,))
-                row = cursor.fetchone()
-                if row:
-                    chunk_info = {
-                        'chunk_group_id': row[0],
-                        'chunk_sequence': row[1],
-                        'exchange': row[2],
-                        'side': row[3],
-                        'quantity': row[4]
-                    }
-
-            # Update order with fee information
-            with self.conn.cursor() as cursor:
-                cursor.execute("""
-                    UPDATE orders
-                    SET status = %s, fill_price = %s, filled_at = NOW(),
-                        cumExecFee = %s, cumExecQty = %s, net_received = %s
-                    WHERE order_id = %s
-                """, (status, fill_price, cum_exec_fee, cum_exec_qty, net_received, order_id))
-
-            # Log lifecycle event with fee details
-            if chunk_info and chunk_info['chunk_group_id']:
-                event_details = {
-                    'fill_price': float(fill_price) if fill_price else 0,
-                    'side': chunk_info.get('side'),
-                    'quantity': float(chunk_info.get('quantity', 0)),
-                    'cum_exec_qty': float(cum_exec_qty) if cum_exec_qty else 0,
-                    'cum_exec_fee': float(cum_exec_fee) if cum_exec_fee else 0,
-                    'net_received': float(net_received) if net_received else 0
-                }
-
-                import json
-                with self.conn.cursor() as cursor:
-                    cursor.execute("""
-                        INSERT INTO order_lifecycle_log (
-                            chunk_group_id, chunk_sequence, exchange, order_id,
-                            event_type, event_details, timestamp
-                        )
-                        VALUES (%s, %s, %s, %s, %s, %s, NOW())
-                    """, (
-                        chunk_info['chunk_group_id'],
-                        chunk_info['chunk_sequence'],
-                        chunk_info['exchange'],
-                        order_id,
-                        status,
-                        json.dumps(event_details)
-                    ))
+            with self._cursor() as cursor:
+                # Fee update, lifecycle event with fee details (chunk orders
+                # only) and NOTIFY in one statement
+                self._execute_prepared(cursor, 'mon_status_fees', (
+                    status, order_id,
+                    _opt_float(fill_price), _opt_float(cum_exec_fee),
+                    _opt_float(cum_exec_qty), _opt_float(net_received)
+                ))
 
-            self.conn.commit()
+            self._status_version += 1
 
             # Log fee information for transparency
             if cum_exec_fee and net_received:
-                print(f"✅ Order {order_id[:8]}... updated to {status}")
-                print(f"   Gross filled: {cum_exec_qty:.8f}")
-                print(f"   Fee charged: {cum_exec_fee:.8f}")
-                print(f"   Net received: {net_received:.8f}")
+                logger.debug(
+                    "Order %s... updated to %s (gross filled: %.8f, fee charged: %.8f, net received: %.8f)",
+                    order_id[:8], status, cum_exec_qty, cum_exec_fee, net_received
+                )
             else:
-                print(f"✅ Order {order_id[:8]}... updated to {status}")
+                logger.debug("Order %s... updated to %s", order_id[:8], status)
 
+        except pg_errors.UndefinedColumn:
+            if self._has_fee_cols:
+                self._has_fee_cols = False
+                logger.warning("Fee columns not found - recording fills without fee data")
+            self.update_order_status(order_id, status, fill_price)
         except Exception as e:
-            self.conn.rollback()
-            print(f"❌ Error updating order status with fees: {e}")
+            logger.error("Error updating order status with fees: %s", e)
 
     def _store_recent_rejection(self, order_id, reason):
         """
@@ -508,17 +936,26 @@ class OrderMonitor:
             order_id: Order ID that was rejected
             reason: Rejection reason from Bybit (e.g., 'EC_PostOnlyWillTakeLiquidity')
         """
-        self.recent_rejections[order_id] = {
+        # Monotonic: a wall-clock step can't expire everything or pin entries
+        now = _monotonic()
+        rejections = self.recent_rejections
+        rejections[order_id] = {
             'reason': reason,
-            'timestamp': time.time()
+            'timestamp': now
         }
+        rejections.move_to_end(order_id)
 
-        # Clean up old rejections (>60 seconds) to prevent memory leak
-        cutoff = time.time() - 60
-        self.recent_rejections = {
-            oid: data for oid, data in self.recent_rejections.items()
-            if data['timestamp'] > cutoff
-        }
+        # Clean up old rejections (>60 seconds) to prevent memory leak -
+        # oldest first, stopping at the first one still fresh. Entries are
+        # in timestamp order already, so this is the same O(expired) pop a
+        # min-heap would give, without stale heap entries to skip
+        cutoff = now - self.REJECTION_TTL
+        while rejections and next(iter(rejections.values()))['timestamp'] <= cutoff:
+            rejections.popitem(last=False)
+
+        # Hard cap for rejection bursts
+        while len(rejections) > self.REJECTION_CACHE_MAX:
+            rejections.popitem(last=False)
 
     def get_rejection_reason(self, order_id):
         """
@@ -534,7 +971,8 @@ class OrderMonitor:
             str: Rejection reason (e.g., 'EC_PostOnlyWillTakeLiquidity') or None
         """
         rejection_data = self.recent_rejections.get(order_id)
-        if rejection_data:
+        # Expired entries linger until the next store; don't report them
+        if rejection_data and _monotonic() - rejection_data['timestamp'] <= self.REJECTION_TTL:
             return rejection_data.get('reason')
         return None
 
@@ -551,25 +989,48 @@ class OrderMonitor:
             dict: Chunk context with chunk_group_id, chunk_sequence, chunk_total, symbol
                   Returns empty dict if order not found
         """
+        cache = self._chunk_context_cache
+        misses = self._chunk_context_misses
+        now = _monotonic()
+        recent_miss = False
+        with self._chunk_context_lock:
+            row = cache.get(order_id)
+            if row is not None:
+                cache.move_to_end(order_id)
+            else:
+                missed_at = misses.get(order_id)
+                recent_miss = missed_at is not None and now - missed_at < self.CHUNK_CONTEXT_MISS_TTL
+
         try:
-            with self.conn.cursor() as cursor:
-                cursor.execute("""
-                    SELECT chunk_group_id, chunk_sequence, chunk_total, symbol
-                    FROM orders
-                    WHERE order_id = %s
-                """, (order_id,))
-                row = cursor.fetchone()
+            if row is None and not recent_miss:
+                with self._cursor() as cursor:
+                    self._execute_prepared(cursor, 'mon_chunk_context', (order_id,))
+                    row = cursor.fetchone()
 
-                if row:
-                    return {
-                        'chunk_group_id': row[0],
-                        'chunk_sequence': row[1],
-                        'chunk_total': row[2],
-                        'chunk_phase': 'UNKNOWN',  # Will be determined by bot
-                        'symbol': row[3]
-                    }
+                # Misses are only remembered briefly - the bot may insert the order later
+                with self._chunk_context_lock:
+                    if row:
+                        misses.pop(order_id, None)
+                        cache[order_id] = tuple(row)
+                        if len(cache) > self.CHUNK_CONTEXT_CACHE_MAX:
+                            cache.popitem(last=False)
+                    else:
+                        misses[order_id] = now
+                        misses.move_to_end(order_id)
+                        # Expired entries are always at the front
+                        while misses and now - next(iter(misses.values())) >= self.CHUNK_CONTEXT_MISS_TTL:
+                            misses.popitem(last=False)
+
+            if row:
+                return {
+                    'chunk_group_id': row[0],
+                    'chunk_sequence': row[1],
+                    'chunk_total': row[2],
+                    'chunk_phase': 'UNKNOWN',  # Will be determined by bot
+                    'symbol': row[3]
+                }
         except Exception as e:
-            print(f"⚠️  Error getting chunk context for {order_id[:8]}...: {e}")
+            logger.warning("Error getting chunk context for %s...: %s", order_id[:8], e)
 
         return {
             'chunk_group_id': None,
@@ -581,167 +1042,304 @@ class OrderMonitor:
 
     def check_bybit_order(self, order_id):
         """Check Bybit order status via REST API"""
+        return order_id in self.check_bybit_orders([order_id])
+
+    def check_bybit_orders(self, order_ids, symbols=None):
+        """
+        Check several Bybit orders via REST API with one open-orders call per symbol.
+
+        Args:
+            order_ids: Bybit order IDs still pending in the database
+            symbols: Optional {order_id: orders.symbol}; orders without a
+                known symbol are looked up across all spot symbols
+
+        Returns:
+            set: Order IDs whose status was updated
+        """
+        updated = set()
+
+        # Skip REST API check if WebSocket is active (order topic pushes
+        # every status change, so polling only burns API quota) - unless it
+        # has gone quiet while orders are pending
+        if self.bybit_websocket_active and not self._bybit_websocket_stale():
+            return updated
+
+        symbols = symbols or {}
+        by_symbol = {}
+        for order_id in order_ids:
+            by_symbol.setdefault(_bybit_symbol(symbols.get(order_id)), []).append(order_id)
+
+        for symbol, ids in by_symbol.items():
+            try:
+                updated |= self._check_bybit_symbol_orders(symbol, ids)
+            except Exception as e:
+                print(f"❌ Error checking {len(ids)} Bybit {symbol or ''} orders: {e}")
+
+        return updated
+
+    def _check_bybit_symbol_orders(self, symbol, order_ids):
+        """
+        Check one symbol's pending Bybit orders (symbol None = all spot symbols).
+
+        Returns:
+            set: Order IDs whose status was updated
+        """
+        updated = set()
+
+        # Get open orders from exchange (once for all orders)
+        result = self.bybit_client.get_open_orders(symbol=symbol)
+        if not (result and result.get('success')):
+            return updated
+        open_orders = {order['orderId']: order for order in result['orders']}
+
+        # Orders still open: check for price/quantity modifications
+        # against the database values (one query for all of them)
+        live_ids = [order_id for order_id in order_ids if order_id in open_orders]
+        originals = self._get_original_prices_qtys(live_ids)
+        for order_id in live_ids:
+            row = originals.get(order_id)
+            if row:
+                order_found = open_orders[order_id]
+                current_price = float(order_found['price'])
+                current_qty = float(order_found['qty'])
+                # Check if price or quantity has been modified
+                if _scaled_price_qty(current_price, current_qty) != row:
+                    self.update_order_modification(order_id, current_price, current_qty)
+
+        # Orders no longer open: look each one up by ID for its final state
+        status_updates = []
+        for order_id in order_ids:
+            if order_id in open_orders:
+                continue
+            history = self.bybit_client.get_order_history(symbol=symbol, order_id=order_id, limit=1)
+            order = history['orders'][0] if history and history.get('success') and history['orders'] else None
+            status = _BYBIT_FINAL_STATUSES.get(order['orderStatus']) if order else None
+            if status is None:
+                # Not in history yet (or still settling) - check again next cycle
+                logger.warning("Bybit order %s... not open and no final status yet", order_id[:8])
+                continue
+            fill_price = _opt_float(order.get('avgPrice')) if status == 'FILLED' else None
+            status_updates.append((order_id, status, fill_price))
+            updated.add(order_id)
+
+        # One transaction for all of them
+        self.update_order_statuses(status_updates)
+        return updated
+
+    def _notify_chunk_manager_once(self, exchange, order_id, status, fill_price=None,
+                                   reject_reason=None, qty=None):
+        """
+        Notify the ChunkManager of an order update, skipping exact repeats.
+
+        Bybit reports a fill on both the order and the execution topic; the
+        second (order_id, status, qty) notification within
+        NOTIFY_DEDUP_WINDOW seconds is dropped.
+        """
+        key = (order_id, status, round(qty, 8) if qty else None)
+        now = _monotonic()
+        seen = self._notify_dedup
+        last = seen.get(key)
+        if last is not None and now - last < self.NOTIFY_DEDUP_WINDOW:
+            return
+        seen[key] = now
+        seen.move_to_end(key)
+        while len(seen) > self.NOTIFY_DEDUP_MAX:
+            seen.popitem(last=False)
+
+        self._notify_chunk_manager(exchange, order_id, status, fill_price, reject_reason)
+
+    def _notify_chunk_manager(self, exchange, order_id, status, fill_price=None, reject_reason=None):
+        """
+        Queue an order update for the ChunkManager.
+
+        Delivered on the notification worker, so ChunkManager side effects
+        (e.g. placing the hedge) don't hold up the WebSocket DB workers.
+        One worker keeps notifications in arrival order.
+        """
+        self._notify_executor.submit(
+            self._deliver_chunk_manager_update, exchange, order_id, status, fill_price, reject_reason
+        )
+
+    def _deliver_chunk_manager_update(self, exchange, order_id, status, fill_price, reject_reason):
+        """Call ChunkManager.on_order_update (runs on the notification worker)."""
         try:
-            # Get order details from exchange
-            result = self.bybit_client.get_open_orders(symbol="ETHUSDT")
-            if result and result.get('retCode') == 0:
-                open_orders = result['result']['list']
-                order_found = None
-                for order in open_orders:
-                    if order['orderId'] == order_id:
-                        order_found = order
-                        break
-                
-                if order_found:
-                    # Order is still open, check for price/quantity modifications
-                    current_price = float(order_found['price'])
-                    current_qty = float(order_found['qty'])
-                    
-                    # Get original order details from database
-                    with self.conn.cursor() as cursor:
-                        cursor.execute("""
-                            SELECT price, quantity FROM orders WHERE order_id = %s
-                        """, (order_id,))
-                        row = cursor.fetchone()
-                        if row:
-                            original_price, original_qty = row
-                            # Check if price or quantity has been modified
-                            if current_price != float(original_price) or current_qty != float(original_qty):
-                                self.update_order_modification(order_id, current_price, current_qty)
-                
-                if not order_found:
-                    # Order not open - likely filled
-                    # Get order history to find fill price
-                    history = self.bybit_client.get_order_history(symbol="ETHUSDT", limit=20)
-                    if history and history.get('retCode') == 0:
-                        for order in history['result']['list']:
-                            if order['orderId'] == order_id and order['orderStatus'] == 'Filled':
-                                fill_price = float(order['avgPrice'])
-                                self.update_order_status(order_id, 'FILLED', fill_price)
-                                return True
-                    
-                    # If we can't find fill price, just mark as filled
-                    self.update_order_status(order_id, 'FILLED')
-                    return True
-        
+            if reject_reason is not None:
+                self.chunk_manager.on_order_update(exchange, order_id, status, reject_reason=reject_reason)
+            elif fill_price is not None:
+                self.chunk_manager.on_order_update(exchange, order_id, status, fill_price)
+            else:
+                self.chunk_manager.on_order_update(exchange, order_id, status)
         except Exception as e:
-            print(f"❌ Error checking Bybit order {order_id[:8]}...: {e}")
-        
-        return False
-    
+            logger.error("Error notifying chunk manager: %s", e)
+
+    def _bybit_websocket_stale(self):
+        """
+        Watchdog: True once no Bybit WebSocket message has arrived for
+        BYBIT_WS_STALE_AFTER seconds, so pending orders are polled over REST
+        until messages flow again (pybit reconnects and resubscribes itself).
+        """
+        stale = _monotonic() - self._bybit_ws_last_message > self.BYBIT_WS_STALE_AFTER
+        if stale != self._bybit_ws_stale:
+            self._bybit_ws_stale = stale
+            if stale:
+                logger.warning("Bybit WebSocket silent for %ss - polling pending orders via REST",
+                               self.BYBIT_WS_STALE_AFTER)
+            else:
+                logger.info("Bybit WebSocket messages resumed - REST polling paused")
+        return stale
+
     def check_coindcx_order(self, order_id):
         """Check CoinDCX order status via REST API"""
+        return order_id in self.check_coindcx_orders([order_id])
+
+    def check_coindcx_orders(self, order_ids):
+        """
+        Check several CoinDCX orders via REST API with one call per order list.
+
+        Args:
+            order_ids: CoinDCX order IDs still PLACED in the database
+
+        Returns:
+            set: Order IDs whose status was updated
+        """
+        updated = set()
+
         # Skip REST API check if WebSocket is active
         if self.coindcx_websocket_active:
-            return False
+            return updated
             
         try:
-            # Check if order is still open
+            # Check which orders are still open (once for all orders)
             open_orders = self.coindcx_client.get_orders(status="open", size=50)
             
             # If API returns empty list, it might be an API issue - don't change status
             if not open_orders:
-                print(f"⚠️  CoinDCX API returned no orders - keeping order {order_id[:8]}... as PLACED")
-                return False
-            
-            order_found = None
-            for order in open_orders:
-                if order.get('id') == order_id:
-                    order_found = order
-                    break
+                print(f"⚠️  CoinDCX API returned no orders - keeping {len(order_ids)} orders as PLACED")
+                return updated
             
-            if order_found:
-                # Order is still open, check for price/quantity modifications
-                current_price = float(order_found.get('price', 0))
-                current_qty = float(order_found.get('total_quantity', 0))
-                
-                # Get original order details from database
-                with self.conn.cursor() as cursor:
-                    cursor.execute("""
-                        SELECT price, quantity FROM orders WHERE order_id = %s
-                    """, (order_id,))
-                    row = cursor.fetchone()
-                    if row:
-                        original_price, original_qty = row
-                        # Check if price or quantity has been modified
-                        if current_price != float(original_price) or current_qty != float(original_qty):
-                            self.update_order_modification(order_id, current_price, current_qty)
+            open_by_id = {order.get('id'): order for order in open_orders}
+
+            # Orders still open: check for price/quantity modifications
+            # against the database values (one query for all of them)
+            live_ids = [order_id for order_id in order_ids if order_id in open_by_id]
+            originals = self._get_original_prices_qtys(live_ids)
+            for order_id in live_ids:
+                row = originals.get(order_id)
+                if row:
+                    order_found = open_by_id[order_id]
+                    current_price = float(order_found.get('price', 0))
+                    current_qty = float(order_found.get('total_quantity', 0))
+                    # Check if price or quantity has been modified
+                    if _scaled_price_qty(current_price, current_qty) != row:
+                        self.update_order_modification(order_id, current_price, current_qty)
             
-            if not order_found:
-                # If not open, check if filled
-                filled_orders = self.coindcx_client.get_orders(status="filled", size=50)
-                if filled_orders:  # Only proceed if we get actual data
-                    for order in filled_orders:
-                        if order.get('id') == order_id:
-                            fill_price = float(order.get('avg_price', order.get('price', 0)))
-                            if fill_price > 0:
-                                self.update_order_status(order_id, 'FILLED', fill_price)
-                                return True
+            closed_ids = [order_id for order_id in order_ids if order_id not in open_by_id]
+            if not closed_ids:
+                return updated
+
+            # If not open, check if filled
+            filled_orders = self.coindcx_client.get_orders(status="filled", size=50) or []
+            filled_by_id = {order.get('id'): order for order in filled_orders}
+            cancelled_ids = None
+            status_updates = []
+
+            for order_id in closed_ids:
+                order = filled_by_id.get(order_id)
+                if order:
+                    fill_price = float(order.get('avg_price', order.get('price', 0)))
+                    if fill_price > 0:
+                        status_updates.append((order_id, 'FILLED', fill_price))
+                        updated.add(order_id)
+                        continue
                 
                 # Only mark as cancelled if we get actual cancelled orders data
-                cancelled_orders = self.coindcx_client.get_orders(status="cancelled", size=50)
-                if cancelled_orders and any(o.get('id') == order_id for o in cancelled_orders):
-                    self.update_order_status(order_id, 'CANCELLED')
-                    return True
-                else:
-                    pass
+                if cancelled_ids is None:
+                    cancelled_orders = self.coindcx_client.get_orders(status="cancelled", size=50) or []
+                    cancelled_ids = {order.get('id') for order in cancelled_orders}
+                if order_id in cancelled_ids:
+                    status_updates.append((order_id, 'CANCELLED', None))
+                    updated.add(order_id)
+                    continue
                 
                 # If we can't get reliable data from API, don't change status
                 print(f"⚠️  CoinDCX order {order_id[:8]}... status unclear - keeping as PLACED")
-                return False
+
+            # One transaction for all of them
+            self.update_order_statuses(status_updates)
         
         except Exception as e:
-            print(f"❌ Error checking CoinDCX order {order_id[:8]}...: {e}")
+            print(f"❌ Error checking {len(order_ids)} CoinDCX orders: {e}")
         
-        return False
+        return updated
 
     def get_detailed_order_info(self, exchange, order_id, symbol="BTCUSDT"):
-        """Get detailed order execution information from exchange API"""
+        """
+        Get detailed order execution information from exchange API.
+
+        Orders in a terminal state can't change any more, so their details
+        are cached and later calls skip the REST request.
+        """
+        key = (exchange, order_id)
+        cache = self._order_detail_cache
+        with self._order_detail_lock:
+            details = cache.get(key)
+            if details is not None:
+                cache.move_to_end(key)
+                return dict(details)
+
+        details = self._fetch_detailed_order_info(exchange, order_id, symbol)
+        if details and details.get('orderStatus') in self.TERMINAL_ORDER_STATUSES:
+            with self._order_detail_lock:
+                cache[key] = dict(details)
+                if len(cache) > self.ORDER_DETAIL_CACHE_MAX:
+                    cache.popitem(last=False)
+        return details
+
+    def _fetch_detailed_order_info(self, exchange, order_id, symbol):
+        """Fetch detailed order information from the exchange REST API (uncached)."""
         try:
             if exchange == "Bybit":
-                # Get order history to find execution details
-                result = self.bybit_client.get_order_history(symbol=symbol, limit=50)
-                if result and result.get('retCode') == 0:
-                    for order in result['result']['list']:
-                        if order['orderId'] == order_id:
-                            return {
-                                'orderId': order['orderId'],
-                                'symbol': order['symbol'],
-                                'side': order['side'],
-                                'orderType': order['orderType'],
-                                'qty': float(order['qty']),
-                                'price': float(order['price']),
-                                'avgPrice': float(order['avgPrice']) if order['avgPrice'] else 0,
-                                'cumExecQty': float(order['cumExecQty']),
-                                'cumExecValue': float(order['cumExecValue']),
-                                'cumExecFee': float(order['cumExecFee']),
-                                'orderStatus': order['orderStatus'],
-                                'timeInForce': order['timeInForce'],
-                                'execType': order.get('execType', 'Unknown'),
-                                'createdTime': order['createdTime'],
-                                'updatedTime': order['updatedTime']
-                            }
+                # Look the order up directly rather than scanning recent history
+                result = self.bybit_client.get_order_history(symbol=symbol, order_id=order_id, limit=1)
+                if result and result.get('success') and result['orders']:
+                    order = result['orders'][0]
+                    return {
+                        'orderId': order['orderId'],
+                        'symbol': order['symbol'],
+                        'side': order['side'],
+                        'orderType': order['orderType'],
+                        'qty': float(order['qty']),
+                        'price': float(order['price']),
+                        'avgPrice': float(order['avgPrice']) if order['avgPrice'] else 0,
+                        'cumExecQty': float(order['cumExecQty']),
+                        'cumExecValue': float(order['cumExecValue']),
+                        'cumExecFee': float(order['cumExecFee']),
+                        'orderStatus': order['orderStatus'],
+                        'timeInForce': order['timeInForce'],
+                        'execType': order.get('execType', 'Unknown'),
+                        'createdTime': order['createdTime'],
+                        'updatedTime': order['updatedTime']
+                    }
 
                 # If not in history, try executions
-                exec_result = self.bybit_client.get_executions(symbol=symbol, limit=50)
-                if exec_result and exec_result.get('retCode') == 0:
-                    for execution in exec_result['result']['list']:
-                        if execution['orderId'] == order_id:
-                            return {
-                                'orderId': execution['orderId'],
-                                'symbol': execution['symbol'],
-                                'side': execution['side'],
-                                'qty': float(execution['orderQty']),
-                                'price': float(execution['orderPrice']),
-                                'avgPrice': float(execution['execPrice']),
-                                'cumExecQty': float(execution['execQty']),
-                                'cumExecValue': float(execution['execValue']),
-                                'cumExecFee': float(execution['execFee']),
-                                'execType': execution.get('execType', 'Trade'),
-                                'isMaker': execution.get('isMaker', False),
-                                'createdTime': execution['execTime'],
-                                'updatedTime': execution['execTime']
-                            }
+                exec_result = self.bybit_client.get_executions(symbol=symbol, order_id=order_id, limit=1)
+                if exec_result and exec_result.get('success') and exec_result['executions']:
+                    execution = exec_result['executions'][0]
+                    return {
+                        'orderId': execution['orderId'],
+                        'symbol': execution['symbol'],
+                        'side': execution['side'],
+                        'qty': float(execution['orderQty']),
+                        'price': float(execution['orderPrice']),
+                        'avgPrice': float(execution['execPrice']),
+                        'cumExecQty': float(execution['execQty']),
+                        'cumExecValue': float(execution['execValue']),
+                        'cumExecFee': float(execution['execFee']),
+                        'execType': execution.get('execType', 'Trade'),
+                        'isMaker': execution.get('isMaker', False),
+                        'createdTime': execution['execTime'],
+                        'updatedTime': execution['execTime']
+                    }
 
             elif exchange == "CoinDCX":
                 # Get CoinDCX order details
@@ -785,63 +1383,66 @@ class OrderMonitor:
             print(f"❌ Could not retrieve detailed order information")
             return
 
-        print(f"✅ Order details retrieved successfully")
-        print(f"📋 ORDER EXECUTION SUMMARY:")
-        print(f"   Exchange: {exchange}")
-        print(f"   Order ID: {order_id[:12]}...")
-        print(f"   Symbol: {order_details.get('symbol', order_details.get('pair', 'Unknown'))}")
-        print(f"   Side: {order_details.get('side', 'Unknown').upper()}")
+        # Report is assembled first and written in one go
+        lines = []
+        lines.append(f"✅ Order details retrieved successfully")
+        lines.append(f"📋 ORDER EXECUTION SUMMARY:")
+        lines.append(f"   Exchange: {exchange}")
+        lines.append(f"   Order ID: {order_id[:12]}...")
+        lines.append(f"   Symbol: {order_details.get('symbol', order_details.get('pair', 'Unknown'))}")
+        lines.append(f"   Side: {order_details.get('side', 'Unknown').upper()}")
 
         # Quantity Analysis
         ordered_qty = order_details.get('qty', 0)
         filled_qty = order_details.get('cumExecQty', 0)
-        print(f"\n💰 QUANTITY ANALYSIS:")
-        print(f"   Ordered Quantity: {ordered_qty:.6f}")
-        print(f"   Filled Quantity: {filled_qty:.6f}")
-        print(f"   Expected Quantity: {expected_qty:.6f}")
-        print(f"   Target After Fees: {target_received_qty:.6f}")
+        lines.append(f"\n💰 QUANTITY ANALYSIS:")
+        lines.append(f"   Ordered Quantity: {ordered_qty:.6f}")
+        lines.append(f"   Filled Quantity: {filled_qty:.6f}")
+        lines.append(f"   Expected Quantity: {expected_qty:.6f}")
+        lines.append(f"   Target After Fees: {target_received_qty:.6f}")
 
         # Fee Analysis
         actual_fee = order_details.get('cumExecFee', 0)
         expected_fee = filled_qty * expected_fee_rate
-        print(f"\n💳 FEE ANALYSIS:")
-        print(f"   Actual Fee: {actual_fee:.8f}")
-        print(f"   Expected Fee ({expected_fee_rate*100:.3f}%): {expected_fee:.8f}")
+        lines.append(f"\n💳 FEE ANALYSIS:")
+        lines.append(f"   Actual Fee: {actual_fee:.8f}")
+        lines.append(f"   Expected Fee ({expected_fee_rate*100:.3f}%): {expected_fee:.8f}")
 
         # Calculate actual received (for Bybit BUY orders)
         if exchange == "Bybit" and order_details.get('side', '').upper() == "BUY":
             actual_received = filled_qty - actual_fee
-            print(f"   Actual Received: {actual_received:.8f}")
-            print(f"   Target Received: {target_received_qty:.8f}")
+            lines.append(f"   Actual Received: {actual_received:.8f}")
+            lines.append(f"   Target Received: {target_received_qty:.8f}")
 
             quantity_diff = actual_received - target_received_qty
-            print(f"   Difference: {quantity_diff:+.8f}")
+            lines.append(f"   Difference: {quantity_diff:+.8f}")
 
-            if abs(quantity_diff) < 0.0000001:
-                print(f"   ✅ PERFECT MATCH - quantities align!")
+            if math.isclose(quantity_diff, 0, abs_tol=1e-7):
+                lines.append(f"   ✅ PERFECT MATCH - quantities align!")
             else:
-                print(f"   ⚠️ QUANTITY MISMATCH detected")
+                lines.append(f"   ⚠️ QUANTITY MISMATCH detected")
 
         # Maker/Taker Analysis
         if 'isMaker' in order_details:
             maker_status = "MAKER" if order_details['isMaker'] else "TAKER"
-            print(f"\n🎯 EXECUTION TYPE:")
-            print(f"   Order Type: {maker_status}")
+            lines.append(f"\n🎯 EXECUTION TYPE:")
+            lines.append(f"   Order Type: {maker_status}")
             if not order_details['isMaker']:
-                print(f"   ⚠️ WARNING: Order executed as TAKER (higher fees)")
+                lines.append(f"   ⚠️ WARNING: Order executed as TAKER (higher fees)")
         elif 'execType' in order_details:
-            print(f"\n🎯 EXECUTION TYPE:")
-            print(f"   Execution Type: {order_details['execType']}")
+            lines.append(f"\n🎯 EXECUTION TYPE:")
+            lines.append(f"   Execution Type: {order_details['execType']}")
 
         # Price Analysis
         order_price = order_details.get('price', 0)
         fill_price = order_details.get('avgPrice', 0)
-        print(f"\n💲 PRICE ANALYSIS:")
-        print(f"   Order Price: ${order_price:.2f}")
-        print(f"   Fill Price: ${fill_price:.2f}")
-        print(f"   Price Difference: ${fill_price - order_price:+.2f}")
+        lines.append(f"\n💲 PRICE ANALYSIS:")
+        lines.append(f"   Order Price: ${order_price:.2f}")
+        lines.append(f"   Fill Price: ${fill_price:.2f}")
+        lines.append(f"   Price Difference: ${fill_price - order_price:+.2f}")
 
-        print(f"{'='*50}")
+        lines.append(f"{'='*50}")
+        print('\n'.join(lines))
 
         return {
             'ordered_qty': ordered_qty,
@@ -854,11 +1455,65 @@ class OrderMonitor:
             'exec_type': order_details.get('execType')
         }
 
+    # ========================================================================
+    # Bybit order status handlers (dispatched on orderStatus)
+    # ========================================================================
+
+    def _handle_bybit_filled(self, order_id, order):
+        """Record a Bybit fill with fee data and notify the ChunkManager."""
+        fill_price = float(order.get('avgPrice', 0))
+        cum_exec_qty = float(order.get('cumExecQty', 0))
+        cum_exec_fee = float(order.get('cumExecFee', 0))
+        net_received = cum_exec_qty - cum_exec_fee if cum_exec_qty and cum_exec_fee else None
+
+        if fill_price > 0:
+            # Falls back to the plain status update if the fee columns are missing
+            self.update_order_status_with_fees(
+                order_id, 'FILLED', fill_price,
+                cum_exec_qty, cum_exec_fee, net_received
+            )
+
+            logger.info("Bybit WebSocket: Order %s... FILLED @ $%s", order_id[:8], fill_price)
+            # Notify chunk manager (once - the execution topic reports it too)
+            self._notify_chunk_manager_once("Bybit", order_id, "FILLED", fill_price,
+                                            qty=cum_exec_qty)
+
+    def _handle_bybit_cancelled(self, order_id, order):
+        """Record a Bybit cancellation and notify the ChunkManager."""
+        self.update_order_status(order_id, 'CANCELLED')
+        logger.info("Bybit WebSocket: Order %s... CANCELLED", order_id[:8])
+        # Notify chunk manager about order update
+        self._notify_chunk_manager_once("Bybit", order_id, "CANCELLED")
+
+    def _handle_bybit_rejected(self, order_id, order):
+        """Record a Bybit rejection, remember its reason and notify the ChunkManager."""
+        reject_reason = order.get('rejectReason', 'Unknown')
+        self.update_order_status(order_id, 'REJECTED', reject_reason=reject_reason)
+        logger.info("Bybit WebSocket: Order %s... REJECTED - %s", order_id[:8], reject_reason)
+
+        # Store rejection reason in memory for quick lookup
+        self._store_recent_rejection(order_id, reject_reason)
+
+        # Notify chunk manager about order update
+        self._notify_chunk_manager_once("Bybit", order_id, "REJECTED",
+                                        reject_reason=reject_reason)
+
+    def _handle_bybit_new(self, order_id, order):
+        """Mark a Bybit order confirmed (placed and active)."""
+        logger.info("Bybit WebSocket: Order %s... NEW (active)", order_id[:8])
+        # Update database status to indicate order is confirmed
+        self.update_order_status(order_id, 'OPEN')
+
     def setup_bybit_websocket(self):
         """Setup Bybit WebSocket for real-time order updates"""
         try:
-            def on_order_update(message):
-                """Handle Bybit order updates"""
+            # Resolved once here rather than looked up on self per message
+            submit = self._bybit_db_executor.submit
+            log_event = self._log_bybit_event_to_db
+            status_handlers = self._bybit_status_handlers
+
+            def process_order_update(message):
+                """Handle Bybit order updates (blocking DB work, off the WebSocket thread)"""
                 try:
                     if message.get('topic') == 'order':
                         for order in message.get('data', []):
@@ -870,32 +1525,21 @@ class OrderMonitor:
                             # ========================================================================
                             if order_id:
                                 try:
-                                    self._log_bybit_event_to_db(order_id, order)
+                                    log_event(order_id, order)
                                 except Exception as log_err:
-                                    print(f"⚠️  Event logging failed: {log_err}")
+                                    logger.warning("Event logging failed: %s", log_err)
 
                             # ========================================================================
                             # STEP 2: Log complete WebSocket message (file logger)
                             # ========================================================================
                             # LOG COMPLETE WEBSOCKET MESSAGE FIRST (before any processing)
-                            if self.ws_logger and order_id:
+                            if order_id and self.ws_logger and self.ws_logger.enabled:
                                 try:
                                     chunk_context = self._get_chunk_context(order_id)
                                     event_summary = f"Bybit order {order_id[:8]}... | Status: {status}"
-
-                                    # Add details to summary based on status
-                                    if status == 'Filled':
-                                        avg_price = order.get('avgPrice', 0)
-                                        cum_qty = order.get('cumExecQty', 0)
-                                        cum_fee = order.get('cumExecFee', 0)
-                                        event_summary += f" | Fill @ ${avg_price} | Qty: {cum_qty} | Fee: {cum_fee}"
-                                    elif status == 'Rejected':
-                                        reject_reason = order.get('rejectReason', 'Unknown')
-                                        event_summary += f" | Reason: {reject_reason}"
-                                    elif status == 'New':
-                                        price = order.get('price', 0)
-                                        qty = order.get('qty', 0)
-                                        event_summary += f" | Price: ${price} | Qty: {qty}"
+                                    details = _BYBIT_SUMMARY_DETAILS.get(status)
+                                    if details:
+                                        event_summary += details(order)
 
                                     self.ws_logger.log_websocket_event(
                                         exchange='bybit',
@@ -905,7 +1549,7 @@ class OrderMonitor:
                                         order_id=order_id
                                     )
                                 except Exception as log_err:
-                                    print(f"⚠️  WebSocket logging failed: {log_err}")
+                                    logger.warning("WebSocket logging failed: %s", log_err)
 
                             if order_id and status:
                                 # Check for price/quantity modifications
@@ -913,75 +1557,21 @@ class OrderMonitor:
                                 current_qty = float(order.get('qty', 0))
                                 
                                 # Get original order details from database
-                                with self.conn.cursor() as cursor:
-                                    cursor.execute("""
-                                        SELECT price, quantity FROM orders WHERE order_id = %s
-                                    """, (order_id,))
-                                    row = cursor.fetchone()
-                                    if row:
-                                        original_price, original_qty = row
-                                        # Check if price or quantity has been modified
-                                        if current_price != float(original_price) or current_qty != float(original_qty):
-                                            self.update_order_modification(order_id, current_price, current_qty)
+                                row = self._get_original_price_qty(order_id)
+                                if row:
+                                    # Check if price or quantity has been modified
+                                    if _scaled_price_qty(current_price, current_qty) != row:
+                                        self.update_order_modification(order_id, current_price, current_qty)
                                 
                                 # Handle status updates
-                                if status == 'Filled':
-                                    fill_price = float(order.get('avgPrice', 0))
-                                    cum_exec_qty = float(order.get('cumExecQty', 0))
-                                    cum_exec_fee = float(order.get('cumExecFee', 0))
-                                    net_received = cum_exec_qty - cum_exec_fee if cum_exec_qty and cum_exec_fee else None
-
-                                    if fill_price > 0:
-                                        # Try to use new method with fee data (backwards compatible)
-                                        try:
-                                            self.update_order_status_with_fees(
-                                                order_id, 'FILLED', fill_price,
-                                                cum_exec_qty, cum_exec_fee, net_received
-                                            )
-                                        except Exception as e:
-                                            # If columns don't exist yet, fall back to old method
-                                            if "does not exist" in str(e):
-                                                self.update_order_status(order_id, 'FILLED', fill_price)
-                                            else:
-                                                raise  # Re-raise if it's a different error
-
-                                        print(f"🔔 Bybit WebSocket: Order {order_id[:8]}... FILLED @ ${fill_price}")
-                                        # Notify chunk manager about order update
-                                        try:
-                                            self.chunk_manager.on_order_update("Bybit", order_id, "FILLED", fill_price)
-                                        except Exception as e:
-                                            print(f"❌ Error notifying chunk manager: {e}")
-                                elif status == 'Cancelled':
-                                    self.update_order_status(order_id, 'CANCELLED')
-                                    print(f"🔔 Bybit WebSocket: Order {order_id[:8]}... CANCELLED")
-                                    # Notify chunk manager about order update
-                                    try:
-                                        self.chunk_manager.on_order_update("Bybit", order_id, "CANCELLED")
-                                    except Exception as e:
-                                        print(f"❌ Error notifying chunk manager: {e}")
-                                elif status == 'Rejected':
-                                    reject_reason = order.get('rejectReason', 'Unknown')
-                                    self.update_order_status(order_id, 'REJECTED', reject_reason=reject_reason)
-                                    print(f"🔔 Bybit WebSocket: Order {order_id[:8]}... REJECTED - {reject_reason}")
-
-                                    # Store rejection reason in memory for quick lookup
-                                    self._store_recent_rejection(order_id, reject_reason)
-
-                                    # Notify chunk manager about order update
-                                    try:
-                                        self.chunk_manager.on_order_update("Bybit", order_id, "REJECTED", reject_reason=reject_reason)
-                                    except Exception as e:
-                                        print(f"❌ Error notifying chunk manager: {e}")
-                                elif status == 'New':
-                                    # Order successfully placed and active
-                                    print(f"🔔 Bybit WebSocket: Order {order_id[:8]}... NEW (active)")
-                                    # Update database status to indicate order is confirmed
-                                    self.update_order_status(order_id, 'OPEN')
+                                handler = status_handlers.get(status)
+                                if handler:
+                                    handler(order_id, order)
                 except Exception as e:
-                    print(f"❌ Error processing Bybit WebSocket message: {e}")
+                    logger.error("Error processing Bybit WebSocket message: %s", e)
             
-            def on_execution_update(message):
-                """Handle Bybit execution (fill) updates"""
+            def process_execution_update(message):
+                """Handle Bybit execution (fill) updates (blocking DB work, off the WebSocket thread)"""
                 try:
                     if message.get('topic') == 'execution':
                         for execution in message.get('data', []):
@@ -995,15 +1585,15 @@ class OrderMonitor:
                             # ========================================================================
                             if order_id:
                                 try:
-                                    self._log_bybit_event_to_db(order_id, execution)
+                                    log_event(order_id, execution)
                                 except Exception as log_err:
-                                    print(f"⚠️  Execution event logging failed: {log_err}")
+                                    logger.warning("Execution event logging failed: %s", log_err)
 
                             # ========================================================================
                             # STEP 2: Log complete WebSocket message (file logger)
                             # ========================================================================
                             # LOG COMPLETE WEBSOCKET MESSAGE FIRST
-                            if self.ws_logger and order_id:
+                            if order_id and self.ws_logger and self.ws_logger.enabled:
                                 try:
                                     chunk_context = self._get_chunk_context(order_id)
                                     event_summary = f"Bybit execution {order_id[:8]}... | Price: ${exec_price} | Qty: {exec_qty} | Fee: {exec_fee}"
@@ -1016,7 +1606,7 @@ class OrderMonitor:
                                         order_id=order_id
                                     )
                                 except Exception as log_err:
-                                    print(f"⚠️  WebSocket logging failed: {log_err}")
+                                    logger.warning("WebSocket logging failed: %s", log_err)
 
                             if order_id and exec_price:
                                 fill_price = float(exec_price)
@@ -1024,27 +1614,28 @@ class OrderMonitor:
                                 cum_exec_fee = float(exec_fee) if exec_fee else None
                                 net_received = cum_exec_qty - cum_exec_fee if cum_exec_qty and cum_exec_fee else None
 
-                                # Try to use new method with fee data (backwards compatible)
-                                try:
-                                    self.update_order_status_with_fees(
-                                        order_id, 'FILLED', fill_price,
-                                        cum_exec_qty, cum_exec_fee, net_received
-                                    )
-                                except Exception as e:
-                                    # If columns don't exist yet, fall back to old method
-                                    if "does not exist" in str(e):
-                                        self.update_order_status(order_id, 'FILLED', fill_price)
-                                    else:
-                                        raise  # Re-raise if it's a different error
+                                # Falls back to the plain status update if the fee columns are missing
+                                self.update_order_status_with_fees(
+                                    order_id, 'FILLED', fill_price,
+                                    cum_exec_qty, cum_exec_fee, net_received
+                                )
 
-                                print(f"🔔 Bybit WebSocket: Order {order_id[:8]}... EXECUTED @ ${fill_price}")
-                                # Notify chunk manager about order update
-                                try:
-                                    self.chunk_manager.on_order_update("Bybit", order_id, "FILLED", fill_price)
-                                except Exception as e:
-                                    print(f"❌ Error notifying chunk manager: {e}")
+                                logger.info("Bybit WebSocket: Order %s... EXECUTED @ $%s", order_id[:8], fill_price)
+                                # Notify chunk manager (once - the order topic reports it too)
+                                self._notify_chunk_manager_once("Bybit", order_id, "FILLED", fill_price,
+                                                                qty=cum_exec_qty)
                 except Exception as e:
-                    print(f"❌ Error processing Bybit execution message: {e}")
+                    logger.error("Error processing Bybit execution message: %s", e)
+
+            def on_order_update(message):
+                """Handle Bybit order updates (queued so the next frame isn't held up)"""
+                self._bybit_ws_last_message = _monotonic()
+                submit(process_order_update, message)
+
+            def on_execution_update(message):
+                """Handle Bybit execution updates (queued so the next frame isn't held up)"""
+                self._bybit_ws_last_message = _monotonic()
+                submit(process_execution_update, message)
             
             # Subscribe to both order and execution updates via WebSocket
             websocket_success = False
@@ -1062,6 +1653,10 @@ class OrderMonitor:
                         topics.append("executions")
                     print(f"🔗 Bybit WebSocket monitoring enabled for: {', '.join(topics)}")
                     websocket_success = True
+                # Status changes arrive on the order topic; executions alone
+                # don't report cancels/rejects, so keep polling without it
+                self.bybit_websocket_active = order_success
+                self._bybit_ws_last_message = _monotonic()
             
             if not websocket_success:
                 print("⚠️  Bybit WebSocket not available, using REST polling")
@@ -1072,12 +1667,11 @@ class OrderMonitor:
     async def setup_coindcx_websocket(self):
         """Setup CoinDCX WebSocket for real-time order updates"""
         try:
-            async def on_order_update(data):
-                """Handle CoinDCX order updates (async for WebSocket compatibility)"""
+            def process_order_update(data):
+                """Handle CoinDCX order updates (blocking DB work, off the event loop)"""
                 try:
-                    import json
                     if isinstance(data, dict) and 'data' in data:
-                        orders = json.loads(data['data'])
+                        orders = _json_loads(data['data'])
                         for order in orders:
                             order_id = order.get('id')
                             status = order.get('status', '').lower()
@@ -1089,13 +1683,13 @@ class OrderMonitor:
                                 try:
                                     self._log_coindcx_event_to_db(order_id, order)
                                 except Exception as log_err:
-                                    print(f"⚠️  CoinDCX event logging failed: {log_err}")
+                                    logger.warning("CoinDCX event logging failed: %s", log_err)
 
                             # ========================================================================
                             # STEP 2: Log complete WebSocket message (file logger)
                             # ========================================================================
                             # LOG COMPLETE WEBSOCKET MESSAGE FIRST (before any processing)
-                            if self.ws_logger and order_id:
+                            if order_id and self.ws_logger and self.ws_logger.enabled:
                                 try:
                                     chunk_context = self._get_chunk_context(order_id)
                                     event_summary = f"CoinDCX order {order_id[:8]}... | Status: {status}"
@@ -1106,7 +1700,7 @@ class OrderMonitor:
                                         total_qty = order.get('total_quantity', 0)
                                         fee = order.get('fee_amount', 0)
                                         event_summary += f" | Fill @ ${avg_price} | Qty: {total_qty} | Fee: {fee}"
-                                    elif status in ['initial', 'open']:
+                                    elif status in self.COINDCX_OPEN_STATUSES:
                                         price = order.get('price', 0)
                                         qty = order.get('total_quantity', 0)
                                         event_summary += f" | Price: ${price} | Qty: {qty}"
@@ -1119,57 +1713,53 @@ class OrderMonitor:
                                         order_id=order_id
                                     )
                                 except Exception as log_err:
-                                    print(f"⚠️  WebSocket logging failed: {log_err}")
+                                    logger.warning("WebSocket logging failed: %s", log_err)
 
                             if order_id and status:
                                 # Check for price/quantity modifications when order is open
-                                if status in ['initial', 'open']:
+                                if status in self.COINDCX_OPEN_STATUSES:
                                     current_price = float(order.get('price', 0))
                                     current_qty = float(order.get('total_quantity', 0))
 
                                     # Get original order details from database
-                                    with self.conn.cursor() as cursor:
-                                        cursor.execute("""
-                                            SELECT price, quantity FROM orders WHERE order_id = %s
-                                        """, (order_id,))
-                                        row = cursor.fetchone()
-
-                                        if row:
-                                            original_price, original_qty = row
-                                            # Check if price or quantity has been modified
-                                            if current_price != float(original_price) or current_qty != float(original_qty):
-                                                self.update_order_modification(order_id, current_price, current_qty)
-                                                print(f"🔄 CoinDCX WebSocket: Order {order_id[:8]}... MODIFIED to ${current_price} for {current_qty}")
-                                        else:
-                                            # Order not in database
-                                            # DISABLED: No longer auto-insert orders from WebSocket
-                                            # Bot now uses upsert_order() which handles inserts
-                                            # This prevents duplicate rows for the same order
-                                            print(f"ℹ️  CoinDCX WebSocket: New order {order_id[:8]}... detected (will be inserted by bot)")
+                                    row = self._get_original_price_qty(order_id)
+
+                                    if row:
+                                        # Check if price or quantity has been modified
+                                        if _scaled_price_qty(current_price, current_qty) != row:
+                                            self.update_order_modification(order_id, current_price, current_qty)
+                                            logger.info("CoinDCX WebSocket: Order %s... MODIFIED to $%s for %s", order_id[:8], current_price, current_qty)
+                                    else:
+                                        # Order not in database
+                                        # DISABLED: No longer auto-insert orders from WebSocket
+                                        # Bot now uses upsert_order() which handles inserts
+                                        # This prevents duplicate rows for the same order
+                                        logger.info("CoinDCX WebSocket: New order %s... detected (will be inserted by bot)", order_id[:8])
                                 
                                 # Handle status updates
                                 if status == 'filled':
                                     avg_price = float(order.get('avg_price', 0))
                                     if avg_price > 0:
                                         self.update_order_status(order_id, 'FILLED', avg_price)
-                                        print(f"🔔 CoinDCX WebSocket: Order {order_id[:8]}... FILLED @ ${avg_price}")
+                                        logger.info("CoinDCX WebSocket: Order %s... FILLED @ $%s", order_id[:8], avg_price)
                                         # Notify chunk manager about order update
-                                        try:
-                                            self.chunk_manager.on_order_update("CoinDCX", order_id, "FILLED", avg_price)
-                                        except Exception as e:
-                                            print(f"❌ Error notifying chunk manager: {e}")
+                                        self._notify_chunk_manager("CoinDCX", order_id, "FILLED", avg_price)
                                 elif status == 'cancelled':
                                     self.update_order_status(order_id, 'CANCELLED')
-                                    print(f"🔔 CoinDCX WebSocket: Order {order_id[:8]}... CANCELLED")
+                                    logger.info("CoinDCX WebSocket: Order %s... CANCELLED", order_id[:8])
                                     # Notify chunk manager about order update
-                                    try:
-                                        self.chunk_manager.on_order_update("CoinDCX", order_id, "CANCELLED")
-                                    except Exception as e:
-                                        print(f"❌ Error notifying chunk manager: {e}")
-                                elif status in ['initial', 'open']:
-                                    print(f"📋 CoinDCX WebSocket: Order {order_id[:8]}... status: {status.upper()}")
+                                    self._notify_chunk_manager("CoinDCX", order_id, "CANCELLED")
+                                elif status in self.COINDCX_OPEN_STATUSES:
+                                    logger.info("CoinDCX WebSocket: Order %s... status: %s", order_id[:8], status.upper())
                 except Exception as e:
-                    print(f"❌ Error processing CoinDCX WebSocket message: {e}")
+                    logger.error("Error processing CoinDCX WebSocket message: %s", e)
+
+            async def on_order_update(data):
+                """Handle CoinDCX order updates (async for WebSocket compatibility)"""
+                # psycopg2 calls block; awaiting the worker keeps the loop
+                # free to read further WebSocket frames meanwhile
+                loop = asyncio.get_running_loop()
+                await loop.run_in_executor(self._ws_db_executor, process_order_update, data)
             
             # Connect to CoinDCX WebSocket
             await self.coindcx_client.connect_websocket()
@@ -1205,13 +1795,18 @@ class OrderMonitor:
                         self.setup_coindcx_websocket(), 
                         timeout=10.0
                     ))
-                    # Keep the websocket running
-                    while self.running:
-                        try:
-                            loop.run_until_complete(asyncio.sleep(1))
-                        except Exception as e:
-                            print(f"⚠️  CoinDCX WebSocket runtime error: {e}")
-                            break
+                    # Keep the websocket running: the loop only wakes for
+                    # frames and the client's own pings until close() sets
+                    # the stop event
+                    stop = asyncio.Event()
+                    self._coindcx_stop = (loop, stop)
+                    if not self.running:
+                        stop.set()
+                    try:
+                        loop.run_until_complete(stop.wait())
+                        loop.run_until_complete(self.coindcx_client.disconnect_websocket())
+                    except Exception as e:
+                        print(f"⚠️  CoinDCX WebSocket runtime error: {e}")
                 except asyncio.TimeoutError:
                     print("⚠️  CoinDCX WebSocket connection timeout, falling back to REST polling")
                 except Exception as e:
@@ -1228,28 +1823,40 @@ class OrderMonitor:
         # Main monitoring loop with improved error handling
         while self.running:
             try:
-                # Get pending orders from database with timeout
-                pending_orders = self.get_pending_orders()
+                # Stream pending orders from database, keeping only the IDs.
+                # Check them per exchange - one open-orders call and one DB
+                # lookup per exchange instead of per order
+                bybit_ids = []
+                bybit_symbols = {}
+                coindcx_ids = []
+                pending_count = 0
+                for exchange, order_id, side, price, quantity, is_modified, modified_price, modified_quantity, symbol in self.iter_pending_orders():
+                    if not pending_count:
+                        print("🔍 Checking pending orders...")
+                    pending_count += 1
+                    print(f"   Checking {exchange} {side} order {order_id[:8]}...")
+                    # OrderManager writes 'bybit'/'coindcx', older rows 'Bybit'/'CoinDCX'
+                    exchange = (exchange or '').lower()
+                    if exchange == 'bybit':
+                        bybit_ids.append(order_id)
+                        bybit_symbols[order_id] = symbol
+                    elif exchange == 'coindcx':
+                        coindcx_ids.append(order_id)
                 
-                if not pending_orders:
+                if not pending_count:
                     # Silently wait when no orders to monitor (no spam)
-                    time.sleep(5)
+                    self._stopping.wait(5)
                     continue
                 
-                print(f"🔍 Checking {len(pending_orders)} pending orders...")
-                
-                # Check each pending order with individual error handling
-                for exchange, order_id, side, price, quantity, is_modified, modified_price, modified_quantity in pending_orders:
-                    print(f"   Checking {exchange} {side} order {order_id[:8]}...")
-                    
-                    try:
-                        if exchange == 'Bybit':
-                            self.check_bybit_order(order_id)
-                        elif exchange == 'CoinDCX':
-                            self.check_coindcx_order(order_id)
-                    except Exception as e:
-                        print(f"❌ Error checking {exchange} order {order_id[:8]}...: {e}")
-                        # Continue with other orders instead of stopping
+                # The two exchanges are independent - poll them concurrently
+                # so a cycle takes the slower exchange's latency, not the sum
+                checks = []
+                if bybit_ids:
+                    checks.append(self._poll_executor.submit(self.check_bybit_orders, bybit_ids, bybit_symbols))
+                if coindcx_ids:
+                    checks.append(self._poll_executor.submit(self.check_coindcx_orders, coindcx_ids))
+                for check in checks:
+                    check.result()
                 
                 # Show current status
                 try:
@@ -1258,7 +1865,7 @@ class OrderMonitor:
                     print(f"❌ Error showing status: {e}")
                 
                 # Wait before next check
-                time.sleep(10)  # Check every 10 seconds
+                self._stopping.wait(10)  # Check every 10 seconds
                 
             except KeyboardInterrupt:
                 print("\n🛑 Monitoring stopped by user")
@@ -1266,57 +1873,114 @@ class OrderMonitor:
                 break
             except Exception as e:
                 print(f"❌ Monitor error: {e}")
-                time.sleep(5)  # Wait before retry
+                self._stopping.wait(5)  # Wait before retry
     
     def show_status(self):
-        """Show current order status"""
+        """
+        Show current order status.
+
+        Reprints the previous output without querying if no order was
+        changed by this monitor since, and it is under STATUS_CACHE_TTL old
+        (orders inserted by the bot show up within that time).
+        """
+        version = self._status_version
+        cached = self._status_cache
+        if cached and cached[0] == version and _monotonic() - cached[1] < self.STATUS_CACHE_TTL:
+            print(cached[2])
+            return
+
         try:
-            with self.conn.cursor() as cursor:
+            with self._cursor() as cursor:
+                # Totals and the latest activity in one round-trip: every row
+                # carries the totals, plus one recent order (NULLs if none)
                 cursor.execute("""
-                    SELECT 
-                        COUNT(*) as total,
-                        SUM(CASE WHEN status = 'PLACED' THEN 1 ELSE 0 END) as pending,
-                        SUM(CASE WHEN status = 'FILLED' THEN 1 ELSE 0 END) as filled,
-                        SUM(CASE WHEN status = 'CANCELLED' THEN 1 ELSE 0 END) as cancelled,
-                        SUM(CASE WHEN is_modified = TRUE THEN 1 ELSE 0 END) as modified
-                    FROM orders
-                """)
-                
-                row = cursor.fetchone()
-                total, pending, filled, cancelled, modified = row
-                
-                print(f"📊 Status: {total} total | {pending or 0} pending | {filled or 0} filled | {cancelled or 0} cancelled | {modified or 0} modified")
-                
-                # Show recent activity
-                cursor.execute("""
-                    SELECT exchange, side, status, fill_price, filled_at, is_modified, modified_price, modified_quantity
-                    FROM orders 
-                    WHERE status IN ('FILLED', 'CANCELLED') OR is_modified = TRUE
-                    ORDER BY COALESCE(filled_at, modified_at, placed_at) DESC
-                    LIMIT 5
+                    WITH totals AS (
+                        SELECT 
+                            COUNT(*) as total,
+                            SUM(CASE WHEN status IN ('PLACED', 'CANCELLING') THEN 1 ELSE 0 END) as pending,
+                            SUM(CASE WHEN status = 'FILLED' THEN 1 ELSE 0 END) as filled,
+                            SUM(CASE WHEN status = 'CANCELLED' THEN 1 ELSE 0 END) as cancelled,
+                            SUM(CASE WHEN is_modified = TRUE THEN 1 ELSE 0 END) as modified
+                        FROM orders
+                    ), recent AS (
+                        SELECT exchange, side, status, fill_price, filled_at, is_modified, modified_price, modified_quantity,
+                               COALESCE(filled_at, modified_at, placed_at) as activity_at
+                        FROM orders 
+                        WHERE status IN ('FILLED', 'CANCELLED') OR is_modified = TRUE
+                        ORDER BY activity_at DESC
+                        LIMIT 5
+                    )
+                    SELECT totals.*, recent.exchange, recent.side, recent.status, recent.fill_price,
+                           recent.filled_at, recent.is_modified, recent.modified_price, recent.modified_quantity
+                    FROM totals LEFT JOIN recent ON TRUE
+                    ORDER BY recent.activity_at DESC
                 """)
-                
-                recent = cursor.fetchall()
-                if recent:
-                    print("   Recent activity:")
-                    for exchange, side, status, fill_price, filled_at, is_modified, modified_price, modified_quantity in recent:
-                        fill_str = f"@ ${fill_price:.2f}" if fill_price else ""
-                        time_str = filled_at.strftime('%Y-%m-%d %H:%M:%S') if filled_at else "Unknown"
-                        modification_str = f" (MODIFIED to ${modified_price:.2f} x {modified_quantity})" if is_modified else ""
-                        print(f"     {exchange} {side} {status} {fill_str}{modification_str} at {time_str}")
-                
-                print("-" * 50)
+                rows = cursor.fetchall()
+
+            lines = []
+            total, pending, filled, cancelled, modified = rows[0][:5]
+            lines.append(f"📊 Status: {total} total | {pending or 0} pending | {filled or 0} filled | {cancelled or 0} cancelled | {modified or 0} modified")
+
+            # Show recent activity
+            recent = [row[5:] for row in rows if row[5] is not None]
+            if recent:
+                lines.append("   Recent activity:")
+                for exchange, side, status, fill_price, filled_at, is_modified, modified_price, modified_quantity in recent:
+                    fill_str = f"@ ${fill_price:.2f}" if fill_price else ""
+                    time_str = filled_at.strftime('%Y-%m-%d %H:%M:%S') if filled_at else "Unknown"
+                    modification_str = f" (MODIFIED to ${modified_price:.2f} x {modified_quantity})" if is_modified else ""
+                    lines.append(f"     {exchange} {side} {status} {fill_str}{modification_str} at {time_str}")
+
+            lines.append("-" * 50)
+
+            text = '\n'.join(lines)
+            self._status_cache = (version, _monotonic(), text)
+            print(text)
         except Exception as e:
             print(f"❌ Error showing status: {e}")
     
     def close(self):
         """Close connections gracefully"""
         self.running = False
-        
-        # Close database connection if it exists
-        if hasattr(self, 'conn') and self.conn:
+        self._stopping.set()
+        # Wake the CoinDCX WebSocket thread so it disconnects and exits
+        coindcx_stop = self._coindcx_stop
+        if coindcx_stop:
+            loop, stop = coindcx_stop
+            try:
+                loop.call_soon_threadsafe(stop.set)
+            except RuntimeError:
+                pass  # Loop already closed
+
+        # Let queued WebSocket updates and polls finish first: they still
+        # log events and need the pool
+        if hasattr(self, '_poll_executor'):
+            self._poll_executor.shutdown(wait=True)
+        if hasattr(self, '_bybit_db_executor'):
+            self._bybit_db_executor.shutdown(wait=True)
+        if hasattr(self, '_ws_db_executor'):
+            self._ws_db_executor.shutdown(wait=True)
+        # ...then the ChunkManager notifications they queued
+        if hasattr(self, '_notify_executor'):
+            self._notify_executor.shutdown(wait=True)
+
+        # Stop the event flusher only now that nothing queues events any
+        # more (its final flush writes anything still buffered)
+        if hasattr(self, '_event_flusher'):
+            self._event_flusher_stop.set()
+            self._event_wakeup.set()
+            self._event_flusher.join(timeout=5)
+            if not self._event_flusher.is_alive():
+                self._flush_events(force=True)  # Anything appended during the final flush
             try:
-                self.conn.close()
+                self._event_conn.close()
+            except Exception as e:
+                print(f"⚠️  Error closing event log connection: {e}")
+
+        # Close database connections if they exist
+        if getattr(self, 'pool', None):
+            try:
+                self.pool.closeall()
                 print("✅ Database connection closed")
             except Exception as e:
                 print(f"⚠️  Error closing database connection: {e}")
@@ -1336,7 +2000,33 @@ class OrderMonitor:
         except Exception as e:
             print(f"⚠️  Error closing CoinDCX WebSocket: {e}")
 
+def _setup_logging():
+    """
+    Route log records through a queue to a rotating file when run standalone.
+
+    Callers only enqueue; the listener thread does the file/console writes.
+    (When imported by the bot, main.py's logging setup is used instead.)
+    """
+    log_queue = queue.Queue(-1)
+    console = logging.StreamHandler()
+    console.setLevel(logging.INFO)
+    listener = QueueListener(
+        log_queue,
+        RotatingFileHandler('order_monitor.log', maxBytes=10 * 1024 * 1024,
+                            backupCount=5, delay=True),
+        console,
+        respect_handler_level=True
+    )
+    listener.start()
+    logging.basicConfig(
+        level=logging.DEBUG if os.getenv('ORDER_MONITOR_DEBUG') else logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+        handlers=[QueueHandler(log_queue)]
+    )
+    return listener
+
 def main():
+    log_listener = _setup_logging()
     monitor = OrderMonitor()
     
     try:
@@ -1345,6 +2035,7 @@ def main():
         print(f"❌ Monitor error: {e}")
     finally:
         monitor.close()
+        log_listener.stop()
 
 if __name__ == "__main__":
     main()
@@ -5,12 +5,219 @@ Simple script to get Last Traded Price (LTP) data for any cryptocurrency from bo
 """
 
 from price_feed.crypto_data_retriever import CryptoDataRetriever
+import asyncio
 import json
+import threading
+import time
+import weakref
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+
+# Typed view of one exchange's price data - numeric fields parsed once at ingestion
+TypedLTP = namedtuple('TypedLTP', 'ltp ts current_fr estimated_fr funding_ts')
+
+# Shared retriever - keeps one Redis connection pool alive across calls
+# instead of reconnecting (and PINGing) on every fetch
+_retriever = None
+_retriever_lock = threading.Lock()
+
+# Async retrievers, one per event loop - the async Redis pool is bound to the
+# loop it was first used on. Weak keys drop the entry when a loop is collected.
+_async_retrievers = weakref.WeakKeyDictionary()
+
+# Successful get_crypto_ltp results are reused for this long so duplicate
+# reads of a symbol within one tick don't hit Redis again
+LTP_CACHE_TTL = 0.5
+_ltp_cache = {}  # symbol -> (fetched_at monotonic, result)
+_ltp_cache_lock = threading.Lock()
+
+# Upper bound on concurrent per-symbol fetches in get_multiple_crypto_ltp*
+MAX_FETCH_WORKERS = 8
+
+def _get_retriever():
+    """
+    Get the shared CryptoDataRetriever, connecting on first use
+
+    Returns:
+        CryptoDataRetriever: Process-wide retriever instance
+    """
+    global _retriever
+    if _retriever is None:
+        with _retriever_lock:
+            if _retriever is None:
+                _retriever = CryptoDataRetriever()
+    return _retriever
+
+def _get_async_retriever():
+    """
+    Get the CryptoDataRetriever for the running event loop, creating it on first use
+
+    Returns:
+        CryptoDataRetriever: Retriever whose async Redis pool belongs to this loop
+    """
+    loop = asyncio.get_running_loop()
+    retriever = _async_retrievers.get(loop)
+    if retriever is None:
+        with _retriever_lock:
+            retriever = _async_retrievers.get(loop)
+            if retriever is None:
+                retriever = CryptoDataRetriever()
+                _async_retrievers[loop] = retriever
+    return retriever
+
+def _fetch_many(fetch, symbols):
+    """
+    Run a per-symbol fetch for all symbols concurrently
+
+    The shared retriever's Redis client is thread-safe, so symbols are read
+    in parallel and total latency is the slowest fetch rather than the sum.
+
+    Args:
+        fetch (callable): get_crypto_ltp or get_crypto_ltp_formatted
+        symbols (list): List of cryptocurrency symbols
+
+    Returns:
+        dict: fetch() result keyed by upper-cased symbol, in input order
+    """
+    symbols = [symbol.upper() for symbol in symbols]
+    if len(symbols) <= 1:
+        return {symbol: fetch(symbol) for symbol in symbols}
+
+    with ThreadPoolExecutor(max_workers=min(len(symbols), MAX_FETCH_WORKERS)) as executor:
+        return dict(zip(symbols, executor.map(fetch, symbols)))
+
+def _safe_float(value):
+    """
+    Parse a numeric price-feed field
+
+    Numbers are returned without going through float()/exception handling;
+    only non-empty strings are parsed.
+
+    Args:
+        value: Raw value from Redis (str, int, float or None)
+
+    Returns:
+        float, or None if missing or malformed
+    """
+    if isinstance(value, float):
+        return value
+    if isinstance(value, int) and not isinstance(value, bool):
+        return float(value)
+    if isinstance(value, str) and value:
+        try:
+            return float(value)
+        except ValueError:
+            return None
+    return None
+
+def _typed_ltp(data):
+    """
+    Build a TypedLTP from one exchange's bybit_data / coindcx_data dict
+
+    Args:
+        data (dict): Exchange price data from _build_ltp_result
+
+    Returns:
+        TypedLTP: Parsed values (funding fields are None for Bybit)
+    """
+    return TypedLTP(
+        ltp=_safe_float(data.get('ltp')),
+        ts=data.get('timestamp'),
+        current_fr=_safe_float(data.get('current_funding_rate')),
+        estimated_fr=_safe_float(data.get('estimated_funding_rate')),
+        funding_ts=data.get('funding_timestamp') or None
+    )
+
+def _build_ltp_result(symbol, crypto_data):
+    """
+    Extract LTP fields from CryptoDataRetriever output
+
+    Args:
+        symbol (str): Upper-cased cryptocurrency symbol
+        crypto_data (dict): Result of get_crypto_data / get_crypto_data_async
+
+    Returns:
+        dict: LTP data in the get_crypto_ltp format
+    """
+    # Extract comprehensive data
+    result = {
+        'symbol': symbol,
+        'timestamp': crypto_data['timestamp'],
+        'bybit_data': {
+            'ltp': None,
+            'timestamp': None
+        },
+        'coindcx_data': {
+            'ltp': None,
+            'timestamp': None,
+            'current_funding_rate': None,
+            'estimated_funding_rate': None,
+            'funding_timestamp': None
+        },
+        'success': True
+    }
+
+    # Extract Bybit data (LTP + timestamp)
+    if crypto_data['bybit']['latest_price']:
+        bybit_price = crypto_data['bybit']['latest_price']
+        if isinstance(bybit_price, dict):
+            result['bybit_data']['ltp'] = bybit_price.get('ltp')
+            result['bybit_data']['timestamp'] = bybit_price.get('timestamp')
+        elif isinstance(bybit_price, str):
+            result['bybit_data']['ltp'] = bybit_price
+        else:
+            result['bybit_data']['ltp'] = bybit_price
+
+    # Extract Bybit funding rate data
+    if crypto_data['bybit']['latest_funding_rate']:
+        bybit_funding = crypto_data['bybit']['latest_funding_rate']
+        if isinstance(bybit_funding, dict):
+            # If Bybit has funding data, we might want to include it
+            if 'timestamp' in bybit_funding and not result['bybit_data']['timestamp']:
+                result['bybit_data']['timestamp'] = bybit_funding.get('timestamp')
+
+    # Extract CoinDCX comprehensive data
+    if crypto_data['coindcx']['latest_price']:
+        coindcx_price = crypto_data['coindcx']['latest_price']
+        if isinstance(coindcx_price, dict):
+            result['coindcx_data']['ltp'] = coindcx_price.get('ltp')
+            result['coindcx_data']['timestamp'] = coindcx_price.get('timestamp')
+            # CoinDCX funding rates might be in the price data or separate
+            result['coindcx_data']['current_funding_rate'] = coindcx_price.get('current_funding_rate')
+            result['coindcx_data']['estimated_funding_rate'] = coindcx_price.get('estimated_funding_rate')
+            result['coindcx_data']['funding_timestamp'] = coindcx_price.get('funding_timestamp')
+        elif isinstance(coindcx_price, str):
+            result['coindcx_data']['ltp'] = coindcx_price
+        else:
+            result['coindcx_data']['ltp'] = coindcx_price
+
+    # Check for CoinDCX funding data in separate funding rate field
+    # Look through all CoinDCX data for funding information
+    for data_list in [crypto_data['coindcx']['spot_prices']]:
+        if data_list:
+            # Get the latest funding data if available
+            latest_funding = data_list[-1] if isinstance(data_list, list) and data_list else data_list
+            if isinstance(latest_funding, dict):
+                if 'current_funding_rate' in latest_funding and not result['coindcx_data']['current_funding_rate']:
+                    result['coindcx_data']['current_funding_rate'] = latest_funding.get('current_funding_rate')
+                if 'estimated_funding_rate' in latest_funding and not result['coindcx_data']['estimated_funding_rate']:
+                    result['coindcx_data']['estimated_funding_rate'] = latest_funding.get('estimated_funding_rate')
+                if 'funding_timestamp' in latest_funding and not result['coindcx_data']['funding_timestamp']:
+                    result['coindcx_data']['funding_timestamp'] = latest_funding.get('funding_timestamp')
+
+    # Parsed once here so consumers (PriceService) skip per-call float() coercion
+    result['bybit_typed'] = _typed_ltp(result['bybit_data'])
+    result['coindcx_typed'] = _typed_ltp(result['coindcx_data'])
+
+    return result
 
 def get_crypto_ltp(symbol):
     """
     Get cryptocurrency Last Traded Price from both exchanges
 
+    Results are cached per symbol for LTP_CACHE_TTL seconds; callers must
+    not mutate the returned dict.
+
     Args:
         symbol (str): Cryptocurrency symbol (e.g., 'ETH', 'BTC', 'SOL')
 
@@ -19,80 +226,55 @@ def get_crypto_ltp(symbol):
     """
     symbol = symbol.upper()
 
+    now = time.monotonic()
+    with _ltp_cache_lock:
+        cached = _ltp_cache.get(symbol)
+    if cached is not None and now - cached[0] < LTP_CACHE_TTL:
+        return cached[1]
+
     try:
-        # Initialize the crypto data retriever
-        retriever = CryptoDataRetriever()
+        # Reuse the shared crypto data retriever (persistent Redis connection)
+        retriever = _get_retriever()
 
         # Get crypto data for the specified symbol
         crypto_data = retriever.get_crypto_data(symbol)
 
-        # Extract comprehensive data
-        result = {
+        result = _build_ltp_result(symbol, crypto_data)
+        with _ltp_cache_lock:
+            _ltp_cache[symbol] = (now, result)
+        return result
+
+    except Exception as e:
+        return {
             'symbol': symbol,
-            'timestamp': crypto_data['timestamp'],
-            'bybit_data': {
-                'ltp': None,
-                'timestamp': None
-            },
-            'coindcx_data': {
-                'ltp': None,
-                'timestamp': None,
-                'current_funding_rate': None,
-                'estimated_funding_rate': None,
-                'funding_timestamp': None
-            },
-            'success': True
+            'success': False,
+            'error': str(e),
+            'bybit_data': None,
+            'coindcx_data': None
         }
 
-        # Extract Bybit data (LTP + timestamp)
-        if crypto_data['bybit']['latest_price']:
-            bybit_price = crypto_data['bybit']['latest_price']
-            if isinstance(bybit_price, dict):
-                result['bybit_data']['ltp'] = bybit_price.get('ltp')
-                result['bybit_data']['timestamp'] = bybit_price.get('timestamp')
-            elif isinstance(bybit_price, str):
-                result['bybit_data']['ltp'] = bybit_price
-            else:
-                result['bybit_data']['ltp'] = bybit_price
-
-        # Extract Bybit funding rate data
-        if crypto_data['bybit']['latest_funding_rate']:
-            bybit_funding = crypto_data['bybit']['latest_funding_rate']
-            if isinstance(bybit_funding, dict):
-                # If Bybit has funding data, we might want to include it
-                if 'timestamp' in bybit_funding and not result['bybit_data']['timestamp']:
-                    result['bybit_data']['timestamp'] = bybit_funding.get('timestamp')
-
-        # Extract CoinDCX comprehensive data
-        if crypto_data['coindcx']['latest_price']:
-            coindcx_price = crypto_data['coindcx']['latest_price']
-            if isinstance(coindcx_price, dict):
-                result['coindcx_data']['ltp'] = coindcx_price.get('ltp')
-                result['coindcx_data']['timestamp'] = coindcx_price.get('timestamp')
-                # CoinDCX funding rates might be in the price data or separate
-                result['coindcx_data']['current_funding_rate'] = coindcx_price.get('current_funding_rate')
-                result['coindcx_data']['estimated_funding_rate'] = coindcx_price.get('estimated_funding_rate')
-                result['coindcx_data']['funding_timestamp'] = coindcx_price.get('funding_timestamp')
-            elif isinstance(coindcx_price, str):
-                result['coindcx_data']['ltp'] = coindcx_price
-            else:
-                result['coindcx_data']['ltp'] = coindcx_price
-
-        # Check for CoinDCX funding data in separate funding rate field
-        # Look through all CoinDCX data for funding information
-        for data_list in [crypto_data['coindcx']['spot_prices']]:
-            if data_list:
-                # Get the latest funding data if available
-                latest_funding = data_list[-1] if isinstance(data_list, list) and data_list else data_list
-                if isinstance(latest_funding, dict):
-                    if 'current_funding_rate' in latest_funding and not result['coindcx_data']['current_funding_rate']:
-                        result['coindcx_data']['current_funding_rate'] = latest_funding.get('current_funding_rate')
-                    if 'estimated_funding_rate' in latest_funding and not result['coindcx_data']['estimated_funding_rate']:
-                        result['coindcx_data']['estimated_funding_rate'] = latest_funding.get('estimated_funding_rate')
-                    if 'funding_timestamp' in latest_funding and not result['coindcx_data']['funding_timestamp']:
-                        result['coindcx_data']['funding_timestamp'] = latest_funding.get('funding_timestamp')
+async def get_crypto_ltp_async(symbol, retriever=None):
+    """
+    Async variant of get_crypto_ltp - Bybit and CoinDCX keys are read concurrently
 
-        return result
+    Args:
+        symbol (str): Cryptocurrency symbol (e.g., 'ETH', 'BTC', 'SOL')
+        retriever (CryptoDataRetriever): Reused retriever (keeps its async
+            Redis pool alive between calls); the running loop's shared
+            retriever is used if None
+
+    Returns:
+        dict: LTP data for the symbol from Bybit and CoinDCX
+    """
+    symbol = symbol.upper()
+
+    try:
+        if retriever is None:
+            retriever = _get_async_retriever()
+
+        crypto_data = await retriever.get_crypto_data_async(symbol)
+
+        return _build_ltp_result(symbol, crypto_data)
 
     except Exception as e:
         return {
@@ -114,17 +296,19 @@ def get_crypto_ltp_formatted(symbol):
         dict: Enhanced LTP data with price analysis
     """
     symbol = symbol.upper()
-    result = get_crypto_ltp(symbol)
+    # Shallow copy - the cached get_crypto_ltp result must not gain price_analysis
+    result = dict(get_crypto_ltp(symbol))
 
     if result['success']:
         # Add price analysis if both prices are available
+        # (typed LTPs are already floats; None if missing or non-numeric)
         bybit_ltp = result['bybit_data']['ltp'] if result['bybit_data'] else None
         coindcx_ltp = result['coindcx_data']['ltp'] if result['coindcx_data'] else None
 
         if bybit_ltp and coindcx_ltp:
-            try:
-                bybit_price = float(bybit_ltp)
-                coindcx_price = float(coindcx_ltp)
+            bybit_price = result['bybit_typed'].ltp
+            coindcx_price = result['coindcx_typed'].ltp
+            if bybit_price and coindcx_price:
                 difference = abs(bybit_price - coindcx_price)
                 percentage_diff = (difference / min(bybit_price, coindcx_price)) * 100
 
@@ -134,7 +318,7 @@ def get_crypto_ltp_formatted(symbol):
                     'higher_exchange': 'bybit' if bybit_price > coindcx_price else 'coindcx' if coindcx_price > bybit_price else 'equal',
                     'difference_amount': round(difference, 2)
                 }
-            except ValueError:
+            else:
                 result['price_analysis'] = {
                     'error': 'Could not calculate price difference (non-numeric values)'
                 }
@@ -147,7 +331,7 @@ def get_crypto_ltp_formatted(symbol):
 
 def get_multiple_crypto_ltp(symbols):
     """
-    Get LTP data for multiple cryptocurrencies
+    Get LTP data for multiple cryptocurrencies (symbols fetched concurrently)
 
     Args:
         symbols (list): List of cryptocurrency symbols
@@ -155,14 +339,11 @@ def get_multiple_crypto_ltp(symbols):
     Returns:
         dict: LTP data for all symbols
     """
-    results = {}
-    for symbol in symbols:
-        results[symbol.upper()] = get_crypto_ltp(symbol)
-    return results
+    return _fetch_many(get_crypto_ltp, symbols)
 
 def get_multiple_crypto_ltp_formatted(symbols):
     """
-    Get LTP data for multiple cryptocurrencies with formatting
+    Get LTP data for multiple cryptocurrencies with formatting (fetched concurrently)
 
     Args:
         symbols (list): List of cryptocurrency symbols
@@ -170,10 +351,7 @@ def get_multiple_crypto_ltp_formatted(symbols):
     Returns:
         dict: LTP data with analysis for all symbols
     """
-    results = {}
-    for symbol in symbols:
-        results[symbol.upper()] = get_crypto_ltp_formatted(symbol)
-    return results
+    return _fetch_many(get_crypto_ltp_formatted, symbols)
 
 def print_crypto_ltp(symbol):
     """
@@ -5,11 +5,21 @@ A simple utility to retrieve cryptocurrency data stored in Redis database by Byb
 """
 
 import redis
+import redis.asyncio as aioredis
+import asyncio
 import json
 from typing import Dict, List, Optional, Union
 from datetime import datetime
 import time
 
+# Optional fast JSON decoder - orjson.JSONDecodeError subclasses
+# json.JSONDecodeError, so the except clauses below work with either
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
 
 class CryptoDataRetriever:
     def __init__(self, redis_host='localhost', redis_port=6379, redis_db=0):
@@ -21,6 +31,11 @@ class CryptoDataRetriever:
             redis_port (int): Redis server port
             redis_db (int): Redis database number
         """
+        self.redis_host = redis_host
+        self.redis_port = redis_port
+        self.redis_db = redis_db
+        self._async_client = None  # Created on first async call (bound to that event loop)
+
         try:
             self.redis_client = redis.Redis(
                 host=redis_host,
@@ -46,25 +61,7 @@ class CryptoDataRetriever:
             Dict: Contains all data for the cryptocurrency from both exchanges
         """
         symbol = symbol.upper()
-        result = {
-            'symbol': symbol,
-            'timestamp': datetime.now().isoformat(),
-            'bybit': {
-                'spot_prices': [],
-                'funding_rates': [],
-                'latest_price': None,
-                'latest_funding_rate': None
-            },
-            'coindcx': {
-                'spot_prices': [],
-                'latest_price': None
-            },
-            'combined_stats': {
-                'total_price_updates': 0,
-                'price_range': {'min': None, 'max': None},
-                'latest_update': None
-            }
-        }
+        result = self._empty_result(symbol)
 
         # Get all Redis keys
         all_keys = self.redis_client.keys('*')
@@ -101,11 +98,103 @@ class CryptoDataRetriever:
 
         return result
 
+    async def get_crypto_data_async(self, symbol: str) -> Dict:
+        """
+        Async variant of get_crypto_data - reads all keys concurrently
+
+        Key types and values are fetched with asyncio.gather over one
+        keep-alive async Redis connection pool, so Bybit and CoinDCX data
+        arrive in parallel instead of one round-trip per key.
+
+        Args:
+            symbol (str): Cryptocurrency symbol (e.g., 'ETH', 'BTC', 'SOL')
+
+        Returns:
+            Dict: Same structure as get_crypto_data
+        """
+        symbol = symbol.upper()
+        result = self._empty_result(symbol)
+
+        if self._async_client is None:
+            self._async_client = aioredis.Redis(
+                host=self.redis_host,
+                port=self.redis_port,
+                db=self.redis_db,
+                decode_responses=True
+            )
+        client = self._async_client
+
+        all_keys = await client.keys('*')
+        symbol_keys = [key for key in all_keys if symbol in key.upper()]
+
+        data_types = await asyncio.gather(
+            *(client.type(key) for key in symbol_keys),
+            return_exceptions=True
+        )
+
+        readers = {
+            'string': lambda key: client.get(key),
+            'list': lambda key: client.lrange(key, 0, -1),
+            'zset': lambda key: client.zrange(key, 0, -1, withscores=True),
+            'hash': lambda key: client.hgetall(key),
+        }
+        pending = [
+            (key, data_type)
+            for key, data_type in zip(symbol_keys, data_types)
+            if not isinstance(data_type, Exception) and data_type in readers
+        ]
+        values = await asyncio.gather(
+            *(readers[data_type](key) for key, data_type in pending),
+            return_exceptions=True
+        )
+
+        processors = {
+            'string': self._process_string_data,
+            'list': self._process_list_data,
+            'zset': self._process_zset_data,
+            'hash': self._process_hash_data,
+        }
+        for (key, data_type), value in zip(pending, values):
+            try:
+                if isinstance(value, Exception):
+                    raise value
+                processors[data_type](key, value, result)
+            except Exception as e:
+                print(f"Error processing key {key}: {e}")
+
+        # Calculate combined statistics
+        self._calculate_stats(result)
+
+        return result
+
+    @staticmethod
+    def _empty_result(symbol: str) -> Dict:
+        """Result skeleton shared by get_crypto_data and get_crypto_data_async"""
+        return {
+            'symbol': symbol,
+            'timestamp': datetime.now().isoformat(),
+            'bybit': {
+                'spot_prices': [],
+                'funding_rates': [],
+                'latest_price': None,
+                'latest_funding_rate': None
+            },
+            'coindcx': {
+                'spot_prices': [],
+                'latest_price': None
+            },
+            'combined_stats': {
+                'total_price_updates': 0,
+                'price_range': {'min': None, 'max': None},
+                'latest_update': None
+            }
+        }
+
     def _process_string_data(self, key: str, value: str, result: Dict):
         """Process string type Redis data"""
         try:
             # Try to parse as JSON first
-            parsed_data = json.loads(value)
+            parsed_data = _json_loads(value)
             if 'bybit' in key.lower():
                 if 'funding' in key.lower():
                     result['bybit']['latest_funding_rate'] = parsed_data
@@ -128,7 +217,7 @@ class CryptoDataRetriever:
         processed_values = []
         for value in values:
             try:
-                parsed = json.loads(value)
+                parsed = _json_loads(value)
                 processed_values.append(parsed)
             except json.JSONDecodeError:
                 processed_values.append(value)
@@ -146,7 +235,7 @@ class CryptoDataRetriever:
         processed_values = []
         for value, score in values:
             try:
-                parsed = json.loads(value)
+                parsed = _json_loads(value)
                 processed_values.append({'data': parsed, 'score': score})
             except json.JSONDecodeError:
                 processed_values.append({'data': value, 'score': score})
@@ -0,0 +1,99 @@
+"""
+Tests for OrderManager's Phase 1 modification cycle.
+
+Exchange and database calls are replaced on the instance, so these run
+without credentials, Redis or PostgreSQL.
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add repository root to path to enable imports
+repo_root = Path(__file__).resolve().parent.parent
+if str(repo_root) not in sys.path:
+    sys.path.insert(0, str(repo_root))
+
+import core.order_manager as order_manager_module  # noqa: E402
+from config.symbol_config import SymbolConfig  # noqa: E402
+from core.order_manager import OrderManager  # noqa: E402
+from utils.exceptions import OrderException  # noqa: E402
+
+
+class _FakePriceService:
+    def get_validated_prices(self, symbol, trust_level='full'):
+        return {
+            'bybit': {'price': 2500.0},
+            'coindcx': {'price': 2500.5},
+            'spread': 0.02,
+        }
+
+
+def _sequential(*calls):
+    """_run_concurrently without the background loop: results in call order, exceptions returned."""
+    results = []
+    for call in calls:
+        try:
+            results.append(call())
+        except Exception as e:
+            results.append(e)
+    return results
+
+
+@pytest.fixture
+def manager(monkeypatch):
+    """OrderManager with only what _active_management_loop touches set up."""
+    monkeypatch.setattr(order_manager_module.time, 'sleep', lambda seconds: None)
+    om = OrderManager.__new__(OrderManager)
+    om.config = SymbolConfig()
+    om.price_service = _FakePriceService()
+    om._run_concurrently = _sequential
+    return om
+
+
+def test_apply_results_tracks_coindcx_replacement_when_bybit_fails():
+    error = OrderException('Bybit', 'modification', 'amend rejected')
+
+    bybit_id, coindcx_id, closed, raised = OrderManager._apply_modification_results(
+        'bybit-1', 'dcx-old', error, 'dcx-new'
+    )
+
+    assert (bybit_id, coindcx_id, closed) == ('bybit-1', 'dcx-new', False)
+    assert raised is error
+
+
+def test_apply_results_reports_coindcx_closed_when_bybit_fails():
+    error = OrderException('Bybit', 'modification', 'amend rejected')
+
+    assert OrderManager._apply_modification_results('bybit-1', 'dcx-1', error, None) == (
+        'bybit-1', 'dcx-1', True, error
+    )
+
+
+def test_apply_results_success():
+    assert OrderManager._apply_modification_results('bybit-2', 'dcx-1', 'bybit-3', 'dcx-1') == (
+        'bybit-3', 'dcx-1', False, None
+    )
+
+
+def test_loop_keeps_coindcx_replacement_when_bybit_modify_raises(manager):
+    statuses = iter([('OPEN', 'OPEN')] * 6 + [('OPEN', 'FILLED')])
+    checked = []
+
+    def check_order_statuses(bybit_order_id, coindcx_order_id):
+        checked.append((bybit_order_id, coindcx_order_id))
+        return next(statuses)
+
+    def modify_bybit(symbol, order_id, price):
+        raise OrderException('Bybit', 'modification', 'amend rejected')
+
+    manager._check_order_statuses = check_order_statuses
+    manager._modify_bybit_order = modify_bybit
+    manager._modify_coindcx_order = lambda symbol, order_id, price: 'dcx-new'
+
+    result = manager._active_management_loop('ETH', 'bybit-1', 'dcx-old')
+
+    # The replacement order is what the loop tracks (and hands to Phase 2)
+    assert result == ('CoinDCX', 'bybit-1', 'dcx-new')
+    assert checked[-1] == ('bybit-1', 'dcx-new')
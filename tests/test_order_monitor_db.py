@@ -0,0 +1,380 @@
+"""
+DB-backed tests for OrderMonitor's status update and event log paths.
+
+Run against a scratch PostgreSQL database:
+
+    TEST_POSTGRES_DB=hedge_bot_test python -m pytest tests/
+
+Connection settings come from POSTGRES_HOST/PORT/USER/PASSWORD, as for the
+monitor itself. Each test works in its own schema, dropped afterwards.
+"""
+
+import os
+import select
+import sys
+import threading
+import uuid
+from collections import deque
+from pathlib import Path
+
+import pytest
+
+psycopg2 = pytest.importorskip("psycopg2")
+from psycopg2.pool import ThreadedConnectionPool  # noqa: E402
+
+TEST_DB = os.getenv('TEST_POSTGRES_DB')
+pytestmark = pytest.mark.skipif(
+    not TEST_DB, reason="TEST_POSTGRES_DB not set (scratch database for DB-backed tests)"
+)
+
+# Add repository root to path to enable imports
+repo_root = Path(__file__).resolve().parent.parent
+if str(repo_root) not in sys.path:
+    sys.path.insert(0, str(repo_root))
+
+from order_monitor import OrderMonitor  # noqa: E402
+from utils.db import PreparedConnection  # noqa: E402
+
+
+# The columns OrderMonitor reads and writes (postgresql_schema.sql,
+# Database.create_tables and migrations/003)
+SCHEMA_SQL = """
+    CREATE TABLE orders (
+        id SERIAL PRIMARY KEY,
+        chunk_group_id VARCHAR(50),
+        chunk_sequence INTEGER,
+        chunk_total INTEGER,
+        exchange VARCHAR(20) NOT NULL,
+        symbol VARCHAR(20) NOT NULL,
+        side VARCHAR(10) NOT NULL,
+        quantity DECIMAL(20, 8) NOT NULL,
+        price DECIMAL(20, 8) NOT NULL,
+        order_id VARCHAR(100) NOT NULL,
+        status VARCHAR(20) NOT NULL,
+        fill_price DECIMAL(20, 8),
+        filled_at TIMESTAMP WITH TIME ZONE,
+        reject_reason VARCHAR(100),
+        placed_at TIMESTAMP WITH TIME ZONE DEFAULT NOW()
+    );
+    CREATE TABLE order_lifecycle_log (
+        id SERIAL PRIMARY KEY,
+        chunk_group_id VARCHAR(50) NOT NULL,
+        chunk_sequence INTEGER NOT NULL,
+        exchange VARCHAR(20) NOT NULL,
+        order_id VARCHAR(100),
+        event_type VARCHAR(50) NOT NULL,
+        event_details JSONB,
+        timestamp TIMESTAMP NOT NULL DEFAULT NOW()
+    );
+    CREATE TABLE bybit_order_events (
+        id SERIAL PRIMARY KEY,
+        order_id VARCHAR(100) NOT NULL,
+        symbol VARCHAR(20) NOT NULL,
+        event_type VARCHAR(20) NOT NULL,
+        order_status VARCHAR(20),
+        side VARCHAR(10),
+        order_type VARCHAR(20),
+        price NUMERIC(20, 8),
+        qty NUMERIC(18, 8),
+        cum_exec_qty NUMERIC(18, 8),
+        cum_exec_fee NUMERIC(18, 8),
+        cum_exec_value NUMERIC(20, 8),
+        avg_price NUMERIC(20, 8),
+        time_in_force VARCHAR(20),
+        reject_reason VARCHAR(100),
+        order_created_time BIGINT,
+        order_updated_time BIGINT,
+        raw_payload JSONB,
+        chunk_group_id UUID,
+        chunk_sequence INTEGER,
+        chunk_total INTEGER
+    );
+    CREATE TABLE coindcx_order_events (
+        id SERIAL PRIMARY KEY,
+        order_id VARCHAR(100) NOT NULL,
+        pair VARCHAR(30) NOT NULL,
+        event_type VARCHAR(20) NOT NULL,
+        order_status VARCHAR(20),
+        side VARCHAR(10),
+        order_type VARCHAR(30),
+        price NUMERIC(20, 8),
+        total_quantity NUMERIC(18, 8),
+        remaining_quantity NUMERIC(18, 8),
+        avg_price NUMERIC(20, 8),
+        fee_amount NUMERIC(18, 8),
+        raw_payload JSONB,
+        chunk_group_id UUID,
+        chunk_sequence INTEGER,
+        chunk_total INTEGER
+    );
+"""
+
+
+@pytest.fixture
+def db_params():
+    """Connection parameters for a fresh schema, dropped after the test."""
+    params = dict(
+        host=os.getenv('POSTGRES_HOST', 'localhost'),
+        port=os.getenv('POSTGRES_PORT', 5432),
+        database=TEST_DB,
+        user=os.getenv('POSTGRES_USER', 'hedge_user'),
+        password=os.getenv('POSTGRES_PASSWORD', 'hedge_password'),
+        connect_timeout=5
+    )
+    schema = f"test_order_monitor_{uuid.uuid4().hex[:12]}"
+    admin = psycopg2.connect(**params)
+    admin.autocommit = True
+    with admin.cursor() as cursor:
+        cursor.execute(f"CREATE SCHEMA {schema}")
+        cursor.execute(f"SET search_path TO {schema}")
+        cursor.execute(SCHEMA_SQL)
+    try:
+        yield dict(params, options=f"-c search_path={schema}")
+    finally:
+        with admin.cursor() as cursor:
+            cursor.execute(f"DROP SCHEMA {schema} CASCADE")
+        admin.close()
+
+
+@pytest.fixture
+def monitor(db_params):
+    """
+    OrderMonitor with only its database state set up.
+
+    __init__ also builds exchange clients and worker threads, none of which
+    the status update and event flush paths use.
+    """
+    mon = OrderMonitor.__new__(OrderMonitor)
+    mon._db_params = db_params
+    mon.pool = ThreadedConnectionPool(1, 2, connection_factory=PreparedConnection, **db_params)
+    mon._has_modified_cols = True
+    mon._has_fee_cols = True
+    mon._status_version = 0
+    mon._event_buffer = deque()
+    mon._event_wakeup = threading.Event()
+    mon.events_dropped = 0
+    mon._event_retry_at = 0.0
+    mon._event_conn = mon._connect_event_conn()
+    try:
+        yield mon
+    finally:
+        mon._event_conn.close()
+        mon.pool.closeall()
+
+
+@pytest.fixture
+def query(db_params):
+    """Run a statement on a separate connection and return all rows."""
+    conn = psycopg2.connect(**db_params)
+    conn.autocommit = True
+
+    def run(sql, params=None):
+        with conn.cursor() as cursor:
+            cursor.execute(sql, params)
+            return cursor.fetchall() if cursor.description else None
+
+    try:
+        yield run
+    finally:
+        conn.close()
+
+
+@pytest.fixture
+def listener(db_params):
+    """Connection LISTENing on the order status channel."""
+    conn = psycopg2.connect(**db_params)
+    conn.autocommit = True
+    with conn.cursor() as cursor:
+        cursor.execute("LISTEN order_status")
+    try:
+        yield conn
+    finally:
+        conn.close()
+
+
+def _insert_order(query, order_id, chunk_group_id=None, exchange='bybit', status='PLACED'):
+    query(
+        """
+        INSERT INTO orders (chunk_group_id, chunk_sequence, chunk_total, exchange,
+                            symbol, side, quantity, price, order_id, status)
+        VALUES (%s, 1, 2, %s, 'ETHUSDT', 'Buy', 0.5, 2500.12345678, %s, %s)
+        """,
+        (chunk_group_id, exchange, order_id, status)
+    )
+
+
+def _notifications(conn, count, timeout=2.0):
+    """Payloads of the next `count` notifications on conn."""
+    payloads = []
+    while len(payloads) < count:
+        if select.select([conn], [], [], timeout) == ([], [], []):
+            break
+        conn.poll()
+        while conn.notifies:
+            payloads.append(conn.notifies.pop(0).payload)
+    return payloads
+
+
+def test_update_order_status_filled(monitor, query, listener):
+    group = str(uuid.uuid4())
+    _insert_order(query, 'ord-filled', chunk_group_id=group)
+
+    monitor.update_order_status('ord-filled', 'FILLED', fill_price='2500.5')
+
+    assert query("SELECT status, fill_price::float8, filled_at IS NOT NULL FROM orders "
+                 "WHERE order_id = 'ord-filled'") == [('FILLED', 2500.5, True)]
+    assert query("SELECT chunk_group_id, chunk_sequence, exchange, event_type, event_details "
+                 "FROM order_lifecycle_log WHERE order_id = 'ord-filled'") == [
+        (group, 1, 'bybit', 'FILLED', {'fill_price': 2500.5, 'side': 'Buy', 'quantity': 0.5})
+    ]
+    assert _notifications(listener, 1) == ['ord-filled:FILLED']
+    assert monitor._status_version == 1
+
+
+def test_update_order_status_rejected(monitor, query, listener):
+    group = str(uuid.uuid4())
+    _insert_order(query, 'ord-rejected', chunk_group_id=group)
+
+    monitor.update_order_status('ord-rejected', 'REJECTED',
+                                reject_reason='EC_PostOnlyWillTakeLiquidity')
+
+    assert query("SELECT status, reject_reason FROM orders WHERE order_id = 'ord-rejected'") == [
+        ('REJECTED', 'EC_PostOnlyWillTakeLiquidity')
+    ]
+    assert query("SELECT event_type, event_details FROM order_lifecycle_log "
+                 "WHERE order_id = 'ord-rejected'") == [
+        ('REJECTED', {'reject_reason': 'EC_PostOnlyWillTakeLiquidity',
+                      'side': 'Buy', 'quantity': 0.5})
+    ]
+    assert _notifications(listener, 1) == ['ord-rejected:REJECTED']
+
+
+def test_update_order_status_without_chunk_skips_lifecycle(monitor, query, listener):
+    _insert_order(query, 'ord-manual')
+
+    monitor.update_order_status('ord-manual', 'CANCELLED')
+
+    assert query("SELECT status FROM orders WHERE order_id = 'ord-manual'") == [('CANCELLED',)]
+    assert query("SELECT count(*) FROM order_lifecycle_log") == [(0,)]
+    # Waiters are woken for every status change, chunk or not
+    assert _notifications(listener, 1) == ['ord-manual:CANCELLED']
+
+
+def test_update_order_status_unknown_order(monitor, query, listener):
+    monitor.update_order_status('ord-missing', 'FILLED', fill_price=1.0)
+
+    assert query("SELECT count(*) FROM order_lifecycle_log") == [(0,)]
+    # The NOTIFY is unconditional; waiters re-read the row
+    assert _notifications(listener, 1) == ['ord-missing:FILLED']
+
+
+def test_update_order_statuses_batch(monitor, query, listener):
+    group = str(uuid.uuid4())
+    _insert_order(query, 'ord-a', chunk_group_id=group)
+    _insert_order(query, 'ord-b', chunk_group_id=group, exchange='coindcx')
+
+    monitor.update_order_statuses([
+        ('ord-a', 'FILLED', 2501.0),
+        ('ord-b', 'CANCELLED', None),
+    ])
+
+    assert query("SELECT order_id, status, fill_price::float8 FROM orders ORDER BY order_id") == [
+        ('ord-a', 'FILLED', 2501.0),
+        ('ord-b', 'CANCELLED', None),
+    ]
+    assert query("SELECT order_id, event_type FROM order_lifecycle_log ORDER BY order_id") == [
+        ('ord-a', 'FILLED'),
+        ('ord-b', 'CANCELLED'),
+    ]
+    assert sorted(_notifications(listener, 2)) == ['ord-a:FILLED', 'ord-b:CANCELLED']
+
+
+def _bybit_event(order_id, status='New', **extra):
+    return dict({
+        'orderId': order_id, 'symbol': 'ETHUSDT', 'orderStatus': status,
+        'side': 'Buy', 'orderType': 'Limit', 'price': '2500.1', 'qty': '0.5',
+        'cumExecQty': '0', 'cumExecFee': '0', 'cumExecValue': '0', 'avgPrice': '',
+        'timeInForce': 'PostOnly', 'createdTime': '1700000000000',
+        'updatedTime': '1700000000001'
+    }, **extra)
+
+
+def _coindcx_event(order_id, status='open'):
+    return {
+        'id': order_id, 'pair': 'B-ETH_USDT', 'status': status, 'side': 'sell',
+        'order_type': 'limit_order', 'price': 2501.2, 'total_quantity': 0.5,
+        'remaining_quantity': 0.5, 'avg_price': 0, 'fee_amount': 0
+    }
+
+
+def test_flush_events_insert_branch(monitor, query):
+    group = str(uuid.uuid4())
+    _insert_order(query, 'bb-1', chunk_group_id=group)
+    _insert_order(query, 'dcx-1', chunk_group_id=group, exchange='coindcx')
+
+    monitor._queue_event('bybit', 'bb-1', _bybit_event('bb-1'))
+    monitor._queue_event('bybit', 'bb-1', _bybit_event('bb-1', 'Filled', avgPrice='2500.1'))
+    monitor._queue_event('coindcx', 'dcx-1', _coindcx_event('dcx-1'))
+    # No orders row yet - logged without chunk context
+    monitor._queue_event('bybit', 'bb-orphan', _bybit_event('bb-orphan'))
+    assert len(monitor._event_buffer) < OrderMonitor.EVENT_COPY_MIN_ROWS
+
+    monitor._flush_events()
+
+    assert not monitor._event_buffer
+    assert monitor.events_dropped == 0
+    assert query("SELECT order_id, event_type, avg_price::float8, chunk_group_id::text, "
+                 "chunk_sequence, chunk_total FROM bybit_order_events ORDER BY id") == [
+        ('bb-1', 'NEW', None, group, 1, 2),
+        ('bb-1', 'FILLED', 2500.1, group, 1, 2),
+        ('bb-orphan', 'NEW', None, None, None, None),
+    ]
+    assert query("SELECT order_id, pair, event_type, raw_payload->>'status', "
+                 "chunk_group_id::text FROM coindcx_order_events") == [
+        ('dcx-1', 'B-ETH_USDT', 'open', 'open', group)
+    ]
+
+
+def test_flush_events_copy_branch(monitor, query):
+    group = str(uuid.uuid4())
+    _insert_order(query, 'bb-copy', chunk_group_id=group)
+    count = OrderMonitor.EVENT_COPY_MIN_ROWS
+
+    # Characters COPY text format has to escape survive the round-trip
+    awkward = 'tab\there\\back\nnewline\rcr'
+    for i in range(count):
+        monitor._queue_event('bybit', 'bb-copy',
+                             _bybit_event('bb-copy', 'PartiallyFilled',
+                                          cumExecQty=str(i), note=awkward))
+    monitor._queue_event('coindcx', 'dcx-small', _coindcx_event('dcx-small'))
+
+    monitor._flush_events()
+
+    assert not monitor._event_buffer
+    assert query("SELECT count(*), count(DISTINCT cum_exec_qty), min(chunk_group_id::text), "
+                 "max(chunk_group_id::text) FROM bybit_order_events") == [
+        (count, count, group, group)
+    ]
+    assert query("SELECT DISTINCT raw_payload->>'note' FROM bybit_order_events") == [(awkward,)]
+    # The other table stays below the threshold and goes through INSERT
+    assert query("SELECT order_id FROM coindcx_order_events") == [('dcx-small',)]
+
+
+def test_flush_events_falls_back_to_rows(monitor, query):
+    monitor._queue_event('bybit', 'bb-good', _bybit_event('bb-good'))
+    # Fails at the database (qty out of range for NUMERIC(18, 8))
+    monitor._queue_event('bybit', 'bb-bad', _bybit_event('bb-bad', qty='1e20'))
+
+    monitor._flush_events()
+
+    assert query("SELECT order_id FROM bybit_order_events") == [('bb-good',)]
+    assert monitor.events_dropped == 1
+
+
+def test_flush_events_reopens_closed_connection(monitor, query):
+    monitor._queue_event('bybit', 'bb-1', _bybit_event('bb-1'))
+    monitor._event_conn.close()
+
+    # Closed connection is reopened before writing
+    monitor._flush_events()
+    assert query("SELECT order_id FROM bybit_order_events") == [('bb-1',)]
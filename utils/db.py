@@ -4,9 +4,15 @@ Handles order tracking and trade history storage.
 """
 
 import os
+import select
+import threading
+import time
+import weakref
 import psycopg2
-from psycopg2.extras import RealDictCursor
-from typing import Optional, Dict, List, Any
+from psycopg2.extras import RealDictCursor, execute_batch, execute_values
+from psycopg2.pool import ThreadedConnectionPool
+from contextlib import contextmanager
+from typing import Optional, Dict, List, Any, Iterator, Tuple
 from datetime import datetime
 import logging
 from .exceptions import DatabaseException
@@ -14,10 +20,123 @@ from .exceptions import DatabaseException
 
 logger = logging.getLogger(__name__)
 
+# Return NUMERIC columns as float instead of Decimal - prices/quantities are
+# used as floats everywhere, so this saves a float() cast per value
+DEC2FLOAT = psycopg2.extensions.new_type(
+    psycopg2.extensions.DECIMAL.values,
+    'DEC2FLOAT',
+    lambda value, cursor: float(value) if value is not None else None
+)
+psycopg2.extensions.register_type(DEC2FLOAT)
+
+
+class PreparedConnection(psycopg2.extensions.connection):
+    """Connection that remembers which statements it has PREPAREd."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.prepared = set()
+
+
+# Prepared statement names for connections that aren't PreparedConnection
+# (e.g. a plain psycopg2.connect); dropped with the connection
+_foreign_prepared: 'weakref.WeakKeyDictionary[Any, set]' = weakref.WeakKeyDictionary()
+_foreign_prepared_lock = threading.Lock()
+
+
+def _prepared_names(conn) -> set:
+    """Names already PREPAREd on conn's session."""
+    prepared = getattr(conn, 'prepared', None)
+    if prepared is not None:
+        return prepared
+    with _foreign_prepared_lock:
+        return _foreign_prepared.setdefault(conn, set())
+
 
 class Database:
     """PostgreSQL database wrapper for hedge trading bot"""
 
+    # NOTIFY channel published by OrderMonitor on every order status UPDATE
+    ORDER_STATUS_CHANNEL = 'order_status'
+
+    # Shared by upsert_order, upsert_orders_bulk and complete_partial_with_event -
+    # {source} is a VALUES list or a SELECT producing the 21 columns,
+    # {returning} the RETURNING list
+    _UPSERT_ORDER_SQL = """
+        INSERT INTO orders (
+            chunk_group_id, chunk_sequence, chunk_total, exchange, symbol,
+            side, quantity, price, order_id, status, order_type, created_at,
+            is_partial_fill_completion, partial_order_id, partial_filled_qty,
+            partial_avg_price, partial_bybit_fee_crypto, partial_coindcx_fee_usdt,
+            cumexecqty, cumexecfee, net_received
+        )
+        {source}
+        ON CONFLICT (chunk_group_id, chunk_sequence, exchange)
+        DO UPDATE SET
+            order_id = EXCLUDED.order_id,
+            price = EXCLUDED.price,
+            quantity = EXCLUDED.quantity,
+            status = EXCLUDED.status,
+            order_type = EXCLUDED.order_type,
+            is_partial_fill_completion = EXCLUDED.is_partial_fill_completion,
+            partial_order_id = EXCLUDED.partial_order_id,
+            partial_filled_qty = EXCLUDED.partial_filled_qty,
+            partial_avg_price = EXCLUDED.partial_avg_price,
+            partial_bybit_fee_crypto = EXCLUDED.partial_bybit_fee_crypto,
+            partial_coindcx_fee_usdt = EXCLUDED.partial_coindcx_fee_usdt,
+            cumexecqty = COALESCE(EXCLUDED.cumexecqty, orders.cumexecqty),
+            cumexecfee = COALESCE(EXCLUDED.cumexecfee, orders.cumexecfee),
+            net_received = COALESCE(EXCLUDED.net_received, orders.net_received),
+            updated_at = NOW()
+        RETURNING {returning}
+    """
+    # Values are bound by name from _upsert_order_params
+    _UPSERT_ORDER_ROW = """(
+            %(chunk_group_id)s, %(chunk_sequence)s, %(chunk_total)s, %(exchange)s, %(symbol)s,
+            %(side)s, %(quantity)s, %(price)s, %(order_id)s, %(status)s, %(order_type)s, NOW(),
+            %(is_partial_fill_completion)s, %(partial_order_id)s, %(partial_filled_qty)s,
+            %(partial_avg_price)s, %(partial_bybit_fee_crypto)s, %(partial_coindcx_fee_usdt)s,
+            %(cumexecqty)s, %(cumexecfee)s, %(net_received)s
+        )"""
+
+    # Row source for complete_partial_with_event: fills price/cum fields from
+    # the latest event (ev CTE), falling back to the caller's values
+    _PARTIAL_EVENT_SOURCE = """
+            SELECT %(chunk_group_id)s, %(chunk_sequence)s, %(chunk_total)s, %(exchange)s, %(symbol)s,
+                   %(side)s, %(quantity)s,
+                   COALESCE(ev.avg_price, %(price)s), %(order_id)s, %(status)s, %(order_type)s, NOW(),
+                   %(is_partial_fill_completion)s, %(partial_order_id)s, %(partial_filled_qty)s,
+                   %(partial_avg_price)s, %(partial_bybit_fee_crypto)s, %(partial_coindcx_fee_usdt)s,
+                   COALESCE(ev.cum_qty, %(cumexecqty)s), COALESCE(ev.cum_fee, %(cumexecfee)s),
+                   COALESCE(ev.cum_qty, %(cumexecqty)s) - COALESCE(ev.cum_fee, %(cumexecfee)s)
+            FROM (SELECT 1) AS one
+            LEFT JOIN ev ON TRUE
+        """
+
+    # Assembled upsert statements keyed by (kind, exchange), see _get_upsert_sql
+    _upsert_sql_cache: Dict[Tuple[str, Optional[str]], str] = {}
+
+    # Latest fill snapshot per exchange, normalised to (cum_qty, cum_fee, avg_price).
+    # Shared by complete_partial_with_event and get_latest_fill_event -
+    # {order_id} is the parameter placeholder (%s or $1)
+    _FILL_EVENT_SQL = {
+        'bybit': """
+            SELECT cum_exec_qty AS cum_qty, cum_exec_fee AS cum_fee, avg_price
+            FROM bybit_order_events
+            WHERE order_id = {order_id}
+            ORDER BY event_received_at DESC
+            LIMIT 1
+        """,
+        'coindcx': """
+            SELECT total_quantity - COALESCE(remaining_quantity, 0) AS cum_qty,
+                   fee_amount AS cum_fee, avg_price
+            FROM coindcx_order_events
+            WHERE order_id = {order_id}
+            ORDER BY event_received_at DESC
+            LIMIT 1
+        """,
+    }
+
     def __init__(
         self,
         host: str = None,
@@ -42,7 +161,12 @@ class Database:
         self.user = user or os.getenv('DB_USER', 'hedgebot')
         self.password = password or os.getenv('DB_PASSWORD', '')
 
+        # Pool sizing: peak in-flight order ops (status polls, modify, cancel+replace)
+        self.pool_min = int(os.getenv('DB_POOL_MIN', '5'))
+        self.pool_max = int(os.getenv('DB_POOL_MAX', '20'))
+
         self.conn: Optional[psycopg2.extensions.connection] = None
+        self.pool: Optional[ThreadedConnectionPool] = None
         # Don't auto-connect - let caller handle connection errors
         self._connected = False
 
@@ -54,7 +178,18 @@ class Database:
                 port=self.port,
                 database=self.database,
                 user=self.user,
-                password=self.password
+                password=self.password,
+                connection_factory=PreparedConnection
+            )
+            self.pool = ThreadedConnectionPool(
+                self.pool_min,
+                self.pool_max,
+                host=self.host,
+                port=self.port,
+                database=self.database,
+                user=self.user,
+                password=self.password,
+                connection_factory=PreparedConnection
             )
             self._connected = True
             logger.info(f"Connected to PostgreSQL database: {self.database}")
@@ -68,10 +203,150 @@ class Database:
 
     def close(self) -> None:
         """Close database connection."""
+        if self.pool:
+            self.pool.closeall()
+            self.pool = None
         if self.conn:
             self.conn.close()
             logger.info("Database connection closed")
 
+    @contextmanager
+    def cursor(self, cursor_factory=None) -> Iterator[psycopg2.extensions.cursor]:
+        """
+        Borrow a pooled connection and yield a cursor on it.
+
+        Commits when the block exits normally, rolls back on error, and
+        always returns the connection to the pool. Falls back to the
+        primary connection if the pool has not been created.
+
+        Args:
+            cursor_factory: Optional psycopg2 cursor factory (e.g. RealDictCursor)
+
+        Yields:
+            Database cursor
+        """
+        pool = self.pool
+        conn = pool.getconn() if pool else self.conn
+        try:
+            with conn.cursor(cursor_factory=cursor_factory) as cursor:
+                yield cursor
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        finally:
+            if pool:
+                pool.putconn(conn)
+
+    @staticmethod
+    def execute_prepared(
+        cursor: psycopg2.extensions.cursor,
+        name: str,
+        query: str,
+        params: tuple
+    ) -> None:
+        """
+        Execute a server-side prepared statement, preparing it on first use.
+
+        Statements are PREPAREd once per connection, so hot lookups skip
+        parsing and planning on every call.
+
+        Args:
+            cursor: Cursor from cursor() (pooled connection)
+            name: Statement name (unique per SQL text)
+            query: SQL using $1, $2, ... placeholders
+            params: Parameter values in placeholder order
+        """
+        prepared = _prepared_names(cursor.connection)
+        if name not in prepared:
+            cursor.execute(f"PREPARE {name} AS {query}")
+            prepared.add(name)
+
+        placeholders = ', '.join(['%s'] * len(params))
+        cursor.execute(f"EXECUTE {name} ({placeholders})", params)
+
+    @staticmethod
+    def execute_prepared_many(
+        cursor: psycopg2.extensions.cursor,
+        name: str,
+        query: str,
+        params_list: List[tuple]
+    ) -> None:
+        """
+        Execute a prepared statement once per parameter tuple.
+
+        Like execute_prepared, but the EXECUTEs are sent in pages
+        (execute_batch) instead of one round-trip each.
+
+        Args:
+            cursor: Cursor from cursor() (pooled connection)
+            name: Statement name (unique per SQL text)
+            query: SQL using $1, $2, ... placeholders
+            params_list: Parameter tuples, all of the same length
+        """
+        if not params_list:
+            return
+        prepared = _prepared_names(cursor.connection)
+        if name not in prepared:
+            cursor.execute(f"PREPARE {name} AS {query}")
+            prepared.add(name)
+
+        placeholders = ', '.join(['%s'] * len(params_list[0]))
+        execute_batch(cursor, f"EXECUTE {name} ({placeholders})", params_list)
+
+    def wait_for_order_status(self, order_id: str, timeout: float = 5.0) -> Optional[str]:
+        """
+        Wait for OrderMonitor to publish a status change for an order.
+
+        LISTENs on ORDER_STATUS_CHANNEL using a pooled connection. If the order
+        already has a terminal status, returns it immediately (covers updates
+        that committed before we started listening).
+
+        Args:
+            order_id: Order ID to wait for
+            timeout: Maximum seconds to wait
+
+        Returns:
+            Notified (or already terminal) status, or None on timeout
+        """
+        conn = self.pool.getconn() if self.pool else self.conn
+        old_autocommit = conn.autocommit
+        try:
+            conn.autocommit = True
+            with conn.cursor() as cursor:
+                cursor.execute(f"LISTEN {self.ORDER_STATUS_CHANNEL}")
+                cursor.execute("SELECT status FROM orders WHERE order_id = %s", (order_id,))
+                row = cursor.fetchone()
+                if row and row[0] in ('FILLED', 'CANCELLED', 'REJECTED'):
+                    return row[0]
+
+            deadline = time.monotonic() + timeout
+            prefix = f"{order_id}:"
+            while True:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return None
+                if select.select([conn], [], [], remaining) == ([], [], []):
+                    return None
+                conn.poll()
+                while conn.notifies:
+                    notify = conn.notifies.pop(0)
+                    if notify.payload.startswith(prefix):
+                        return notify.payload[len(prefix):]
+        except psycopg2.Error as e:
+            logger.warning(f"LISTEN wait for order {order_id[:12]}... failed: {e}")
+            return None
+        finally:
+            try:
+                with conn.cursor() as cursor:
+                    cursor.execute(f"UNLISTEN {self.ORDER_STATUS_CHANNEL}")
+                conn.notifies.clear()
+                conn.autocommit = old_autocommit
+            except psycopg2.Error:
+                pass
+            if self.pool:
+                self.pool.putconn(conn)
+
     def execute_query(
         self,
         query: str,
@@ -79,7 +354,7 @@ class Database:
         fetch: bool = False
     ) -> Optional[List[Dict]]:
         """
-        Execute SQL query.
+        Execute SQL query on a pooled connection.
 
         Args:
             query: SQL query string
@@ -93,16 +368,12 @@ class Database:
             DatabaseException: If query execution fails
         """
         try:
-            with self.conn.cursor(cursor_factory=RealDictCursor) as cursor:
+            # cursor() commits (even when fetching) or rolls back, then
+            # returns the connection to the pool
+            with self.cursor(cursor_factory=RealDictCursor) as cursor:
                 cursor.execute(query, params)
-                if fetch:
-                    results = cursor.fetchall()
-                    self.conn.commit()  # Commit even when fetching results
-                    return results
-                self.conn.commit()
-                return None
+                return cursor.fetchall() if fetch else None
         except psycopg2.Error as e:
-            self.conn.rollback()
             raise DatabaseException("query execution", str(e))
 
     def insert_order(
@@ -226,58 +497,12 @@ class Database:
         Raises:
             DatabaseException: If upsert fails
         """
-        # Extract partial fill details if provided
-        if is_partial_completion and partial_details:
-            partial_order_id = partial_details.get('partial_order_id')
-            partial_filled_qty = partial_details.get('partial_filled_qty')
-            partial_avg_price = partial_details.get('partial_avg_price')
-            partial_bybit_fee = partial_details.get('partial_bybit_fee_crypto')
-            partial_coindcx_fee = partial_details.get('partial_coindcx_fee_usdt')
-        else:
-            partial_order_id = None
-            partial_filled_qty = None
-            partial_avg_price = None
-            partial_bybit_fee = None
-            partial_coindcx_fee = None
-
-        # Auto-calculate net_received if cumexecqty and cumexecfee are provided
-        if net_received is None and cumexecqty is not None and cumexecfee is not None:
-            net_received = cumexecqty - cumexecfee
-
-        query = """
-            INSERT INTO orders (
-                chunk_group_id, chunk_sequence, chunk_total, exchange, symbol,
-                side, quantity, price, order_id, status, order_type, created_at,
-                is_partial_fill_completion, partial_order_id, partial_filled_qty,
-                partial_avg_price, partial_bybit_fee_crypto, partial_coindcx_fee_usdt,
-                cumexecqty, cumexecfee, net_received
-            )
-            VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, NOW(), %s, %s, %s, %s, %s, %s, %s, %s, %s)
-            ON CONFLICT (chunk_group_id, chunk_sequence, exchange)
-            DO UPDATE SET
-                order_id = EXCLUDED.order_id,
-                price = EXCLUDED.price,
-                quantity = EXCLUDED.quantity,
-                status = EXCLUDED.status,
-                order_type = EXCLUDED.order_type,
-                is_partial_fill_completion = EXCLUDED.is_partial_fill_completion,
-                partial_order_id = EXCLUDED.partial_order_id,
-                partial_filled_qty = EXCLUDED.partial_filled_qty,
-                partial_avg_price = EXCLUDED.partial_avg_price,
-                partial_bybit_fee_crypto = EXCLUDED.partial_bybit_fee_crypto,
-                partial_coindcx_fee_usdt = EXCLUDED.partial_coindcx_fee_usdt,
-                cumexecqty = COALESCE(EXCLUDED.cumexecqty, orders.cumexecqty),
-                cumexecfee = COALESCE(EXCLUDED.cumexecfee, orders.cumexecfee),
-                net_received = COALESCE(EXCLUDED.net_received, orders.net_received),
-                updated_at = NOW()
-            RETURNING id
-        """
-        params = (
-            chunk_group_id, chunk_sequence, chunk_total, exchange, symbol,
-            side, quantity, price, order_id, status, order_type,
-            is_partial_completion, partial_order_id, partial_filled_qty,
-            partial_avg_price, partial_bybit_fee, partial_coindcx_fee,
-            cumexecqty, cumexecfee, net_received
+        query = self._get_upsert_sql('single')
+        params = self._upsert_order_params(
+            chunk_group_id, chunk_sequence, exchange, symbol, side, quantity,
+            price, order_id, status, order_type, chunk_total,
+            is_partial_completion, partial_details, cumexecqty, cumexecfee,
+            net_received
         )
 
         try:
@@ -315,6 +540,232 @@ class Database:
             logger.error(f"Unexpected error during upsert for {exchange} {order_id}: {e}")
             return None
 
+    @classmethod
+    def _get_upsert_sql(cls, kind: str, exchange: Optional[str] = None) -> str:
+        """
+        Get the upsert statement for a call signature, assembling it on first use.
+
+        Args:
+            kind: 'single' (upsert_order), 'bulk' (upsert_orders_bulk) or
+                'partial' (complete_partial_with_event)
+            exchange: Exchange for 'partial' (selects the fill event query)
+
+        Returns:
+            SQL string
+        """
+        key = (kind, exchange)
+        query = cls._upsert_sql_cache.get(key)
+        if query is not None:
+            return query
+
+        if kind == 'single':
+            query = cls._UPSERT_ORDER_SQL.format(
+                source='VALUES ' + cls._UPSERT_ORDER_ROW, returning='id'
+            )
+        elif kind == 'bulk':
+            # RETURNING order is unspecified - keys map ids back to rows
+            query = cls._UPSERT_ORDER_SQL.format(
+                source='VALUES %s', returning='exchange, order_id, id'
+            )
+        elif kind == 'partial':
+            query = (
+                f"WITH ev AS ({cls._FILL_EVENT_SQL[exchange].format(order_id='%(order_id)s')}) "
+                + cls._UPSERT_ORDER_SQL.format(
+                    source=cls._PARTIAL_EVENT_SOURCE,
+                    returning='id, price, cumexecqty, cumexecfee, '
+                              'EXISTS (SELECT 1 FROM ev) AS event_found'
+                )
+            )
+        else:
+            raise ValueError(f"Unknown upsert kind: {kind}")
+
+        cls._upsert_sql_cache[key] = query
+        return query
+
+    @staticmethod
+    def _upsert_order_params(
+        chunk_group_id: str,
+        chunk_sequence: int,
+        exchange: str,
+        symbol: str,
+        side: str,
+        quantity: float,
+        price: float,
+        order_id: str,
+        status: str = 'PLACED',
+        order_type: str = 'limit',
+        chunk_total: int = None,
+        is_partial_completion: bool = False,
+        partial_details: dict = None,
+        cumexecqty: float = None,
+        cumexecfee: float = None,
+        net_received: float = None
+    ) -> Dict[str, Any]:
+        """Build the _UPSERT_ORDER_ROW parameters, keyed by column (see upsert_order for args)."""
+        # Extract partial fill details if provided
+        if is_partial_completion and partial_details:
+            partial_order_id = partial_details.get('partial_order_id')
+            partial_filled_qty = partial_details.get('partial_filled_qty')
+            partial_avg_price = partial_details.get('partial_avg_price')
+            partial_bybit_fee = partial_details.get('partial_bybit_fee_crypto')
+            partial_coindcx_fee = partial_details.get('partial_coindcx_fee_usdt')
+        else:
+            partial_order_id = None
+            partial_filled_qty = None
+            partial_avg_price = None
+            partial_bybit_fee = None
+            partial_coindcx_fee = None
+
+        # Auto-calculate net_received if cumexecqty and cumexecfee are provided
+        if net_received is None and cumexecqty is not None and cumexecfee is not None:
+            net_received = cumexecqty - cumexecfee
+
+        return {
+            'chunk_group_id': chunk_group_id,
+            'chunk_sequence': chunk_sequence,
+            'chunk_total': chunk_total,
+            'exchange': exchange,
+            'symbol': symbol,
+            'side': side,
+            'quantity': quantity,
+            'price': price,
+            'order_id': order_id,
+            'status': status,
+            'order_type': order_type,
+            'is_partial_fill_completion': is_partial_completion,
+            'partial_order_id': partial_order_id,
+            'partial_filled_qty': partial_filled_qty,
+            'partial_avg_price': partial_avg_price,
+            'partial_bybit_fee_crypto': partial_bybit_fee,
+            'partial_coindcx_fee_usdt': partial_coindcx_fee,
+            'cumexecqty': cumexecqty,
+            'cumexecfee': cumexecfee,
+            'net_received': net_received
+        }
+
+    def upsert_orders_bulk(self, rows: List[Dict[str, Any]]) -> List[int]:
+        """
+        Upsert several orders in one round-trip.
+
+        Same semantics as upsert_order, batched with execute_values into a
+        single INSERT ... ON CONFLICT statement. Rows must not share a
+        (chunk_group_id, chunk_sequence, exchange) key - Postgres cannot
+        update the same row twice in one statement.
+
+        Args:
+            rows: List of dicts with upsert_order keyword arguments
+
+        Returns:
+            Database record IDs, in the same order as rows (matched by
+            exchange and order_id, as RETURNING order is not guaranteed)
+
+        Raises:
+            DatabaseException: If upsert fails
+        """
+        if not rows:
+            return []
+
+        query = self._get_upsert_sql('bulk')
+        params = [self._upsert_order_params(**row) for row in rows]
+
+        try:
+            with self.cursor() as cursor:
+                result = execute_values(
+                    cursor, query, params,
+                    template=self._UPSERT_ORDER_ROW,
+                    page_size=500,
+                    fetch=True
+                )
+        except psycopg2.Error as e:
+            logger.error(f"Bulk upsert failed for {len(rows)} orders: {e}")
+            raise DatabaseException("bulk upsert", str(e))
+
+        ids_by_order = {(r[0], r[1]): r[2] for r in result}
+        try:
+            record_ids = [ids_by_order[(p['exchange'], p['order_id'])] for p in params]
+        except KeyError as e:
+            raise DatabaseException("bulk upsert", f"no row returned for order {e}")
+        logger.info(f"Orders upserted: {len(rows)} rows in one batch (DB IDs: {record_ids})")
+
+        return record_ids
+
+    def complete_partial_with_event(
+        self,
+        order_id: str,
+        exchange: str,
+        completion_args: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """
+        Upsert a partial-fill completion order using its latest fill event.
+
+        Reads the newest {exchange}_order_events row for order_id and writes
+        the orders row in the same statement, so fill qty/fee/price come
+        from the event log without a separate SELECT round-trip. Values in
+        completion_args (quantity, price, cumexecqty, cumexecfee) are used
+        as fallbacks when no event has arrived yet.
+
+        Args:
+            order_id: Completion (market) order ID
+            exchange: 'bybit' or 'coindcx'
+            completion_args: upsert_order keyword arguments (without
+                exchange/order_id)
+
+        Returns:
+            dict with id, price, cumexecqty, cumexecfee and event_found
+
+        Raises:
+            DatabaseException: If the upsert fails
+        """
+        exchange = exchange.lower()
+        if exchange not in self._FILL_EVENT_SQL:
+            raise ValueError(f"Unknown exchange: {exchange}")
+
+        params = self._upsert_order_params(exchange=exchange, order_id=order_id, **completion_args)
+        query = self._get_upsert_sql('partial', exchange)
+
+        try:
+            with self.cursor(cursor_factory=RealDictCursor) as cursor:
+                cursor.execute(query, params)
+                result = cursor.fetchone()
+        except psycopg2.Error as e:
+            logger.error(f"Partial completion upsert failed for {exchange} {order_id}: {e}")
+            raise DatabaseException("partial completion upsert", str(e))
+
+        logger.info(
+            f"Order upserted: {exchange} completion order_id={order_id[:8]}... "
+            f"(DB ID: {result['id']}, event_found={result['event_found']})"
+        )
+
+        return dict(result)
+
+    def get_latest_fill_event(self, order_id: str, exchange: str) -> Optional[Dict[str, Any]]:
+        """
+        Get the latest fill snapshot for an order from its exchange event table.
+
+        Args:
+            order_id: Exchange order ID
+            exchange: 'bybit' or 'coindcx'
+
+        Returns:
+            dict with cum_qty, cum_fee and avg_price, or None if no event yet
+
+        Raises:
+            ValueError: If exchange is unknown
+        """
+        exchange = exchange.lower()
+        if exchange not in self._FILL_EVENT_SQL:
+            raise ValueError(f"Unknown exchange: {exchange}")
+
+        with self.cursor(cursor_factory=RealDictCursor) as cursor:
+            self.execute_prepared(
+                cursor,
+                f'db_fill_event_{exchange}',
+                self._FILL_EVENT_SQL[exchange].format(order_id='$1'),
+                (order_id,)
+            )
+            row = cursor.fetchone()
+        return dict(row) if row else None
+
     def get_chunk_total_fees(
         self,
         chunk_group_id: str,
@@ -589,7 +1040,6 @@ class Database:
 
         try:
             self.execute_query(query, params)
-            self.conn.commit()
             logger.debug(
                 f"Lifecycle log: chunk {chunk_sequence}/{chunk_group_id[:8]}..., "
                 f"{exchange} {event_type} {order_id[:8] if order_id else 'N/A'}..."
@@ -756,6 +1206,16 @@ class Database:
                     ON order_lifecycle_log (order_id);
                 END IF;
 
+                -- Covering index for latest event per order (status checks)
+                IF NOT EXISTS (
+                    SELECT 1 FROM pg_indexes
+                    WHERE indexname = 'idx_lifecycle_order_ts'
+                ) THEN
+                    CREATE INDEX idx_lifecycle_order_ts
+                    ON order_lifecycle_log (order_id, timestamp DESC)
+                    INCLUDE (event_type);
+                END IF;
+
                 -- Index for querying by event type
                 IF NOT EXISTS (
                     SELECT 1 FROM pg_indexes
@@ -771,6 +1231,23 @@ class Database:
             END $$;
         """
 
+        # The covering event-table indexes for fill lookups are built by
+        # migrations/008 (CONCURRENTLY), not here - a plain CREATE INDEX on
+        # startup would lock the write-heavy event tables
+
+        # Event tables partitioned by migrations/007 need next months'
+        # partitions to exist before inserts reach them
+        event_partitions = """
+            DO $$
+            BEGIN
+                PERFORM create_order_event_partitions(2);
+            EXCEPTION
+                WHEN undefined_function THEN
+                    -- Event tables not partitioned, skip
+                    NULL;
+            END $$;
+        """
+
         # Add new UNIQUE constraint for chunks
         add_chunk_constraint = """
             DO $$
@@ -797,6 +1274,7 @@ class Database:
             self.execute_query(spread_table)
             self.execute_query(lifecycle_log_table)
             self.execute_query(lifecycle_log_indexes)
+            self.execute_query(event_partitions)
             self.execute_query(add_reject_reason)
             self.execute_query(add_chunk_sequence)
             self.execute_query(add_chunk_total)
@@ -3,10 +3,25 @@ Input Validation Utilities for Hedge Trading Bot
 """
 
 from datetime import datetime, timedelta
+from functools import lru_cache
 from typing import Tuple, Optional
 from .exceptions import ValidationException, PriceDataException
 
 
+@lru_cache(maxsize=64)
+def _parse_timestamp(timestamp_str: str) -> datetime:
+    """
+    Parse an ISO timestamp from the price feed.
+
+    Cached: the feed repeats the same timestamp until the next tick, so
+    repeated freshness checks skip the string parse.
+
+    Raises:
+        ValueError: If timestamp_str is not ISO format
+    """
+    return datetime.fromisoformat(timestamp_str.replace('Z', '+00:00'))
+
+
 class Validators:
     """Collection of validation functions for trading bot"""
 
@@ -79,15 +94,17 @@ class Validators:
         Returns:
             Tuple of (is_valid, warning_message)
         """
+        abs_spread = abs(spread)
+
         # Sanity check - spread should never be this high
-        if abs(spread) > sanity_check:
+        if abs_spread > sanity_check:
             return False, (
                 f"Spread {spread:.4f}% exceeds sanity limit {sanity_check}%. "
                 f"Possible price data error."
             )
 
         # Normal spread validation
-        if abs(spread) > max_spread:
+        if abs_spread > max_spread:
             return False, (
                 f"Spread {spread:.4f}% exceeds maximum {max_spread}%. "
                 f"Spread too wide for safe trading."
@@ -114,7 +131,7 @@ class Validators:
         """
         try:
             # Parse timestamp
-            price_time = datetime.fromisoformat(timestamp_str.replace('Z', '+00:00'))
+            price_time = _parse_timestamp(timestamp_str)
 
             # Calculate age
             now = datetime.now(price_time.tzinfo)
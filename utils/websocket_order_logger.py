@@ -24,13 +24,16 @@ class WebSocketOrderLogger:
     - Timestamped log files
     """
 
-    def __init__(self, log_dir: str = 'logs'):
+    def __init__(self, log_dir: str = 'logs', enabled: bool = True):
         """
         Initialize logger with timestamped log file.
 
         Args:
             log_dir: Directory for log files (default: 'logs')
+            enabled: Log WebSocket events (default: True). Can be toggled at
+                     runtime; callers check it before preparing an event.
         """
+        self.enabled = enabled
         self.log_dir = Path(log_dir)
         self.log_dir.mkdir(exist_ok=True)
 
@@ -166,6 +169,9 @@ Format: JSON lines with section headers
             order_id: Order ID (optional, extracted from message if not provided)
             status_change: Dict with 'from' and 'to' status (optional)
         """
+        if not self.enabled:
+            return
+
         # Determine event type from WebSocket data
         event_type = self._determine_event_type(exchange, websocket_message)
 